@@ -83,6 +83,12 @@ class Settings(BaseSettings):
         le=8,
         description="Maximum concurrent PDF rendering threads",
     )
+    llm_max_workers: int = Field(
+        default=4,
+        ge=1,
+        le=10,
+        description="Maximum concurrent per-document classification/extraction LLM calls",
+    )
     enable_llm_cache: bool = Field(
         default=False,
         description="Enable LLM response caching (opt-in)",
@@ -1,5 +1,8 @@
 """Document classification stage."""
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 from ...config.constants import AcademicLevel, DocumentType
 from ...config.settings import Settings
 from ...models.credential_data import CredentialData
@@ -36,6 +39,7 @@ class ClassifierStage(PipelineStage):
         if not context.extracted_texts:
             raise ClassificationError("No extracted texts for classification")
 
+        jobs: list[tuple[str, str]] = []
         for document in context.documents:
             file_path = str(document.file_path)
             extracted_text = context.get_extracted_text(file_path)
@@ -44,73 +48,72 @@ class ClassifierStage(PipelineStage):
                 self.logger.warning(f"No extracted text for {file_path}, skipping classification")
                 continue
 
-            try:
-                # Get first page image if available
-                first_page_image = context.get_first_page_image(file_path)
-
-                if first_page_image:
-                    base64_data, mime_type = first_page_image
-                    result = self.llm_service.classify_document(
-                        text=extracted_text,
-                        image_base64=base64_data,
-                        mime_type=mime_type,
-                        system_prompt=SYSTEM_PROMPT,
-                        classification_prompt=CLASSIFICATION_WITH_IMAGE_PROMPT,
+            jobs.append((file_path, extracted_text))
+
+        # Documents are classified independently, so run the LLM calls concurrently
+        # and apply the results in document order
+        max_workers = max(1, min(self.settings.llm_max_workers, len(jobs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._classify, context, file_path, extracted_text)
+                for file_path, extracted_text in jobs
+            ]
+
+            for (file_path, extracted_text), future in zip(jobs, futures):
+                try:
+                    result = future.result()
+
+                    # Parse classification result
+                    document_type = self._parse_document_type(
+                        result.get("document_type", "UNKNOWN")
+                    )
+                    academic_level = self._parse_academic_level(
+                        result.get("academic_level", "OTHER")
                     )
-                else:
-                    result = self.llm_service.classify_document(
-                        text=extracted_text,
-                        system_prompt=SYSTEM_PROMPT,
-                        classification_prompt=CLASSIFICATION_PROMPT,
+                    semester_number = result.get("semester_number")
+                    is_provisional = result.get("is_provisional", False)
+                    confidence = float(result.get("confidence", 0.5))
+
+                    # Create initial credential data with classification
+                    credential = CredentialData(
+                        source_file=file_path,
+                        document_type=document_type,
+                        academic_level=academic_level,
+                        semester_number=semester_number,
+                        is_provisional=is_provisional,
+                        confidence_score=confidence,
+                        raw_extracted_text=extracted_text,
                     )
 
-                # Parse classification result
-                document_type = self._parse_document_type(result.get("document_type", "UNKNOWN"))
-                academic_level = self._parse_academic_level(result.get("academic_level", "OTHER"))
-                semester_number = result.get("semester_number")
-                is_provisional = result.get("is_provisional", False)
-                confidence = float(result.get("confidence", 0.5))
-
-                # Create initial credential data with classification
-                credential = CredentialData(
-                    source_file=file_path,
-                    document_type=document_type,
-                    academic_level=academic_level,
-                    semester_number=semester_number,
-                    is_provisional=is_provisional,
-                    confidence_score=confidence,
-                    raw_extracted_text=extracted_text,
-                )
-
-                context.add_credential(credential)
-
-                self.logger.info(
-                    "Document classified",
-                    file_path=file_path,
-                    document_type=document_type.value,
-                    academic_level=academic_level.value,
-                    semester_number=semester_number,
-                    is_provisional=is_provisional,
-                    confidence=confidence,
-                )
-
-            except Exception as e:
-                self.logger.warning(
-                    "Classification failed for document",
-                    file_path=file_path,
-                    error=str(e),
-                )
-                context.metadata.add_error(f"Classification failed for {file_path}: {e}")
-
-                # Create credential with unknown classification
-                credential = CredentialData(
-                    source_file=file_path,
-                    document_type=DocumentType.UNKNOWN,
-                    academic_level=AcademicLevel.OTHER,
-                    confidence_score=0.0,
-                    raw_extracted_text=extracted_text,
-                )
-                context.add_credential(credential)
+                    context.add_credential(credential)
+
+                    self.logger.info(
+                        "Document classified",
+                        file_path=file_path,
+                        document_type=document_type.value,
+                        academic_level=academic_level.value,
+                        semester_number=semester_number,
+                        is_provisional=is_provisional,
+                        confidence=confidence,
+                    )
+
+                except Exception as e:
+                    self.logger.warning(
+                        "Classification failed for document",
+                        file_path=file_path,
+                        error=str(e),
+                    )
+                    context.metadata.add_error(f"Classification failed for {file_path}: {e}")
+
+                    # Create credential with unknown classification
+                    credential = CredentialData(
+                        source_file=file_path,
+                        document_type=DocumentType.UNKNOWN,
+                        academic_level=AcademicLevel.OTHER,
+                        confidence_score=0.0,
+                        raw_extracted_text=extracted_text,
+                    )
+                    context.add_credential(credential)
 
         self.logger.info(
             "Classification completed",
@@ -125,6 +128,36 @@ class ClassifierStage(PipelineStage):
 
         return context
 
+    def _classify(self, context: PipelineContext, file_path: str, extracted_text: str) -> dict[str, Any]:
+        """Run the classification LLM call for one document.
+
+        Args:
+            context: Pipeline context
+            file_path: Document file path
+            extracted_text: OCR text of the document
+
+        Returns:
+            Raw classification result from the LLM
+        """
+        # Get first page image if available
+        first_page_image = context.get_first_page_image(file_path)
+
+        if first_page_image:
+            base64_data, mime_type = first_page_image
+            return self.llm_service.classify_document(
+                text=extracted_text,
+                image_base64=base64_data,
+                mime_type=mime_type,
+                system_prompt=SYSTEM_PROMPT,
+                classification_prompt=CLASSIFICATION_WITH_IMAGE_PROMPT,
+            )
+
+        return self.llm_service.classify_document(
+            text=extracted_text,
+            system_prompt=SYSTEM_PROMPT,
+            classification_prompt=CLASSIFICATION_PROMPT,
+        )
+
     def _parse_document_type(self, type_str: str) -> DocumentType:
         """Parse document type from string.
 
@@ -1,11 +1,13 @@
 """Credential data extraction stage."""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from statistics import mean
+from typing import Any
 
 from ...config.constants import DocumentType, GradingSystem, QualificationStatus
 from ...config.settings import Settings
-from ...models.credential_data import GradeInfo, Institution
+from ...models.credential_data import CredentialData, GradeInfo, Institution
 from ...prompts.extraction import EXTRACTION_PROMPT
 from ...prompts.system import SYSTEM_PROMPT
 from ...services.llm_service import LLMService
@@ -39,6 +41,11 @@ class ExtractorStage(PipelineStage):
         if not context.credentials:
             raise ExtractionError("No credentials to extract data from")
 
+        # Format system prompt with evaluation level
+        eval_level = context.evaluation_level or "bachelors"
+        formatted_system_prompt = SYSTEM_PROMPT.format(evaluation_level=eval_level)
+
+        jobs: list[tuple[CredentialData, str]] = []
         for credential in context.credentials:
             file_path = credential.source_file
             extracted_text = context.get_extracted_text(file_path)
@@ -47,48 +54,52 @@ class ExtractorStage(PipelineStage):
                 self.logger.warning(f"No extracted text for {file_path}, skipping extraction")
                 continue
 
-            try:
-                # Format system prompt with evaluation level
-                eval_level = context.evaluation_level or "bachelors"
-                formatted_system_prompt = SYSTEM_PROMPT.format(evaluation_level=eval_level)
-
-                # Get first page image if available
-                first_page_image = context.get_first_page_image(file_path)
-
-                if first_page_image:
-                    base64_data, mime_type = first_page_image
-                    result = self.llm_service.extract_credentials(
-                        text=extracted_text,
-                        image_base64=base64_data,
-                        mime_type=mime_type,
-                        system_prompt=formatted_system_prompt,
-                        extraction_prompt=EXTRACTION_PROMPT,
-                    )
-                else:
-                    result = self.llm_service.extract_credentials(
-                        text=extracted_text,
-                        system_prompt=formatted_system_prompt,
-                        extraction_prompt=EXTRACTION_PROMPT,
-                    )
-
-                # Update credential with extracted data
-                self._update_credential(credential, result)
-
-                self.logger.info(
-                    "Credential data extracted",
-                    file_path=file_path,
-                    institution=credential.institution.name if credential.institution else None,
-                    qualification=credential.qualification_name,
-                    grade=credential.final_grade.original_value if credential.final_grade else None,
+            jobs.append((credential, extracted_text))
+
+        # Credentials are extracted independently, so run the LLM calls concurrently
+        # and apply the results in credential order
+        max_workers = max(1, min(self.settings.llm_max_workers, len(jobs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._extract,
+                    context,
+                    credential.source_file,
+                    extracted_text,
+                    formatted_system_prompt,
                 )
+                for credential, extracted_text in jobs
+            ]
 
-            except Exception as e:
-                self.logger.warning(
-                    "Extraction failed for document",
-                    file_path=file_path,
-                    error=str(e),
-                )
-                context.metadata.add_error(f"Extraction failed for {file_path}: {e}")
+            for (credential, _), future in zip(jobs, futures):
+                file_path = credential.source_file
+                try:
+                    result = future.result()
+
+                    # Update credential with extracted data
+                    self._update_credential(credential, result)
+
+                    self.logger.info(
+                        "Credential data extracted",
+                        file_path=file_path,
+                        institution=(
+                            credential.institution.name if credential.institution else None
+                        ),
+                        qualification=credential.qualification_name,
+                        grade=(
+                            credential.final_grade.original_value
+                            if credential.final_grade
+                            else None
+                        ),
+                    )
+
+                except Exception as e:
+                    self.logger.warning(
+                        "Extraction failed for document",
+                        file_path=file_path,
+                        error=str(e),
+                    )
+                    context.metadata.add_error(f"Extraction failed for {file_path}: {e}")
 
         self.logger.info(
             "Extraction completed",
@@ -101,6 +112,43 @@ class ExtractorStage(PipelineStage):
 
         return context
 
+    def _extract(
+        self,
+        context: PipelineContext,
+        file_path: str,
+        extracted_text: str,
+        system_prompt: str,
+    ) -> dict[str, Any]:
+        """Run the extraction LLM call for one document.
+
+        Args:
+            context: Pipeline context
+            file_path: Document file path
+            extracted_text: OCR text of the document
+            system_prompt: System prompt formatted for the evaluation level
+
+        Returns:
+            Raw extraction result from the LLM
+        """
+        # Get first page image if available
+        first_page_image = context.get_first_page_image(file_path)
+
+        if first_page_image:
+            base64_data, mime_type = first_page_image
+            return self.llm_service.extract_credentials(
+                text=extracted_text,
+                image_base64=base64_data,
+                mime_type=mime_type,
+                system_prompt=system_prompt,
+                extraction_prompt=EXTRACTION_PROMPT,
+            )
+
+        return self.llm_service.extract_credentials(
+            text=extracted_text,
+            system_prompt=system_prompt,
+            extraction_prompt=EXTRACTION_PROMPT,
+        )
+
     def _update_credential(self, credential, result: dict) -> None:
         """Update credential with extracted data.
 
@@ -1,9 +1,13 @@
-"""Unit tests for extractor stage grade aggregation."""
+"""Unit tests for the extractor stage."""
+
+import threading
 
 import pytest
 from unittest.mock import MagicMock
 
 from education_agent.config.settings import Settings
+from education_agent.models.credential_data import CredentialData
+from education_agent.pipeline.base import PipelineContext
 from education_agent.pipeline.stages.extractor import ExtractorStage
 
 
@@ -73,3 +77,32 @@ class TestGradeAggregation:
         )
         # Should match the percentage first
         assert result == 80.0
+
+
+class TestConcurrentExtraction:
+    """Tests for running per-document extraction calls concurrently."""
+
+    def test_documents_extracted_concurrently_in_order(self):
+        """Test LLM calls overlap and results land on the matching credential."""
+        settings = MagicMock(spec=Settings)
+        settings.llm_max_workers = 2
+        both_started = threading.Barrier(2, timeout=5)
+
+        def extract_credentials(text, **kwargs):
+            # Both calls must be in flight at once to pass the barrier
+            both_started.wait()
+            return {"student": {"name": text.upper()}}
+
+        llm_service = MagicMock()
+        llm_service.extract_credentials.side_effect = extract_credentials
+        stage = ExtractorStage(settings, llm_service=llm_service)
+
+        context = PipelineContext()
+        for path in ("a.pdf", "b.pdf"):
+            context.add_extracted_text(path, f"text {path}")
+            context.add_credential(CredentialData(source_file=path))
+
+        stage.process(context)
+
+        assert [c.student_name for c in context.credentials] == ["TEXT A.PDF", "TEXT B.PDF"]
+        assert context.metadata.errors == []
@@ -1,12 +1,17 @@
 """Application settings using Pydantic Settings."""
 
 from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import Field, SecretStr, AliasChoices
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .constants import OCRStrategy
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -72,6 +77,22 @@ class Settings(BaseSettings):
         ge=1,
         description="Maximum file size in MB",
     )
+    image_resize_filter: Literal["nearest", "bilinear", "bicubic", "lanczos"] = Field(
+        default="bilinear",
+        description="Resampling filter used when downscaling page images",
+    )
+    image_max_dimension: int = Field(
+        default=1568,
+        ge=256,
+        le=8000,
+        description="Maximum long edge in pixels for page images sent to the vision API",
+    )
+    image_jpeg_quality: int = Field(
+        default=85,
+        ge=1,
+        le=100,
+        description="JPEG quality used when encoding page images for the vision API",
+    )
     max_pdf_pages: int = Field(
         default=50,
         ge=1,
@@ -93,7 +114,57 @@ class Settings(BaseSettings):
         default=4,
         ge=1,
         le=10,
-        description="Maximum concurrent OCR API calls",
+        description=(
+            "Concurrent OCR API calls (the fixed limit unless ocr_max_workers_ceiling "
+            "is raised above it)"
+        ),
+    )
+    ocr_max_workers_ceiling: int | None = Field(
+        default=None,
+        ge=1,
+        le=10,
+        description=(
+            "Upper bound adaptive OCR concurrency may grow to while the API is not "
+            "throttling (None keeps it at ocr_max_workers)"
+        ),
+    )
+    ocr_max_rps: float = Field(
+        default=5.0,
+        gt=0.0,
+        description="Maximum OCR API requests per second",
+    )
+    ocr_native_text_threshold: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Minimum alphanumeric characters in a PDF page's text layer to use it "
+            "instead of OCR (0 always runs OCR; set e.g. 200 to opt in)"
+        ),
+    )
+    ocr_batch_size: int = Field(
+        default=0,
+        ge=0,
+        le=100,
+        description=(
+            "Pages per Anthropic Message Batches job for multi-page OCR "
+            "(0 disables; batches are cheaper but complete asynchronously)"
+        ),
+    )
+    tesseract_max_workers: int = Field(
+        default=3,
+        ge=1,
+        le=16,
+        description="Maximum concurrent tesseract processes (capped at the CPU count)",
+    )
+    ocr_breaker_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive Claude Vision failures before Auto OCR goes straight to Tesseract",
+    )
+    ocr_breaker_reset_seconds: float = Field(
+        default=60.0,
+        gt=0.0,
+        description="Seconds Auto OCR skips Claude Vision before trying it again",
     )
     pdf_render_workers: int = Field(
         default=4,
@@ -115,12 +186,26 @@ class Settings(BaseSettings):
         ge=10,
         description="Maximum number of cached LLM responses",
     )
+    ocr_cache_dir: Path | None = Field(
+        default=None,
+        description=(
+            "Directory for caching OCR results across runs, keyed by image, "
+            "model and prompt (unset disables)"
+        ),
+    )
 
     @property
     def max_file_size_bytes(self) -> int:
         """Get maximum file size in bytes."""
         return self.max_file_size_mb * 1024 * 1024
 
+    @property
+    def image_resample(self) -> "Image.Resampling":
+        """Get the PIL resampling filter for image downscaling."""
+        from PIL import Image
+
+        return Image.Resampling[self.image_resize_filter.upper()]
+
     @property
     def exchange_cache_ttl_seconds(self) -> int:
         """Get exchange cache TTL in seconds."""
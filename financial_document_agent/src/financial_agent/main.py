@@ -136,7 +136,10 @@ def main() -> int:
 
         # Process document
         logger.info("Processing document", file_path=str(file_path))
-        result = orchestrator.process(str(file_path))
+        try:
+            result = orchestrator.process(str(file_path))
+        finally:
+            orchestrator.close()
 
         # Output result
         result_json = result.model_dump_json(indent=2)
@@ -16,6 +16,10 @@ class DocumentPage(BaseModel):
     width: int = Field(..., gt=0, description="Image width in pixels")
     height: int = Field(..., gt=0, description="Image height in pixels")
     mime_type: str = Field(..., description="MIME type of the image")
+    native_text: str | None = Field(
+        default=None,
+        description="Text from the PDF text layer, if the page has one",
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
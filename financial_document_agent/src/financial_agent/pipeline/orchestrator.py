@@ -124,10 +124,6 @@ class PipelineOrchestrator:
 
             raise FinancialAgentError(f"Pipeline failed: {e}") from e
 
-        finally:
-            # Cleanup
-            self.exchange_service.close()
-
     def process_with_context(self, file_path: str) -> tuple[AnalysisResult, PipelineContext]:
         """Process a document and return both result and context.
 
@@ -181,6 +177,10 @@ class PipelineOrchestrator:
 
             raise FinancialAgentError(f"Pipeline failed: {e}") from e
 
-        finally:
-            # Cleanup
-            self.exchange_service.close()
+    def close(self) -> None:
+        """Release the shared services' network resources.
+
+        Runs may overlap on one orchestrator, so ``process`` leaves the exchange
+        client open for reuse; call this once the orchestrator is discarded.
+        """
+        self.exchange_service.close()
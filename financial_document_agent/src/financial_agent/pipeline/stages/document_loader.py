@@ -9,7 +9,7 @@ from ...config.settings import Settings
 from ...models.document import DocumentInput, DocumentPage
 from ...utils.exceptions import DocumentLoadError
 from ...utils.image_utils import encode_image_base64, image_to_bytes, resize_image_if_needed
-from ...utils.pdf_utils import pdf_to_images
+from ...utils.pdf_utils import extract_pdf_text, pdf_to_images
 from ..base import PipelineContext, PipelineStage
 
 
@@ -75,8 +75,14 @@ class DocumentLoaderStage(PipelineStage):
             from ...utils.image_utils import bytes_to_image
 
             img = bytes_to_image(first_page.image_data)
-            img = resize_image_if_needed(img)
-            base64_data, mime_type = encode_image_base64(img)
+            img = resize_image_if_needed(
+                img, self.settings.image_max_dimension, self.settings.image_resample
+            )
+            base64_data, mime_type = encode_image_base64(
+                img,
+                quality=self.settings.image_jpeg_quality,
+                max_dimension=self.settings.image_max_dimension,
+            )
             context.first_page_base64 = base64_data
             context.first_page_mime_type = mime_type
 
@@ -152,11 +158,14 @@ class DocumentLoaderStage(PipelineStage):
             List of document pages
         """
         images = pdf_to_images(file_path, max_pages=self.settings.max_pdf_pages)
+        native_texts = self._extract_native_text(file_path, len(images))
         pages = []
 
         for i, image in enumerate(images, 1):
             # Resize if needed
-            image = resize_image_if_needed(image)
+            image = resize_image_if_needed(
+                image, self.settings.image_max_dimension, self.settings.image_resample
+            )
 
             # Convert to bytes
             image_bytes = image_to_bytes(image, format="PNG")
@@ -167,11 +176,34 @@ class DocumentLoaderStage(PipelineStage):
                 width=image.width,
                 height=image.height,
                 mime_type="image/png",
+                native_text=native_texts[i - 1],
             )
             pages.append(page)
 
         return pages
 
+    def _extract_native_text(self, file_path: Path, page_count: int) -> list[str | None]:
+        """Read the PDF text layer so selectable pages can skip OCR.
+
+        Args:
+            file_path: Path to the PDF
+            page_count: Number of rendered pages
+
+        Returns:
+            Text per page, or None for every page if extraction is disabled or fails
+        """
+        if not self.settings.ocr_native_text_threshold:
+            return [None] * page_count
+
+        try:
+            texts: list[str | None] = list(extract_pdf_text(file_path, max_pages=page_count))
+        except DocumentLoadError as e:
+            self.logger.warning("PDF text layer extraction failed", error=str(e))
+            return [None] * page_count
+
+        texts.extend([None] * (page_count - len(texts)))
+        return texts
+
     def _load_image_page(self, file_path: Path, file_type: FileType) -> list[DocumentPage]:
         """Load a single image file as a page.
 
@@ -190,7 +222,9 @@ class DocumentLoaderStage(PipelineStage):
                 image = image.convert("RGB")
 
             # Resize if needed
-            image = resize_image_if_needed(image)
+            image = resize_image_if_needed(
+                image, self.settings.image_max_dimension, self.settings.image_resample
+            )
 
             # Determine format and mime type
             if file_type in (FileType.JPEG, FileType.JPG):
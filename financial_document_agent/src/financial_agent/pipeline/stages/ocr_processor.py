@@ -2,7 +2,7 @@
 
 from ...config.settings import Settings
 from ...services.llm_service import LLMService
-from ...services.ocr_service import create_ocr_service
+from ...services.ocr_service import create_ocr_service, join_pages
 from ...utils.exceptions import OCRError
 from ..base import PipelineContext, PipelineStage
 
@@ -37,21 +37,32 @@ class OCRProcessorStage(PipelineStage):
         if not context.document.pages:
             raise OCRError("Document has no pages")
 
-        # Prepare images for OCR
-        images = [
-            (page.image_data, page.mime_type)
-            for page in context.document.pages
+        pages = context.document.pages
+
+        # Use the PDF text layer where it is rich enough; OCR only the rest
+        texts: list[str] = [page.native_text or "" for page in pages]
+        ocr_indices = [
+            i for i, page in enumerate(pages) if not self._has_usable_text(page.native_text)
         ]
 
-        # Extract text from all pages
-        extracted_text = self.ocr_service.extract_text_from_multiple(images)
+        if ocr_indices:
+            images = [(pages[i].image_data, pages[i].mime_type) for i in ocr_indices]
+            for i, text in zip(
+                ocr_indices, self.ocr_service.extract_pages(images), strict=True
+            ):
+                texts[i] = text
+
+        extracted_text = join_pages(texts)
+        native_pages = len(pages) - len(ocr_indices)
 
         context.extracted_text = extracted_text
         context.metadata.ocr_method_used = self.settings.ocr_strategy.value
 
         self.logger.info(
             "OCR completed",
-            page_count=len(images),
+            page_count=len(pages),
+            ocr_pages=len(ocr_indices),
+            native_text_pages=native_pages,
             text_length=len(extracted_text),
             ocr_method=self.settings.ocr_strategy.value,
         )
@@ -59,6 +70,22 @@ class OCRProcessorStage(PipelineStage):
         context.set_stage_result(self.name, {
             "text_length": len(extracted_text),
             "ocr_method": self.settings.ocr_strategy.value,
+            "ocr_pages": len(ocr_indices),
+            "native_text_pages": native_pages,
         })
 
         return context
+
+    def _has_usable_text(self, text: str | None) -> bool:
+        """Check whether a page's text layer is rich enough to skip OCR.
+
+        Args:
+            text: Native text of the page, if any
+
+        Returns:
+            True if the text has at least the configured number of alphanumerics
+        """
+        threshold = self.settings.ocr_native_text_threshold
+        if not threshold or not text:
+            return False
+        return sum(c.isalnum() for c in text) >= threshold
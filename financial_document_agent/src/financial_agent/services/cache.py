@@ -1,31 +1,68 @@
 """Thread-safe LRU cache with TTL for LLM responses."""
 
 import hashlib
+import heapq
+import os
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Threads used to hash several pages at once; hashlib releases the GIL while
+# hashing large buffers, so pages are hashed truly in parallel
+KEY_HASH_WORKERS = min(8, os.cpu_count() or 1)
 
-@dataclass
+# Stripes the cache is split into, each with its own lock and LRU order
+MAX_SHARDS = 16
+# Minimum entries per stripe; smaller caches use fewer stripes so LRU stays
+# close to global order
+MIN_SHARD_SIZE = 16
+
+# Expired entries reclaimed per set(); cleanup_expired() drains the rest
+EXPIRE_BATCH_SIZE = 8
+
+# Digest bytes for persistent keys, and for in-memory keys where 128 bits
+# of collision resistance is plenty and halves the key size
+KEY_DIGEST_SIZE = 32
+SHORT_KEY_DIGEST_SIZE = 16
+
+# Separates the key fields so ("ab", "c") and ("a", "bc") hash differently
+_KEY_FIELD_SEPARATOR = b"\x1f"
+
+# Per-operation debug logging on get/set; off by default because even filtered
+# structlog calls build their event dict on every cache hit
+_DEBUG_CACHE = False
+
+
+@dataclass(slots=True)
 class CacheEntry:
-    """A single cache entry with value and expiration time."""
+    """A single cache entry with value, expiration time and hit count."""
 
     value: str
-    expires_at: float
+    expires_at: int  # deadline on the cache's nanosecond clock
+    hits: int = 0
+
+    @property
+    def score(self) -> int:
+        """Value of keeping this entry: bytes saved per hit times observed hits."""
+        return len(self.value) * self.hits
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheStats:
     """Statistics for cache performance monitoring."""
 
     hits: int = 0
     misses: int = 0
     evictions: int = 0
+    rejections: int = 0
 
     @property
     def hit_rate(self) -> float:
@@ -34,28 +71,77 @@ class CacheStats:
         return self.hits / total if total > 0 else 0.0
 
 
+@dataclass(slots=True)
+class _CacheShard:
+    """One stripe of the cache: entries in recency order, their lock, expiry heap and stats."""
+
+    max_size: int
+    entries: OrderedDict[str, CacheEntry]
+    lock: threading.Lock
+    # (expires_at, key) min-heap; items go stale when a key is replaced or evicted
+    expiry_heap: list[tuple[int, str]] = field(default_factory=list)
+    # Counters for this shard, updated under its lock
+    stats: CacheStats = field(default_factory=CacheStats)
+
+
+@lru_cache(maxsize=32)
+def _prefix_hasher(
+    model: str, prompt: str, digest_size: int = KEY_DIGEST_SIZE
+) -> "hashlib.blake2b":
+    """Get a hash state that has absorbed the (model, prompt) key prefix.
+
+    Callers must ``copy()`` the result rather than update it.
+    """
+    # BLAKE2b is in the stdlib and hashes faster than SHA-256 in software;
+    # a 32-byte digest keeps keys at 64 hex characters
+    hasher = hashlib.blake2b(digest_size=digest_size)
+    hasher.update(model.encode("utf-8"))
+    hasher.update(_KEY_FIELD_SEPARATOR)
+    hasher.update(prompt.encode("utf-8"))
+    hasher.update(_KEY_FIELD_SEPARATOR)
+    return hasher
+
+
 class LLMCache:
     """Thread-safe LRU cache with TTL for LLM responses.
 
-    Uses SHA-256 hashing for cache keys derived from image bytes, model, and prompt.
+    Uses BLAKE2b-256 hashing for cache keys derived from image bytes, model, and prompt.
+    Entries live in an OrderedDict kept in recency order: a hit is a single
+    ``move_to_end`` and the eviction victim is always the first entry. A lookup
+    holds its shard lock once, for the read, the reorder and the counters.
+    Larger caches are striped into up to MAX_SHARDS shards by key hash, each
+    with its own lock and capacity, so concurrent writers rarely contend; LRU
+    order is then kept per shard.
+
+    Admission is value-aware: when full, a new entry only displaces the eviction
+    victim if its size is at least the victim's score (size x hits), so a one-off
+    response cannot push out a frequently reused one.
     """
 
     def __init__(
         self,
         max_size: int = 100,
         ttl_seconds: int = 3600,
+        *,
+        clock: Callable[[], int] = time.monotonic_ns,
     ) -> None:
         """Initialize the LLM cache.
 
         Args:
             max_size: Maximum number of entries to cache
             ttl_seconds: Time-to-live for cache entries in seconds
+            clock: Monotonic clock in nanoseconds (injectable for tests)
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = threading.Lock()
-        self._stats = CacheStats()
+        self._clock = clock
+        self._ttl_ns = ttl_seconds * 1_000_000_000
+        shard_count = max(1, min(MAX_SHARDS, max_size // MIN_SHARD_SIZE))
+        base, extra = divmod(max_size, shard_count)
+        self._shards = [
+            _CacheShard(base + (i < extra), OrderedDict(), threading.Lock())
+            for i in range(shard_count)
+        ]
 
     @staticmethod
     def generate_key(
@@ -71,13 +157,75 @@ class LLMCache:
             prompt: Prompt used for extraction
 
         Returns:
-            SHA-256 hash as hex string
+            BLAKE2b-256 hash as a 64-character hex string
+        """
+        return LLMCache.make_keyer(model, prompt)(image_bytes)
+
+    @staticmethod
+    def generate_key_short(
+        image_bytes: bytes,
+        model: str,
+        prompt: str,
+    ) -> str:
+        """Generate a compact cache key for in-memory use.
+
+        Not interchangeable with ``generate_key``; use it only for caches that
+        do not outlive the process.
+
+        Args:
+            image_bytes: Raw image bytes
+            model: LLM model name
+            prompt: Prompt used for extraction
+
+        Returns:
+            BLAKE2b-128 hash as a 32-character hex string
+        """
+        return LLMCache.make_keyer(model, prompt, short=True)(image_bytes)
+
+    @staticmethod
+    def make_keyer(model: str, prompt: str, *, short: bool = False) -> Callable[[bytes], str]:
+        """Build a key function for a fixed model and prompt.
+
+        The model and prompt are hashed once; each key then copies that hash
+        state and only hashes the image bytes.
+
+        Args:
+            model: LLM model name
+            prompt: Prompt used for extraction
+            short: Produce ``generate_key_short`` keys instead
+
+        Returns:
+            Function mapping image bytes to the same key as ``generate_key``
+            (or ``generate_key_short``)
+        """
+        prefix = _prefix_hasher(model, prompt, SHORT_KEY_DIGEST_SIZE if short else KEY_DIGEST_SIZE)
+
+        def keyer(image_bytes: bytes) -> str:
+            hasher = prefix.copy()
+            hasher.update(image_bytes)
+            return hasher.hexdigest()
+
+        return keyer
+
+    @staticmethod
+    def generate_keys_batch(items: list[tuple[bytes, str, str]]) -> list[str]:
+        """Generate cache keys for several pages at once.
+
+        Args:
+            items: List of (image_bytes, model, prompt) tuples
+
+        Returns:
+            Keys in input order, identical to ``generate_key`` for each item
         """
-        hasher = hashlib.sha256()
-        hasher.update(image_bytes)
-        hasher.update(model.encode("utf-8"))
-        hasher.update(prompt.encode("utf-8"))
-        return hasher.hexdigest()
+        if len(items) < 2 or KEY_HASH_WORKERS < 2:
+            return [LLMCache.generate_key(*item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(KEY_HASH_WORKERS, len(items))) as executor:
+            return list(executor.map(lambda item: LLMCache.generate_key(*item), items))
+
+    def _shard(self, key: str) -> _CacheShard:
+        """Get the shard responsible for a key."""
+        return self._shards[hash(key) % len(self._shards)]
 
     def get(self, key: str) -> str | None:
         """Get a value from the cache.
@@ -88,26 +236,33 @@ class LLMCache:
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        with self._lock:
-            entry = self._cache.get(key)
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
 
             if entry is None:
-                self._stats.misses += 1
+                shard.stats.misses += 1
                 return None
 
             # Check if expired
-            if time.time() > entry.expires_at:
-                # Remove expired entry
-                del self._cache[key]
-                self._stats.misses += 1
+            if self._clock() > entry.expires_at:
+                del shard.entries[key]
+                shard.stats.misses += 1
+                expired = True
+            else:
+                shard.entries.move_to_end(key)
+                entry.hits += 1
+                shard.stats.hits += 1
+                expired = False
+
+        if expired:
+            if _DEBUG_CACHE:
                 logger.debug("Cache entry expired", key=key[:16])
-                return None
+            return None
 
-            # Move to end (most recently used)
-            self._cache.move_to_end(key)
-            self._stats.hits += 1
+        if _DEBUG_CACHE:
             logger.debug("Cache hit", key=key[:16])
-            return entry.value
+        return entry.value
 
     def set(self, key: str, value: str) -> None:
         """Store a value in the cache.
@@ -116,35 +271,51 @@ class LLMCache:
             key: Cache key
             value: Value to cache
         """
-        with self._lock:
-            # If key exists, update and move to end
-            if key in self._cache:
-                self._cache[key] = CacheEntry(
-                    value=value,
-                    expires_at=time.time() + self.ttl_seconds,
-                )
-                self._cache.move_to_end(key)
+        now = self._clock()
+        entry = CacheEntry(value=value, expires_at=now + self._ttl_ns)
+
+        shard = self._shard(key)
+        with shard.lock:
+            # Reclaim a few expired entries so cleanup cost is spread over writes
+            self._expire(shard, now, EXPIRE_BATCH_SIZE)
+
+            entries = shard.entries
+            # If key exists, update in place and mark it most recently used
+            if key in entries:
+                entries[key] = entry
+                entries.move_to_end(key)
+                heapq.heappush(shard.expiry_heap, (entry.expires_at, key))
                 return
 
-            # Evict oldest entries if at capacity
-            while len(self._cache) >= self.max_size:
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                self._stats.evictions += 1
-                logger.debug("Cache eviction (LRU)", evicted_key=oldest_key[:16])
+            # Reject the new entry if it is worth less than the entry it would displace
+            if len(entries) >= shard.max_size:
+                victim = next(iter(entries.values()))
+                if len(value) < victim.score:
+                    shard.stats.rejections += 1
+                    if _DEBUG_CACHE:
+                        logger.debug("Cache admission rejected", key=key[:16])
+                    return
+
+            # Evict least recently used entries if at capacity
+            while len(entries) >= shard.max_size:
+                victim_key, _ = entries.popitem(last=False)
+                shard.stats.evictions += 1
+                if _DEBUG_CACHE:
+                    logger.debug("Cache eviction (LRU)", evicted_key=victim_key[:16])
 
             # Add new entry
-            self._cache[key] = CacheEntry(
-                value=value,
-                expires_at=time.time() + self.ttl_seconds,
-            )
-            logger.debug("Cache set", key=key[:16])
+            entries[key] = entry
+            heapq.heappush(shard.expiry_heap, (entry.expires_at, key))
+            if _DEBUG_CACHE:
+                logger.debug("Cache set", key=key[:16])
 
     def clear(self) -> None:
         """Clear all entries from the cache."""
-        with self._lock:
-            self._cache.clear()
-            logger.info("Cache cleared")
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.expiry_heap.clear()
+        logger.info("Cache cleared")
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries from the cache.
@@ -153,33 +324,71 @@ class LLMCache:
             Number of entries removed
         """
         removed = 0
-        current_time = time.time()
-
-        with self._lock:
-            expired_keys = [
-                key
-                for key, entry in self._cache.items()
-                if current_time > entry.expires_at
-            ]
-            for key in expired_keys:
-                del self._cache[key]
-                removed += 1
+        now = self._clock()
+
+        for shard in self._shards:
+            with shard.lock:
+                removed += self._expire(shard, now)
 
         if removed > 0:
             logger.debug("Expired entries cleaned up", count=removed)
 
         return removed
 
+    @staticmethod
+    def _expire(shard: _CacheShard, now: int, limit: int | None = None) -> int:
+        """Remove expired entries from a shard, soonest deadline first.
+
+        Must be called with the shard lock held. Costs O(expired), not O(size).
+
+        Args:
+            shard: Shard to clean
+            now: Current clock reading in nanoseconds
+            limit: Maximum heap items to pop (None drains every expired item)
+
+        Returns:
+            Number of entries removed
+        """
+        heap = shard.expiry_heap
+        removed = 0
+        popped = 0
+        while heap and heap[0][0] < now and (limit is None or popped < limit):
+            expires_at, key = heapq.heappop(heap)
+            popped += 1
+            entry = shard.entries.get(key)
+            # Skip stale heap items for keys replaced or evicted since
+            if entry is not None and entry.expires_at == expires_at:
+                del shard.entries[key]
+                removed += 1
+
+        # Stale items from replaced/evicted keys would otherwise pile up until
+        # their deadlines pass
+        if len(heap) > 2 * max(shard.max_size, len(shard.entries)):
+            shard.expiry_heap = [(e.expires_at, k) for k, e in shard.entries.items()]
+            heapq.heapify(shard.expiry_heap)
+
+        return removed
+
     @property
     def stats(self) -> CacheStats:
-        """Get cache statistics."""
-        return self._stats
+        """Get cache statistics, summed over the shards.
+
+        Returns:
+            Snapshot of the counters at the time of the call
+        """
+        total = CacheStats()
+        for shard in self._shards:
+            with shard.lock:
+                total.hits += shard.stats.hits
+                total.misses += shard.stats.misses
+                total.evictions += shard.stats.evictions
+                total.rejections += shard.stats.rejections
+        return total
 
     @property
     def size(self) -> int:
         """Get current number of entries in cache."""
-        with self._lock:
-            return len(self._cache)
+        return sum(len(shard.entries) for shard in self._shards)
 
     def __len__(self) -> int:
         """Return the number of entries in the cache."""
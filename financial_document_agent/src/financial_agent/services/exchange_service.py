@@ -1,6 +1,9 @@
 """Exchange rate service using Frankfurter API."""
 
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future
 from typing import Any
 
 import httpx
@@ -17,13 +20,21 @@ logger = structlog.get_logger(__name__)
 class ExchangeRateCache:
     """Simple in-memory cache for exchange rates."""
 
-    def __init__(self, ttl_seconds: int) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize the cache.
 
         Args:
             ttl_seconds: Time-to-live for cached entries
+            clock: Monotonic clock in seconds (injectable for tests)
         """
         self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # base currency -> (clock deadline, rates)
         self._cache: dict[str, tuple[float, dict[str, float]]] = {}
 
     def get(self, base_currency: str) -> dict[str, float] | None:
@@ -35,12 +46,13 @@ class ExchangeRateCache:
         Returns:
             Cached rates or None if expired/not found
         """
-        if base_currency not in self._cache:
+        entry = self._cache.get(base_currency)
+        if entry is None:
             return None
 
-        timestamp, rates = self._cache[base_currency]
-        if time.time() - timestamp > self.ttl_seconds:
-            del self._cache[base_currency]
+        expires_at, rates = entry
+        if self._clock() > expires_at:
+            self._cache.pop(base_currency, None)
             return None
 
         return rates
@@ -52,7 +64,7 @@ class ExchangeRateCache:
             base_currency: Base currency code
             rates: Exchange rates
         """
-        self._cache[base_currency] = (time.time(), rates)
+        self._cache[base_currency] = (self._clock() + self.ttl_seconds, rates)
 
     def clear(self) -> None:
         """Clear all cached entries."""
@@ -72,19 +84,29 @@ class ExchangeService:
         self.api_url = settings.exchange_api_url
         self.cache = ExchangeRateCache(settings.exchange_cache_ttl_seconds)
         self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        # In-flight fetches per base currency, so concurrent callers share one request
+        self._inflight: dict[str, Future[dict[str, float]]] = {}
+        self._inflight_lock = threading.Lock()
 
     @property
     def client(self) -> httpx.Client:
         """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.Client(timeout=30.0)
-        return self._client
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(timeout=30.0)
+            return self._client
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None:
-            self._client.close()
-            self._client = None
+        """Close the HTTP client.
+
+        A later request opens a new client, so a fetch that loses a race with
+        ``close`` fails once and succeeds on its retry.
+        """
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
 
     @retry(
         stop=stop_after_attempt(3),
@@ -128,6 +150,44 @@ class ExchangeService:
             logger.error("Failed to fetch exchange rates", error=str(e))
             raise CurrencyConversionError(f"Failed to fetch exchange rates: {e}") from e
 
+    def _get_rates(self, base_currency: str) -> dict[str, float]:
+        """Get rates for a base currency, coalescing concurrent fetches.
+
+        Args:
+            base_currency: Base currency code
+
+        Returns:
+            Dictionary of currency codes to rates
+
+        Raises:
+            CurrencyConversionError: If fetch fails
+        """
+        cached_rates = self.cache.get(base_currency)
+        if cached_rates:
+            return cached_rates
+
+        with self._inflight_lock:
+            future = self._inflight.get(base_currency)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[base_currency] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            rates = self._fetch_rates(base_currency)
+            self.cache.set(base_currency, rates)
+            future.set_result(rates)
+            return rates
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[base_currency]
+
     def get_rate(
         self,
         from_currency: str,
@@ -153,21 +213,19 @@ class ExchangeService:
         if from_currency == to_currency:
             return 1.0
 
-        # Check cache first
-        cached_rates = self.cache.get(from_currency)
-        if cached_rates and to_currency in cached_rates:
-            return cached_rates[to_currency]
-
         try:
-            rates = self._fetch_rates(from_currency)
-            self.cache.set(from_currency, rates)
+            # Rates are fetched (or served from cache) per target currency and
+            # inverted, so every source converting to the same target shares one
+            # API call. Frankfurter quotes reference cross rates for any base, so
+            # the inverse matches a direct quote up to the API's rounding.
+            rates = self._get_rates(to_currency)
 
-            if to_currency not in rates:
+            if not rates.get(from_currency):
                 raise CurrencyConversionError(
                     f"No rate available for {from_currency} -> {to_currency}"
                 )
 
-            return rates[to_currency]
+            return 1.0 / rates[from_currency]
 
         except CurrencyConversionError:
             if not use_fallback:
@@ -1,21 +1,128 @@
 """LLM service for Anthropic Claude API interactions."""
 
 import json
+import re
+import time
+from functools import cache, lru_cache
 from typing import Any, TypeVar
 
-from anthropic import Anthropic
+import httpx
+from anthropic import Anthropic, DefaultHttpxClient
 import structlog
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..config.settings import Settings
 from ..utils.exceptions import LLMError
+from ..utils.retry import retry_on_rate_limit
 from .cache import LLMCache
 
 logger = structlog.get_logger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Default instruction for OCR text extraction
+DEFAULT_OCR_PROMPT = (
+    "Extract all text from this financial document image. "
+    "Preserve the structure and formatting as much as possible. "
+    "Include all numbers, dates, account information, and amounts. "
+    "If there are tables, represent them in a clear format."
+)
+
+# SDK-level retries for calls no tenacity policy wraps (batch jobs, warmup);
+# the SDK default, kept so one transient 5xx/429 does not fail a whole job
+SDK_MAX_RETRIES = 2
+
+# Polling cadence and deadline for Message Batches API jobs
+BATCH_POLL_INTERVAL_SECONDS = 5.0
+BATCH_TIMEOUT_SECONDS = 900.0
+
+# Opening bracket and a pattern matching either bracket of the pair, used to
+# jump between brackets in C instead of walking every character in Python
+_JSON_BRACKETS = (
+    ("{", re.compile(r"[{}]")),
+    ("[", re.compile(r"[\[\]]")),
+)
+
+# Shared retry policy for analysis and classification calls
+_LLM_RETRY = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    reraise=True,
+)
+
+
+@cache
+def _shared_http_client(max_connections: int) -> httpx.Client:
+    """Get the process-wide keep-alive HTTP client for Anthropic calls.
+
+    Sharing one pool lets every LLMService (and every OCR thread) reuse warm
+    TLS connections instead of handshaking per instance.
+
+    Args:
+        max_connections: Maximum open connections in the pool
+
+    Returns:
+        Shared HTTP client
+    """
+    return DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+    )
+
+
+@lru_cache(maxsize=32)
+def _structured_output_prompt(response_model: type[BaseModel]) -> str:
+    """Build the schema instructions for a response model.
+
+    Generating and serializing the JSON schema is far costlier than the call
+    site suggests, and the result only depends on the model class.
+
+    Args:
+        response_model: Pydantic model the response must match
+
+    Returns:
+        Prompt text embedding the model's JSON schema
+    """
+    schema = response_model.model_json_schema()
+    return f"""
+Analyze the provided content and extract information according to this JSON schema:
+
+{json.dumps(schema, indent=2)}
+
+Return ONLY valid JSON that matches this schema. Do not include any other text or explanation.
+"""
+
+
+def _normalize_block(block: dict[str, Any]) -> dict[str, Any]:
+    """Return a content block in Anthropic message shape.
+
+    Blocks that are already well-formed are passed through without copying.
+
+    Args:
+        block: Content block supplied by the caller
+
+    Returns:
+        Content block suitable for the messages API
+    """
+    if block["type"] != "image":
+        return block
+
+    source = block["source"]
+    if source.get("type") == "base64":
+        return block
+
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": source["media_type"],
+            "data": source["data"],
+        },
+    }
+
 
 class LLMService:
     """Service for interacting with Anthropic Claude API."""
@@ -31,11 +138,21 @@ class LLMService:
         # Bypass Pydantic settings and use os.environ directly like test.py
         api_key = os.environ.get("ANTHROPIC_API_KEY", "").strip().strip('"').strip("'")
  
-        self.client = Anthropic(api_key=api_key)
+        # Retries are handled by our own policies, so the SDK must not retry too;
+        # calls outside those policies opt back in with SDK_MAX_RETRIES
+        self.client = Anthropic(
+            api_key=api_key,
+            http_client=_shared_http_client(
+                (settings.ocr_max_workers_ceiling or settings.ocr_max_workers) * 2
+            ),
+            max_retries=0,
+        )
         self.model = settings.llm_model
         self.max_tokens = settings.llm_max_tokens
         self.temperature = settings.llm_temperature
 
+        self._warmed_up = False
+
         # Initialize cache if enabled
         self._cache: LLMCache | None = None
         if settings.enable_llm_cache:
@@ -49,11 +166,26 @@ class LLMService:
                 ttl_minutes=settings.llm_cache_ttl_minutes,
             )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    def warmup(self) -> None:
+        """Open a connection to the API ahead of a burst of requests.
+
+        Sends a free token-counting request so DNS lookup and the TLS handshake
+        happen before parallel OCR starts. Best-effort: failures are logged and
+        ignored, and only the first call per service does any work.
+        """
+        if self._warmed_up:
+            return
+        self._warmed_up = True
+
+        try:
+            self.client.with_options(max_retries=SDK_MAX_RETRIES).messages.count_tokens(
+                model=self.model,
+                messages=[{"role": "user", "content": "ping"}],
+            )
+        except Exception as e:
+            logger.warning("Anthropic API warmup failed", error=str(e))
+
+    @retry_on_rate_limit(max_attempts=3, min_wait=1.0, max_wait=30.0)
     def extract_text_from_image(
         self,
         image_base64: str,
@@ -76,17 +208,12 @@ class LLMService:
             LLMError: If extraction fails
         """
         if prompt is None:
-            prompt = (
-                "Extract all text from this financial document image. "
-                "Preserve the structure and formatting as much as possible. "
-                "Include all numbers, dates, account information, and amounts. "
-                "If there are tables, represent them in a clear format."
-            )
+            prompt = DEFAULT_OCR_PROMPT
 
         # Check cache if enabled and image_bytes provided
         cache_key: str | None = None
         if self._cache is not None and image_bytes is not None:
-            cache_key = LLMCache.generate_key(image_bytes, self.model, prompt)
+            cache_key = LLMCache.generate_key_short(image_bytes, self.model, prompt)
             cached_result = self._cache.get(cache_key)
             if cached_result is not None:
                 logger.debug("Using cached OCR result")
@@ -98,25 +225,7 @@ class LLMService:
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": mime_type,
-                                    "data": image_base64,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt,
-                            },
-                        ],
-                    }
-                ],
+                messages=self._vision_messages(image_base64, mime_type, prompt),
             )
 
             result = response.content[0].text if response.content else ""
@@ -131,11 +240,104 @@ class LLMService:
             logger.error("Anthropic API error during text extraction", error=str(e))
             raise LLMError(f"Failed to extract text from image: {e}") from e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    def extract_text_from_images_batch(
+        self,
+        images: list[tuple[str, str]],
+        prompt: str | None = None,
+    ) -> list[str | None]:
+        """Extract text from several images with one Message Batches API job.
+
+        Batches are billed at a discount but complete asynchronously, so this
+        trades latency for cost and is meant for large, non-interactive runs.
+
+        Args:
+            images: List of (image_base64, mime_type) tuples
+            prompt: Optional custom prompt for extraction
+
+        Returns:
+            Extracted text per image, in input order (None where a request failed)
+
+        Raises:
+            LLMError: If the batch cannot be submitted or does not finish in time
+        """
+        if prompt is None:
+            prompt = DEFAULT_OCR_PROMPT
+
+        requests = [
+            {
+                "custom_id": str(i),
+                "params": {
+                    "model": self.model,
+                    "max_tokens": self.max_tokens,
+                    "temperature": self.temperature,
+                    "messages": self._vision_messages(image_base64, mime_type, prompt),
+                },
+            }
+            for i, (image_base64, mime_type) in enumerate(images)
+        ]
+
+        # A job polls for up to BATCH_TIMEOUT_SECONDS, so ride out transient errors
+        batches = self.client.with_options(max_retries=SDK_MAX_RETRIES).messages.batches
+
+        try:
+            batch = batches.create(requests=requests)
+            deadline = time.monotonic() + BATCH_TIMEOUT_SECONDS
+            while batch.processing_status != "ended":
+                if time.monotonic() > deadline:
+                    batches.cancel(batch.id)
+                    raise LLMError(f"Batch {batch.id} did not finish in time")
+                time.sleep(BATCH_POLL_INTERVAL_SECONDS)
+                batch = batches.retrieve(batch.id)
+
+            results: list[str | None] = [None] * len(images)
+            for entry in batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    continue
+                message = entry.result.message
+                results[int(entry.custom_id)] = message.content[0].text if message.content else ""
+
+            logger.info(
+                "Batch text extraction completed",
+                batch_id=batch.id,
+                total=len(images),
+                failed=results.count(None),
+            )
+            return results
+
+        except LLMError:
+            raise
+        except Exception as e:
+            logger.error("Anthropic API error during batch text extraction", error=str(e))
+            raise LLMError(f"Failed to extract text from image batch: {e}") from e
+
+    @staticmethod
+    def _vision_messages(
+        image_base64: str,
+        mime_type: str,
+        prompt: str,
+    ) -> list[dict[str, Any]]:
+        """Build the user message for a single-image vision request."""
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": mime_type,
+                            "data": image_base64,
+                        },
+                    },
+                    {
+                        "type": "text",
+                        "text": prompt,
+                    },
+                ],
+            }
+        ]
+
+    @_LLM_RETRY
     def analyze_with_structured_output(
         self,
         content: str | list[dict[str, Any]],
@@ -155,36 +357,13 @@ class LLMService:
         Raises:
             LLMError: If analysis fails
         """
-        # Build the JSON schema from the Pydantic model
-        schema = response_model.model_json_schema()
-
-        extraction_prompt = f"""
-Analyze the provided content and extract information according to this JSON schema:
-
-{json.dumps(schema, indent=2)}
-
-Return ONLY valid JSON that matches this schema. Do not include any other text or explanation.
-"""
+        extraction_prompt = _structured_output_prompt(response_model)
 
         # Build messages content
-        user_content = []
         if isinstance(content, str):
-            user_content.append({"type": "text", "text": content})
+            user_content = [{"type": "text", "text": content}]
         else:
-            for block in content:
-                if block["type"] == "image":
-                    source = block["source"]
-                    user_content.append({
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": source['media_type'],
-                            "data": source['data'],
-                        },
-                    })
-                else:
-                    user_content.append(block)
-        
+            user_content = [_normalize_block(block) for block in content]
         user_content.append({"type": "text", "text": extraction_prompt})
 
         try:
@@ -200,24 +379,22 @@ Return ONLY valid JSON that matches this schema. Do not include any other text o
 
             response_text = response.content[0].text if response.content else ""
 
-            # Try to extract JSON from the response
+            # Try to extract JSON from the response; pydantic-core parses and
+            # validates it in one pass without building an intermediate dict
             json_str = self._extract_json(response_text)
-            data = json.loads(json_str)
-
-            return response_model.model_validate(data)
+            return response_model.model_validate_json(json_str)
 
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse JSON response", error=str(e), response=response_text if 'response_text' in locals() else "N/A")
+        except ValidationError as e:
+            if not any(err["type"] == "json_invalid" for err in e.errors()):
+                logger.error("Anthropic API error during analysis", error=str(e))
+                raise LLMError(f"Failed to analyze content: {e}") from e
+            logger.error("Failed to parse JSON response", error=str(e), response=response_text)
             raise LLMError(f"Failed to parse structured response: {e}") from e
         except Exception as e:
             logger.error("Anthropic API error during analysis", error=str(e))
             raise LLMError(f"Failed to analyze content: {e}") from e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @_LLM_RETRY
     def classify_document(
         self,
         text: str,
@@ -304,18 +481,15 @@ Return ONLY valid JSON that matches this schema. Do not include any other text o
                 return text[start:end].strip()
 
         # Try to find JSON object or array
-        for start_char, end_char in [("{", "}"), ("[", "]")]:
+        for start_char, bracket_pattern in _JSON_BRACKETS:
             start = text.find(start_char)
             if start != -1:
-                # Find matching end
+                # Find matching end, visiting only bracket characters
                 depth = 0
-                for i, char in enumerate(text[start:], start):
-                    if char == start_char:
-                        depth += 1
-                    elif char == end_char:
-                        depth -= 1
-                        if depth == 0:
-                            return text[start : i + 1]
+                for match in bracket_pattern.finditer(text, start):
+                    depth += 1 if match.group() == start_char else -1
+                    if depth == 0:
+                        return text[start : match.end()]
 
         # Return as-is if no JSON found
         return text.strip()
@@ -1,18 +1,115 @@
 """OCR service abstraction with multiple backends."""
 
+import hashlib
+import io
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 
 import structlog
 
 from ..config.constants import OCRStrategy
 from ..config.settings import Settings
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.concurrency import AdaptiveConcurrencyController, RateLimiter
 from ..utils.exceptions import OCRError
-from ..utils.image_utils import encode_image_base64, bytes_to_image, resize_image_if_needed
-from .llm_service import LLMService
+from ..utils.ocr_cache import OCRDiskCache
+from ..utils.retry import error_status_code, is_fatal_error, is_transient_error
+from ..utils.tracing import Span, start_span
+from .cache import LLMCache
+from .llm_service import DEFAULT_OCR_PROMPT, LLMService
 
 logger = structlog.get_logger(__name__)
 
+# Placeholder text for pages whose OCR failed
+OCR_FAILED_MARKER = "[OCR FAILED]"
+
+# Number of preprocessed (base64, mime) page encodings kept per OCR instance
+PREPROCESS_CACHE_SIZE = 32
+
+# Concurrency controller and rate limiter per API key, shared by every
+# AnthropicVisionOCR in the process so separate instances cannot multiply
+# the configured limits
+_SHARED_LIMITS: dict[str, tuple[AdaptiveConcurrencyController, RateLimiter]] = {}
+_SHARED_LIMITS_LOCK = threading.Lock()
+
+
+def _shared_limits(
+    llm_service: LLMService,
+    max_workers: int,
+    max_rps: float | None,
+    max_workers_ceiling: int | None,
+) -> tuple[AdaptiveConcurrencyController, RateLimiter]:
+    """Get the process-wide limits for the API key behind an LLM service.
+
+    The first OCR instance for a key sets the limits. Later instances share
+    them and may tighten them; a request for looser limits is logged and
+    ignored, since the quota is per key.
+
+    Args:
+        llm_service: LLM service whose client API key identifies the quota
+        max_workers: Initial concurrent OCR API calls
+        max_rps: Maximum OCR API requests per second (None for no limit)
+        max_workers_ceiling: Upper bound for adaptive OCR concurrency
+
+    Returns:
+        Tuple of (concurrency controller, rate limiter)
+    """
+    api_key = str(getattr(llm_service.client, "api_key", ""))
+    key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    with _SHARED_LIMITS_LOCK:
+        limits = _SHARED_LIMITS.get(key)
+        if limits is None:
+            limits = (
+                AdaptiveConcurrencyController(max_workers, max_limit=max_workers_ceiling),
+                RateLimiter(max_rps),
+            )
+            _SHARED_LIMITS[key] = limits
+            return limits
+
+    controller, rate_limiter = limits
+    ceiling = max(max_workers_ceiling or max_workers, max_workers)
+    controller.tighten(ceiling)
+    if max_rps:
+        rate_limiter.tighten(max_rps)
+
+    requested_interval = 1.0 / max_rps if max_rps else 0.0
+    if ceiling > controller.max_limit or requested_interval < rate_limiter.min_interval:
+        logger.warning(
+            "OCR limits already set for this API key; keeping the stricter shared limits",
+            requested_max_workers=ceiling,
+            shared_max_workers=controller.max_limit,
+            requested_max_rps=max_rps,
+            shared_max_rps=(
+                1.0 / rate_limiter.min_interval if rate_limiter.min_interval else None
+            ),
+        )
+    return limits
+
+
+def join_pages(texts: list[str]) -> str:
+    """Combine per-page texts with page separators.
+
+    Args:
+        texts: Extracted text per page, in page order
+
+    Returns:
+        Combined text
+    """
+    # Write pages straight into one buffer instead of building a formatted
+    # copy of every page first
+    buffer = io.StringIO()
+    for i, text in enumerate(texts, 1):
+        if i > 1:
+            buffer.write("\n\n")
+        buffer.write(f"--- Page {i} ---\n")
+        buffer.write(text)
+    return buffer.getvalue()
+
 
 class OCRService(ABC):
     """Abstract base class for OCR services."""
@@ -34,6 +131,25 @@ class OCRService(ABC):
         pass
 
     @abstractmethod
+    def extract_pages(
+        self,
+        images: list[tuple[bytes, str]],
+    ) -> list[str]:
+        """Extract text from multiple images, one entry per page.
+
+        Pages that fail individually are returned as OCR_FAILED_MARKER.
+
+        Args:
+            images: List of (image_bytes, mime_type) tuples
+
+        Returns:
+            Extracted text per page, in page order
+
+        Raises:
+            OCRError: If text extraction fails for the whole document
+        """
+        pass
+
     def extract_text_from_multiple(
         self,
         images: list[tuple[bytes, str]],
@@ -44,33 +160,109 @@ class OCRService(ABC):
             images: List of (image_bytes, mime_type) tuples
 
         Returns:
-            Combined extracted text
+            Combined extracted text with page separators
 
         Raises:
             OCRError: If text extraction fails
         """
-        pass
+        return join_pages(self.extract_pages(images))
 
 
 class AnthropicVisionOCR(OCRService):
     """OCR implementation using Anthropic Claude Vision API."""
 
-    def __init__(self, llm_service: LLMService, max_workers: int = 4) -> None:
+    def __init__(
+        self,
+        llm_service: LLMService,
+        max_workers: int = 4,
+        max_rps: float | None = None,
+        max_workers_ceiling: int | None = None,
+        batch_size: int = 0,
+        max_dimension: int | None = None,
+        jpeg_quality: int | None = None,
+        disk_cache: OCRDiskCache | None = None,
+    ) -> None:
         """Initialize Anthropic Vision OCR.
 
         Args:
             llm_service: LLM service instance
-            max_workers: Maximum concurrent OCR API calls
+            max_workers: Initial concurrent OCR API calls, per process and API key
+            max_rps: Maximum OCR API requests per second, per process and API
+                key (None for no limit)
+            max_workers_ceiling: Upper bound the concurrency may grow to while
+                the API is not throttling (defaults to max_workers)
+            batch_size: Pages per Message Batches API job for multi-page
+                documents (0 uses per-page requests)
+            max_dimension: Long-edge cap for images sent to the API
+                (None uses the image_utils default)
+            jpeg_quality: JPEG quality for images sent to the API
+                (None uses the image_utils default)
+            disk_cache: Persistent cache of OCR results across runs
         """
         self.llm_service = llm_service
         self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._encode_options: dict[str, int] = {}
+        if max_dimension is not None:
+            self._encode_options["max_dimension"] = max_dimension
+        if jpeg_quality is not None:
+            self._encode_options["quality"] = jpeg_quality
+        self._concurrency, self._rate_limiter = _shared_limits(
+            llm_service, max_workers, max_rps, max_workers_ceiling
+        )
+        self._preprocessed: OrderedDict[bytes, tuple[str, str]] = OrderedDict()
+        self._preprocessed_lock = threading.Lock()
+        self._disk_cache = disk_cache
+        # Model and prompt are part of the key so either change invalidates it
+        self._disk_keyer = (
+            LLMCache.make_keyer(llm_service.model, DEFAULT_OCR_PROMPT) if disk_cache else None
+        )
 
-    def extract_text(self, image_bytes: bytes, mime_type: str) -> str:
+    def _prepare_image(self, image_bytes: bytes) -> tuple[str, str]:
+        """Resize and base64-encode an image, memoized by content hash.
+
+        Args:
+            image_bytes: Raw image bytes
+
+        Returns:
+            Tuple of (base64_data, mime_type)
+        """
+        digest = hashlib.sha256(image_bytes).digest()
+
+        with self._preprocessed_lock:
+            cached = self._preprocessed.get(digest)
+            if cached is not None:
+                self._preprocessed.move_to_end(digest)
+                return cached
+
+        # Deferred so importing the OCR service does not load PIL
+        from ..utils.image_utils import bytes_to_image, encode_image_base64
+
+        # encode_image_base64 downscales to the long-edge cap before encoding
+        image = bytes_to_image(image_bytes)
+        prepared = encode_image_base64(image, **self._encode_options)
+
+        with self._preprocessed_lock:
+            self._preprocessed[digest] = prepared
+            if len(self._preprocessed) > PREPROCESS_CACHE_SIZE:
+                self._preprocessed.popitem(last=False)
+
+        return prepared
+
+    def extract_text(
+        self,
+        image_bytes: bytes,
+        mime_type: str,
+        *,
+        use_disk_cache: bool = True,
+    ) -> str:
         """Extract text using Anthropic Claude Vision.
 
         Args:
             image_bytes: Raw image bytes
             mime_type: MIME type of the image
+            use_disk_cache: Consult and fill the disk cache (disabled when the
+                caller already probed it for a whole document)
 
         Returns:
             Extracted text
@@ -78,110 +270,299 @@ class AnthropicVisionOCR(OCRService):
         Raises:
             OCRError: If extraction fails
         """
-        try:
-            # Resize image if needed
-            image = bytes_to_image(image_bytes)
-            image = resize_image_if_needed(image)
+        with start_span(
+            "ocr.anthropic.page", **{"image.bytes": len(image_bytes), "image.mime": mime_type}
+        ) as span:
+            text = self._extract_text(image_bytes, span, use_disk_cache)
+            span.set_attribute("text.length", len(text))
+            return text
 
-            # Encode to base64 with size management
-            base64_data, actual_mime = encode_image_base64(image)
+    def _extract_text(self, image_bytes: bytes, span: Span, use_disk_cache: bool) -> str:
+        """Extract text from one image, recording request details on a span.
 
-            text = self.llm_service.extract_text_from_image(
-                base64_data, actual_mime, image_bytes=image_bytes
-            )
+        Args:
+            image_bytes: Raw image bytes
+            span: Tracing span for this page
+            use_disk_cache: Consult and fill the disk cache
+
+        Returns:
+            Extracted text
+
+        Raises:
+            OCRError: If extraction fails
+        """
+        cache_key: str | None = None
+        if self._disk_cache is not None and use_disk_cache:
+            cache_key = self._disk_keyer(image_bytes)
+            cached = self._disk_cache.get(cache_key)
+            span.set_attribute("cache.hit", cached is not None)
+            if cached is not None:
+                logger.debug("Using disk-cached OCR result")
+                return cached
+
+        try:
+            # Resize and encode to base64 with size management
+            base64_data, actual_mime = self._prepare_image(image_bytes)
+            span.set_attribute("image.base64_len", len(base64_data))
+
+            # Cap in-flight API calls and pace them to stay under rate limits
+            with self._concurrency:
+                self._rate_limiter.acquire()
+                started = time.monotonic()
+                try:
+                    text = self.llm_service.extract_text_from_image(
+                        base64_data, actual_mime, image_bytes=image_bytes
+                    )
+                except Exception as e:
+                    if is_transient_error(e):
+                        self._concurrency.on_rate_limit()
+                    raise
+                self._concurrency.on_success(time.monotonic() - started)
             logger.debug("Anthropic Vision OCR completed", text_length=len(text))
 
+            if cache_key is not None:
+                self._disk_cache.put(cache_key, text)
+
             return text
 
         except Exception as e:
+            status = error_status_code(e)
+            if status is not None:
+                span.set_attribute("http.status_code", status)
             logger.error("Anthropic Vision OCR failed", error=str(e))
             raise OCRError(f"Anthropic Vision OCR failed: {e}") from e
 
     def _extract_single_page(
         self,
+        results: list[str],
         page_index: int,
         image_bytes: bytes,
         mime_type: str,
-    ) -> tuple[int, str]:
-        """Extract text from a single page.
+        use_disk_cache: bool = True,
+    ) -> None:
+        """Extract text from a single page into its result slot.
+
+        Each page writes only its own list slot, so no locking is needed.
 
         Args:
+            results: Pre-allocated per-page results, in page order
             page_index: 1-based page index
             image_bytes: Raw image bytes
             mime_type: MIME type of the image
+            use_disk_cache: Consult and fill the disk cache
 
-        Returns:
-            Tuple of (page_index, extracted_text)
+        Raises:
+            OCRError: If the failure would repeat on every page (e.g. invalid API key)
         """
         try:
-            text = self.extract_text(image_bytes, mime_type)
-            return (page_index, text)
+            results[page_index - 1] = self.extract_text(
+                image_bytes, mime_type, use_disk_cache=use_disk_cache
+            )
         except OCRError as e:
+            if is_fatal_error(e):
+                raise
             logger.warning(f"Failed to extract text from page {page_index}", error=str(e))
-            return (page_index, "[OCR FAILED]")
+            results[page_index - 1] = OCR_FAILED_MARKER
 
-    def extract_text_from_multiple(
+    def extract_pages(
         self,
         images: list[tuple[bytes, str]],
-    ) -> str:
+    ) -> list[str]:
         """Extract text from multiple images in parallel.
 
         Args:
             images: List of (image_bytes, mime_type) tuples
 
         Returns:
-            Combined extracted text with page separators
+            Extracted text per page, in page order
 
         Raises:
-            OCRError: If extraction fails
+            OCRError: If a batch job fails or the API rejects the credentials
+        """
+        # Repeated pages (blank separators, duplicate cover sheets) are sent once
+        page_keys = [hashlib.blake2b(image_bytes, digest_size=16).digest() for image_bytes, _ in images]
+        unique_index: dict[bytes, int] = {}
+        unique_images: list[tuple[bytes, str]] = []
+        for key, image in zip(page_keys, images, strict=True):
+            if key not in unique_index:
+                unique_index[key] = len(unique_images)
+                unique_images.append(image)
+
+        texts = self._extract_with_disk_cache(unique_images)
+        if len(unique_images) < len(images):
+            logger.info(
+                "Skipped duplicate pages",
+                total_pages=len(images),
+                unique_pages=len(unique_images),
+            )
+
+        return [texts[unique_index[key]] for key in page_keys]
+
+    def _extract_with_disk_cache(self, images: list[tuple[bytes, str]]) -> list[str]:
+        """Serve pages from the disk cache and OCR only the misses.
+
+        All page keys are hashed up front in parallel, so only cache misses
+        reach the API worker pool or batch jobs.
+
+        Args:
+            images: List of distinct (image_bytes, mime_type) tuples
+
+        Returns:
+            Extracted text per page, in page order
+
+        Raises:
+            OCRError: If a batch job fails or the API rejects the credentials
+        """
+        if self._disk_cache is None or len(images) < 2:
+            return self._extract_unique_pages(images)
+
+        keys = LLMCache.generate_keys_batch(
+            [(image_bytes, self.llm_service.model, DEFAULT_OCR_PROMPT) for image_bytes, _ in images]
+        )
+        texts: list[str | None] = [self._disk_cache.get(key) for key in keys]
+        missing = [i for i, text in enumerate(texts) if text is None]
+
+        if missing:
+            fresh = self._extract_unique_pages(
+                [images[i] for i in missing], use_disk_cache=False
+            )
+            for i, text in zip(missing, fresh, strict=True):
+                texts[i] = text
+                if text != OCR_FAILED_MARKER:
+                    self._disk_cache.put(keys[i], text)
+
+        logger.info(
+            "OCR disk cache probed",
+            total_pages=len(images),
+            cached_pages=len(images) - len(missing),
+        )
+        return texts
+
+    def _extract_unique_pages(
+        self,
+        images: list[tuple[bytes, str]],
+        use_disk_cache: bool = True,
+    ) -> list[str]:
+        """Extract text from distinct pages, in parallel or via batch jobs.
+
+        Args:
+            images: List of (image_bytes, mime_type) tuples
+            use_disk_cache: Consult and fill the disk cache per page
+
+        Returns:
+            Extracted text per page, in page order
+
+        Raises:
+            OCRError: If a batch job fails or the API rejects the credentials
         """
         if not images:
-            return ""
+            return []
 
         # For single image, no need for parallelization
         if len(images) == 1:
+            results = [""]
             image_bytes, mime_type = images[0]
-            try:
-                text = self.extract_text(image_bytes, mime_type)
-                return f"--- Page 1 ---\n{text}"
-            except OCRError as e:
-                logger.warning("Failed to extract text from page 1", error=str(e))
-                return "--- Page 1 ---\n[OCR FAILED]"
+            self._extract_single_page(results, 1, image_bytes, mime_type, use_disk_cache)
+            return results
+
+        if self.batch_size:
+            return self._extract_batched(images, use_disk_cache)
+
+        # Handshake once up front so the parallel calls start on a warm pool
+        self.llm_service.warmup()
 
-        # Process pages in parallel
-        results: dict[int, str] = {}
+        # Process pages in parallel, each writing its own slot in page order
+        results = [""] * len(images)
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
+        # Size the pool for the ceiling; the controller gates actual concurrency
+        with ThreadPoolExecutor(max_workers=self._concurrency.max_limit) as executor:
+            futures = [
                 executor.submit(
-                    self._extract_single_page, i, image_bytes, mime_type
-                ): i
+                    self._extract_single_page, results, i, image_bytes, mime_type, use_disk_cache
+                )
                 for i, (image_bytes, mime_type) in enumerate(images, 1)
-            }
+            ]
 
-            for future in as_completed(futures):
-                page_index, text = future.result()
-                results[page_index] = text
-
-        # Combine results in page order
-        texts = []
-        for i in range(1, len(images) + 1):
-            texts.append(f"--- Page {i} ---\n{results[i]}")
+            # Page failures are recorded in place; anything raised is fatal for
+            # every page, so stop queued pages instead of failing them one by one
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            for future in done:
+                future.result()
 
         logger.info(
             "Parallel OCR completed",
             total_pages=len(images),
             max_workers=self.max_workers,
+            concurrency_limit=self._concurrency.current_limit,
+        )
+
+        return results
+
+    def _extract_batched(
+        self,
+        images: list[tuple[bytes, str]],
+        use_disk_cache: bool = True,
+    ) -> list[str]:
+        """Extract text from pages via Message Batches API jobs.
+
+        Pages that fail inside a batch are retried with per-page requests.
+
+        Args:
+            images: List of (image_bytes, mime_type) tuples
+            use_disk_cache: Consult and fill the disk cache for retried pages
+
+        Returns:
+            Extracted text per page, in page order
+
+        Raises:
+            OCRError: If a batch cannot be submitted or completed
+        """
+        results = [""] * len(images)
+        failed: list[int] = []
+
+        for start in range(0, len(images), self.batch_size):
+            chunk = images[start : start + self.batch_size]
+            try:
+                prepared = [self._prepare_image(image_bytes) for image_bytes, _ in chunk]
+                texts = self.llm_service.extract_text_from_images_batch(prepared)
+            except Exception as e:
+                logger.error("Anthropic batch OCR failed", error=str(e))
+                raise OCRError(f"Anthropic batch OCR failed: {e}") from e
+
+            for offset, text in enumerate(texts):
+                if text is None:
+                    failed.append(start + offset)
+                else:
+                    results[start + offset] = text
+
+        for index in failed:
+            image_bytes, mime_type = images[index]
+            self._extract_single_page(results, index + 1, image_bytes, mime_type, use_disk_cache)
+
+        logger.info(
+            "Batch OCR completed",
+            total_pages=len(images),
+            batch_size=self.batch_size,
+            retried_pages=len(failed),
         )
 
-        return "\n\n".join(texts)
+        return results
 
 
 class TesseractOCR(OCRService):
     """OCR implementation using Tesseract (fallback)."""
 
-    def __init__(self) -> None:
-        """Initialize Tesseract OCR."""
+    def __init__(self, max_workers: int = 3) -> None:
+        """Initialize Tesseract OCR.
+
+        Args:
+            max_workers: Maximum concurrent tesseract processes (further
+                capped at the CPU count)
+        """
+        self.max_workers = max(1, min(os.cpu_count() or 1, max_workers))
+
         try:
             import pytesseract
 
@@ -205,6 +586,8 @@ class TesseractOCR(OCRService):
         Raises:
             OCRError: If extraction fails
         """
+        from ..utils.image_utils import bytes_to_image
+
         try:
             image = bytes_to_image(image_bytes)
             text = self.pytesseract.image_to_string(image)
@@ -215,53 +598,102 @@ class TesseractOCR(OCRService):
             logger.error("Tesseract OCR failed", error=str(e))
             raise OCRError(f"Tesseract OCR failed: {e}") from e
 
-    def extract_text_from_multiple(
+    def extract_pages(
         self,
         images: list[tuple[bytes, str]],
-    ) -> str:
+    ) -> list[str]:
         """Extract text from multiple images.
 
         Args:
             images: List of (image_bytes, mime_type) tuples
 
         Returns:
-            Combined extracted text with page separators
-
-        Raises:
-            OCRError: If extraction fails
+            Extracted text per page, in page order
         """
-        texts = []
+        if len(images) <= 1 or self.max_workers == 1:
+            return [self._extract_page_or_marker(i, *image) for i, image in enumerate(images, 1)]
+
+        # pytesseract runs tesseract in a subprocess and waits with the GIL
+        # released, so threads already give one CPU per page
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(images))) as executor:
+            return list(
+                executor.map(
+                    self._extract_page_or_marker,
+                    range(1, len(images) + 1),
+                    [image_bytes for image_bytes, _ in images],
+                    [mime_type for _, mime_type in images],
+                )
+            )
 
-        for i, (image_bytes, mime_type) in enumerate(images, 1):
-            try:
-                text = self.extract_text(image_bytes, mime_type)
-                texts.append(f"--- Page {i} ---\n{text}")
-            except OCRError as e:
-                logger.warning(f"Failed to extract text from page {i}", error=str(e))
-                texts.append(f"--- Page {i} ---\n[OCR FAILED]")
+    def _extract_page_or_marker(self, page_index: int, image_bytes: bytes, mime_type: str) -> str:
+        """Extract text from one page, returning the failure marker on error.
+
+        Args:
+            page_index: Page number (1-indexed)
+            image_bytes: Raw image bytes
+            mime_type: MIME type of the image
 
-        return "\n\n".join(texts)
+        Returns:
+            Extracted text, or OCR_FAILED_MARKER if extraction failed
+        """
+        try:
+            return self.extract_text(image_bytes, mime_type)
+        except OCRError as e:
+            logger.warning(f"Failed to extract text from page {page_index}", error=str(e))
+            return OCR_FAILED_MARKER
 
 
 class AutoOCR(OCRService):
     """OCR service that tries Anthropic Claude Vision first, then falls back to Tesseract."""
 
-    def __init__(self, llm_service: LLMService, max_workers: int = 4) -> None:
+    def __init__(
+        self,
+        llm_service: LLMService,
+        max_workers: int = 4,
+        max_rps: float | None = None,
+        max_workers_ceiling: int | None = None,
+        batch_size: int = 0,
+        max_dimension: int | None = None,
+        jpeg_quality: int | None = None,
+        tesseract_workers: int = 3,
+        disk_cache: OCRDiskCache | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
         """Initialize Auto OCR.
 
         Args:
             llm_service: LLM service for Claude Vision
-            max_workers: Maximum concurrent OCR API calls
+            max_workers: Initial concurrent OCR API calls
+            max_rps: Maximum OCR API requests per second (None for no limit)
+            max_workers_ceiling: Upper bound for adaptive OCR concurrency
+            batch_size: Pages per Message Batches API job (0 disables)
+            max_dimension: Long-edge cap for images sent to the API
+            jpeg_quality: JPEG quality for images sent to the API
+            tesseract_workers: Maximum concurrent tesseract processes for fallback
+            disk_cache: Persistent cache of Claude Vision results across runs
+            breaker: Circuit breaker that routes straight to Tesseract while
+                Claude Vision keeps failing (defaults to CircuitBreaker())
         """
-        self.anthropic_ocr = AnthropicVisionOCR(llm_service, max_workers=max_workers)
+        self.anthropic_ocr = AnthropicVisionOCR(
+            llm_service,
+            max_workers=max_workers,
+            max_rps=max_rps,
+            max_workers_ceiling=max_workers_ceiling,
+            batch_size=batch_size,
+            max_dimension=max_dimension,
+            jpeg_quality=jpeg_quality,
+            disk_cache=disk_cache,
+        )
+        self.tesseract_workers = tesseract_workers
         self._tesseract_ocr: TesseractOCR | None = None
+        self.breaker = breaker or CircuitBreaker()
 
     @property
     def tesseract_ocr(self) -> TesseractOCR | None:
         """Lazy initialize Tesseract OCR."""
         if self._tesseract_ocr is None:
             try:
-                self._tesseract_ocr = TesseractOCR()
+                self._tesseract_ocr = TesseractOCR(max_workers=self.tesseract_workers)
             except OCRError:
                 logger.warning("Tesseract not available for fallback")
         return self._tesseract_ocr
@@ -279,9 +711,16 @@ class AutoOCR(OCRService):
         Raises:
             OCRError: If all OCR methods fail
         """
+        # During an outage, skip the doomed (and retried) Claude Vision call
+        if not self.breaker.allow_request() and self.tesseract_ocr:
+            return self.tesseract_ocr.extract_text(image_bytes, mime_type)
+
         try:
-            return self.anthropic_ocr.extract_text(image_bytes, mime_type)
+            text = self.anthropic_ocr.extract_text(image_bytes, mime_type)
+            self.breaker.record_success()
+            return text
         except OCRError as anthropic_error:
+            self.breaker.record_failure()
             logger.warning("Anthropic Claude Vision failed, trying Tesseract", error=str(anthropic_error))
 
             if self.tesseract_ocr:
@@ -294,29 +733,33 @@ class AutoOCR(OCRService):
 
             raise OCRError(f"Anthropic Claude Vision failed and Tesseract not available: {anthropic_error}")
 
-    def extract_text_from_multiple(
+    def extract_pages(
         self,
         images: list[tuple[bytes, str]],
-    ) -> str:
+    ) -> list[str]:
         """Extract text from multiple images.
 
         Args:
             images: List of (image_bytes, mime_type) tuples
 
         Returns:
-            Combined extracted text
+            Extracted text per page, in page order
 
         Raises:
             OCRError: If extraction fails
         """
+        if not self.breaker.allow_request() and self.tesseract_ocr:
+            return self.tesseract_ocr.extract_pages(images)
+
         try:
-            return self.anthropic_ocr.extract_text_from_multiple(images)
+            texts = self.anthropic_ocr.extract_pages(images)
         except OCRError as anthropic_error:
+            self.breaker.record_failure()
             logger.warning("Anthropic Claude Vision failed for batch, trying Tesseract")
 
             if self.tesseract_ocr:
                 try:
-                    return self.tesseract_ocr.extract_text_from_multiple(images)
+                    return self.tesseract_ocr.extract_pages(images)
                 except OCRError as tesseract_error:
                     raise OCRError(
                         f"All OCR methods failed for batch. Anthropic: {anthropic_error}, Tesseract: {tesseract_error}"
@@ -324,6 +767,15 @@ class AutoOCR(OCRService):
 
             raise
 
+        # Transient per-page errors come back as markers rather than raising, so
+        # a document where most pages failed counts as an outage signal
+        failed_pages = texts.count(OCR_FAILED_MARKER)
+        if failed_pages * 2 > len(texts):
+            self.breaker.record_failure()
+        elif texts:
+            self.breaker.record_success()
+        return texts
+
 
 def create_ocr_service(
     settings: Settings,
@@ -343,15 +795,44 @@ def create_ocr_service(
     """
     strategy = settings.ocr_strategy
     max_workers = settings.ocr_max_workers
+    max_rps = settings.ocr_max_rps
+    max_workers_ceiling = settings.ocr_max_workers_ceiling
+    batch_size = settings.ocr_batch_size
+    max_dimension = settings.image_max_dimension
+    jpeg_quality = settings.image_jpeg_quality
+    disk_cache = OCRDiskCache(settings.ocr_cache_dir) if settings.ocr_cache_dir else None
 
     if strategy == OCRStrategy.TESSERACT:
-        return TesseractOCR()
+        return TesseractOCR(max_workers=settings.tesseract_max_workers)
 
     if llm_service is None:
         llm_service = LLMService(settings)
 
     if strategy == OCRStrategy.ANTHROPIC_VISION:
-        return AnthropicVisionOCR(llm_service, max_workers=max_workers)
+        return AnthropicVisionOCR(
+            llm_service,
+            max_workers=max_workers,
+            max_rps=max_rps,
+            max_workers_ceiling=max_workers_ceiling,
+            batch_size=batch_size,
+            max_dimension=max_dimension,
+            jpeg_quality=jpeg_quality,
+            disk_cache=disk_cache,
+        )
 
     # Auto strategy
-    return AutoOCR(llm_service, max_workers=max_workers)
+    return AutoOCR(
+        llm_service,
+        max_workers=max_workers,
+        max_rps=max_rps,
+        max_workers_ceiling=max_workers_ceiling,
+        batch_size=batch_size,
+        max_dimension=max_dimension,
+        jpeg_quality=jpeg_quality,
+        tesseract_workers=settings.tesseract_max_workers,
+        disk_cache=disk_cache,
+        breaker=CircuitBreaker(
+            failure_threshold=settings.ocr_breaker_failure_threshold,
+            reset_timeout=settings.ocr_breaker_reset_seconds,
+        ),
+    )
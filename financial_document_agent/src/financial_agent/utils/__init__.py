@@ -1,5 +1,7 @@
 """Utility functions and classes."""
 
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     ClassificationError,
     CurrencyConversionError,
@@ -8,8 +10,18 @@ from .exceptions import (
     FinancialAgentError,
     OCRError,
 )
-from .image_utils import encode_image_base64, resize_image_if_needed
-from .pdf_utils import pdf_to_images
+
+if TYPE_CHECKING:
+    from .image_utils import encode_image_base64, resize_image_if_needed
+    from .pdf_utils import pdf_to_images
+
+# Image and PDF helpers pull in PIL and pypdfium2, so they are imported on
+# first access rather than whenever an exception class is needed
+_LAZY_ATTRS = {
+    "encode_image_base64": ".image_utils",
+    "resize_image_if_needed": ".image_utils",
+    "pdf_to_images": ".pdf_utils",
+}
 
 __all__ = [
     "FinancialAgentError",
@@ -22,3 +34,16 @@ __all__ = [
     "resize_image_if_needed",
     "pdf_to_images",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import image and PDF helpers lazily."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
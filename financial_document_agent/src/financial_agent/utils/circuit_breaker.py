@@ -0,0 +1,80 @@
+"""Circuit breaker for skipping a failing backend during outages."""
+
+import threading
+import time
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class CircuitBreaker:
+    """Trip after consecutive failures and reject calls until a cool-down passes.
+
+    States follow the usual pattern: *closed* lets every call through; after
+    ``failure_threshold`` consecutive failures the breaker *opens* and rejects
+    calls for ``reset_timeout`` seconds; it then goes *half-open* and admits a
+    single trial call whose outcome closes or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0) -> None:
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before admitting a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected (ignores half-open trials)."""
+        with self._lock:
+            return self._opened_at is not None and (
+                time.monotonic() - self._opened_at < self.reset_timeout
+            )
+
+    def allow_request(self) -> bool:
+        """Check whether a call may proceed, claiming the half-open trial if due.
+
+        Returns:
+            True if the caller should attempt the protected backend
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Circuit breaker closed")
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            reopen = self._trial_in_flight
+            self._trial_in_flight = False
+            if reopen or self._failures >= self.failure_threshold:
+                if self._opened_at is None or reopen:
+                    logger.warning(
+                        "Circuit breaker opened",
+                        consecutive_failures=self._failures,
+                        reset_timeout=self.reset_timeout,
+                    )
+                self._opened_at = time.monotonic()
@@ -0,0 +1,140 @@
+"""Concurrency helpers for rate-limited API fan-out."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe limiter enforcing a minimum interval between calls.
+
+    Callers reserve the next free time slot under a lock and sleep outside it,
+    so waiting threads never block each other's reservations.
+    """
+
+    def __init__(self, max_per_second: float | None = None) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            max_per_second: Maximum calls per second (None disables limiting)
+        """
+        self.min_interval = 1.0 / max_per_second if max_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """Block until the caller may issue its next call."""
+        if not self.min_interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+    def tighten(self, max_per_second: float) -> None:
+        """Lower the rate if ``max_per_second`` is stricter than the current one.
+
+        Args:
+            max_per_second: Requested maximum calls per second
+        """
+        with self._lock:
+            self.min_interval = max(self.min_interval, 1.0 / max_per_second)
+
+
+class AdaptiveConcurrencyController:
+    """Concurrency limit that adapts to API throttling (AIMD).
+
+    The limit starts at ``initial_limit``, is halved whenever a call is
+    throttled, and grows by one after every ``increase_every`` consecutive
+    successes up to ``max_limit``. Used as a context manager it behaves like
+    a semaphore whose size can change while callers are waiting.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        max_limit: int | None = None,
+        min_limit: int = 1,
+        increase_every: int = 10,
+        ewma_alpha: float = 0.2,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            initial_limit: Starting number of concurrent calls
+            max_limit: Upper bound for the limit (defaults to initial_limit)
+            min_limit: Lower bound for the limit
+            increase_every: Consecutive successes required before growing
+            ewma_alpha: Smoothing factor for the round-trip time average
+        """
+        self.min_limit = min_limit
+        self.max_limit = max(max_limit or initial_limit, initial_limit)
+        self.increase_every = increase_every
+        self.ewma_alpha = ewma_alpha
+        self.rtt_ewma: float | None = None
+        self._limit = max(initial_limit, min_limit)
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+
+    @property
+    def current_limit(self) -> int:
+        """Get the current concurrency limit."""
+        return self._limit
+
+    def acquire(self) -> None:
+        """Block until a call slot is available under the current limit."""
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self) -> None:
+        """Release a call slot."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    def __enter__(self) -> "AdaptiveConcurrencyController":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+    def on_success(self, rtt: float) -> None:
+        """Record a successful call and grow the limit additively.
+
+        Args:
+            rtt: Observed round-trip time in seconds
+        """
+        with self._cond:
+            if self.rtt_ewma is None:
+                self.rtt_ewma = rtt
+            else:
+                self.rtt_ewma += self.ewma_alpha * (rtt - self.rtt_ewma)
+
+            self._successes += 1
+            if self._successes >= self.increase_every and self._limit < self.max_limit:
+                self._limit += 1
+                self._successes = 0
+                self._cond.notify()
+
+    def tighten(self, max_limit: int) -> None:
+        """Lower the ceiling (and current limit) if ``max_limit`` is stricter.
+
+        Args:
+            max_limit: Requested upper bound for the limit
+        """
+        with self._cond:
+            self.max_limit = min(self.max_limit, max(max_limit, self.min_limit))
+            self._limit = min(self._limit, self.max_limit)
+
+    def on_rate_limit(self) -> None:
+        """Record a throttled call and halve the limit."""
+        with self._cond:
+            self._limit = max(self.min_limit, self._limit // 2)
+            self._successes = 0
@@ -1,5 +1,7 @@
 """Custom exceptions for the financial agent."""
 
+from functools import cached_property
+
 
 class FinancialAgentError(Exception):
     """Base exception for all financial agent errors."""
@@ -9,11 +11,16 @@ class FinancialAgentError(Exception):
         self.message = message
         self.details = details or {}
 
-    def __str__(self) -> str:
+    @cached_property
+    def _formatted(self) -> str:
+        """Message with details, formatted once; retry and logging paths call str() repeatedly."""
         if self.details:
             return f"{self.message} - Details: {self.details}"
         return self.message
 
+    def __str__(self) -> str:
+        return self._formatted
+
 
 class DocumentLoadError(FinancialAgentError):
     """Error loading or validating a document."""
@@ -2,47 +2,61 @@
 
 import base64
 import io
+import struct
 
 from PIL import Image
 
-# Maximum dimension for images sent to Claude Vision
-MAX_IMAGE_DIMENSION = 2048
+# Maximum long edge for images sent to Claude Vision. Larger images are
+# downscaled by the API anyway, so sending them only costs tokens and bandwidth
+MAX_IMAGE_DIMENSION = 1568
+# Default JPEG quality for images sent to Claude Vision
+DEFAULT_JPEG_QUALITY = 85
 # Maximum file size for base64 encoded images (in bytes)
 MAX_BASE64_SIZE = 20 * 1024 * 1024  # 20MB
+# Resampling filter for downscaling before the vision API
+DEFAULT_RESAMPLE = Image.Resampling.BILINEAR
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers carrying the frame size (excludes DHT, JPG, DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
 
 
 def resize_image_if_needed(
     image: Image.Image,
     max_dimension: int = MAX_IMAGE_DIMENSION,
+    resample: Image.Resampling = DEFAULT_RESAMPLE,
 ) -> Image.Image:
     """Resize image if it exceeds the maximum dimension.
 
+    The caller's image is left untouched. A ``reducing_gap`` lets Pillow shrink
+    by an integer factor before resampling, as ``Image.thumbnail`` does. BILINEAR
+    is the default filter because the vision model re-normalizes images itself;
+    pass LANCZOS where quality matters.
+
     Args:
         image: PIL Image object
         max_dimension: Maximum allowed dimension (width or height)
+        resample: Resampling filter used for downscaling
 
     Returns:
-        Resized image if needed, otherwise original image
+        New resized image if needed, otherwise original image
     """
     width, height = image.size
 
     if width <= max_dimension and height <= max_dimension:
         return image
 
-    # Calculate scaling factor
     scale = min(max_dimension / width, max_dimension / height)
-    new_width = int(width * scale)
-    new_height = int(height * scale)
-
-    # Use high-quality resampling
-    return image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return image.resize(new_size, resample, reducing_gap=2.0)
 
 
 def encode_image_base64(
     image: Image.Image,
     format: str = "JPEG",
-    quality: int = 85,
+    quality: int = DEFAULT_JPEG_QUALITY,
     max_size: int = 2867 * 1024,  # 2.8MB target for raw bytes to stay very safely under 5MB base64
+    max_dimension: int = MAX_IMAGE_DIMENSION,
 ) -> tuple[str, str]:
     """Encode a PIL Image to base64 string with size management.
 
@@ -51,19 +65,23 @@ def encode_image_base64(
         format: Output format (PNG or JPEG). Defaults to JPEG for size.
         quality: JPEG compression quality (1-100)
         max_size: Maximum raw byte size before reducing quality/resolution
+        max_dimension: Maximum allowed dimension (width or height)
 
     Returns:
         Tuple of (base64_string, mime_type)
     """
     # Resize if any dimension is too large for Claude
     print(f"DEBUG_FIN: Encoding image {image.size}, current size unknown")
-    image = resize_image_if_needed(image)
+    image = resize_image_if_needed(image, max_dimension)
 
     # Convert RGBA to RGB for JPEG
     if format.upper() == "JPEG" and image.mode == "RGBA":
         background = Image.new("RGB", image.size, (255, 255, 255))
-        background.paste(image, mask=image.split()[3])
+        # An RGBA mask is read through its alpha band, so no split() copies
+        background.paste(image, mask=image)
         image = background
+    elif format.upper() == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
 
     buffer = io.BytesIO()
     
@@ -93,8 +111,9 @@ def encode_image_base64(
             image.save(buffer, format="JPEG", quality=75)
             print(f"DEBUG_FIN: Resized to {image.size}, new size: {buffer.tell()} bytes")
 
-    buffer.seek(0)
-    base64_data = base64.standard_b64encode(buffer.read()).decode("utf-8")
+    # Encode straight from the buffer without copying it out first
+    with buffer.getbuffer() as raw:
+        base64_data = base64.b64encode(raw).decode("ascii")
     mime_type = f"image/{format.lower()}"
 
     return base64_data, mime_type
@@ -120,7 +139,8 @@ def image_to_bytes(
     # Convert RGBA to RGB for JPEG
     if format.upper() == "JPEG" and image.mode == "RGBA":
         background = Image.new("RGB", image.size, (255, 255, 255))
-        background.paste(image, mask=image.split()[3])
+        # An RGBA mask is read through its alpha band, so no split() copies
+        background.paste(image, mask=image)
         image = background
 
     save_kwargs = {"format": format}
@@ -155,5 +175,45 @@ def get_image_dimensions(data: bytes) -> tuple[int, int]:
     Returns:
         Tuple of (width, height)
     """
+    size = _sniff_dimensions(data)
+    if size is not None:
+        return size
+
     image = bytes_to_image(data)
     return image.size
+
+
+def _sniff_dimensions(data: bytes) -> tuple[int, int] | None:
+    """Read PNG or baseline/progressive JPEG dimensions from the header.
+
+    Args:
+        data: Image bytes
+
+    Returns:
+        Tuple of (width, height), or None if the header is not recognized
+    """
+    if data.startswith(_PNG_SIGNATURE) and data[12:16] == b"IHDR":
+        return struct.unpack(">II", data[16:24])
+
+    if not data.startswith(b"\xff\xd8"):
+        return None
+
+    # Walk JPEG segments until the start-of-frame marker
+    offset = 2
+    end = len(data)
+    while offset + 4 <= end:
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            offset += 1
+            continue
+        (length,) = struct.unpack(">H", data[offset + 2 : offset + 4])
+        if marker in _JPEG_SOF_MARKERS:
+            if offset + 9 > end:
+                return None
+            height, width = struct.unpack(">HH", data[offset + 5 : offset + 9])
+            return width, height
+        offset += 2 + length
+    return None
@@ -0,0 +1,66 @@
+"""Disk-backed cache for OCR results that persists across runs."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class OCRDiskCache:
+    """Store OCR text on disk, one file per key.
+
+    Keys are hex digests (see ``LLMCache.generate_key``). Entries are sharded
+    into subdirectories by the first two key characters and written atomically,
+    so concurrent OCR threads and processes never observe partial files. The
+    cache is best-effort: I/O errors are logged and treated as misses.
+    """
+
+    def __init__(self, directory: Path | str) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding cached entries (created on first write)
+        """
+        self.directory = Path(directory).expanduser()
+
+    def _path(self, key: str) -> Path:
+        """Get the file path for a key."""
+        return self.directory / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> str | None:
+        """Get cached text for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached text, or None if missing or unreadable
+        """
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("OCR disk cache read failed", key=key, error=str(e))
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store text for a key.
+
+        Args:
+            key: Cache key
+            value: Text to cache
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp.write(value)
+            os.replace(tmp.name, path)
+        except OSError as e:
+            logger.warning("OCR disk cache write failed", key=key, error=str(e))
@@ -240,6 +240,49 @@ def pdf_bytes_to_images(
         raise DocumentLoadError(f"Failed to convert PDF bytes to images: {e}") from e
 
 
+def extract_pdf_text(
+    pdf_path: Path | str,
+    max_pages: int | None = None,
+) -> list[str]:
+    """Extract the embedded text layer of each PDF page.
+
+    Scanned pages have no text layer and yield empty strings.
+
+    Args:
+        pdf_path: Path to the PDF file
+        max_pages: Maximum number of pages to read (None for all)
+
+    Returns:
+        Text per page, in page order
+
+    Raises:
+        DocumentLoadError: If PDF cannot be loaded
+    """
+    pdf_path = Path(pdf_path)
+
+    try:
+        with pdfium.PdfDocument(pdf_path) as pdf:
+            page_count = len(pdf)
+            if max_pages is not None:
+                page_count = min(page_count, max_pages)
+
+            texts = []
+            for i in range(page_count):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                try:
+                    texts.append(textpage.get_text_range())
+                finally:
+                    textpage.close()
+                    page.close()
+            return texts
+    except Exception as e:
+        raise DocumentLoadError(
+            f"Failed to extract PDF text: {e}",
+            details={"pdf_path": str(pdf_path)},
+        ) from e
+
+
 def get_pdf_page_count(pdf_path: Path | str) -> int:
     """Get the number of pages in a PDF file.
 
@@ -0,0 +1,151 @@
+"""Retry policies for transient LLM API failures."""
+
+import re
+from collections.abc import Callable, Iterator
+from typing import Any, TypeVar
+
+from anthropic import APIConnectionError
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
+
+from .tracing import add_span_event
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# HTTP status codes worth retrying (rate limited, unavailable, overloaded)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+
+# HTTP status codes that fail every request the same way (bad or unauthorized key)
+FATAL_STATUS_CODES = frozenset({401, 403})
+
+_TRANSIENT_MESSAGE = re.compile(r"rate.?limit|quota|throttl|overloaded", re.IGNORECASE)
+
+
+def _iter_causes(exc: BaseException | None) -> Iterator[BaseException]:
+    """Yield an exception followed by its chain of causes."""
+    while exc is not None:
+        yield exc
+        exc = exc.__cause__
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Check whether an exception (or any of its causes) is worth retrying.
+
+    Args:
+        exc: Raised exception, possibly wrapping an API error
+
+    Returns:
+        True for rate limits, overloads, 5xx responses and connection errors
+    """
+    for err in _iter_causes(exc):
+        if isinstance(err, APIConnectionError):
+            return True
+        if getattr(err, "status_code", None) in RETRYABLE_STATUS_CODES:
+            return True
+        if _TRANSIENT_MESSAGE.search(str(err)):
+            return True
+    return False
+
+
+def error_status_code(exc: BaseException | None) -> int | None:
+    """Get the HTTP status code of an API error in an exception chain.
+
+    Args:
+        exc: Raised exception, possibly wrapping an API error
+
+    Returns:
+        Status code of the first API error found, or None
+    """
+    for err in _iter_causes(exc):
+        status = getattr(err, "status_code", None)
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_fatal_error(exc: BaseException) -> bool:
+    """Check whether an exception (or any of its causes) will fail every request.
+
+    Args:
+        exc: Raised exception, possibly wrapping an API error
+
+    Returns:
+        True for authentication and permission errors
+    """
+    return any(
+        getattr(err, "status_code", None) in FATAL_STATUS_CODES for err in _iter_causes(exc)
+    )
+
+
+def _retry_after_seconds(exc: BaseException | None) -> float | None:
+    """Extract the Retry-After delay from an API error response, if present."""
+    for err in _iter_causes(exc):
+        response = getattr(err, "response", None)
+        if response is None:
+            continue
+        value = response.headers.get("retry-after")
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+    return None
+
+
+def _record_retry(retry_state: RetryCallState) -> None:
+    """Attach a retry event to the current tracing span."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    status = error_status_code(exc)
+    attributes: dict[str, int | float | str] = {
+        "retry.attempt": retry_state.attempt_number,
+        "retry.wait_seconds": round(retry_state.upcoming_sleep, 3),
+    }
+    if status is not None:
+        attributes["http.status_code"] = status
+    add_span_event("retry", **attributes)
+
+
+def retry_on_rate_limit(
+    max_attempts: int = 3,
+    min_wait: float = 1.0,
+    max_wait: float = 30.0,
+) -> Callable[[F], F]:
+    """Build a retry decorator for transient API failures.
+
+    Waits follow exponential backoff with jitter, bounded by ``max_wait``; a
+    ``Retry-After`` header on the failed response takes precedence.
+    Non-transient errors (auth, bad request, parse failures) are raised at once.
+
+    Args:
+        max_attempts: Maximum number of attempts including the first call
+        min_wait: Initial backoff in seconds
+        max_wait: Maximum backoff in seconds
+
+    Returns:
+        Retry decorator
+    """
+    backoff = wait_exponential(multiplier=min_wait, min=min_wait, max=max_wait) + wait_random(
+        0, 0.5
+    )
+
+    def wait(retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(max_wait, retry_after)
+        return backoff(retry_state)
+
+    return retry(
+        retry=retry_if_exception(is_transient_error),
+        stop=stop_after_attempt(max_attempts),
+        wait=wait,
+        before_sleep=_record_retry,
+        reraise=True,
+    )
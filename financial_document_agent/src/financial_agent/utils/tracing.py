@@ -0,0 +1,115 @@
+"""Optional OpenTelemetry tracing with a structlog fallback.
+
+Spans go to OpenTelemetry when ``opentelemetry-api`` is installed and a tracer
+provider has been configured by the host application. Otherwise each span is
+emitted as a single debug log line carrying its attributes and duration.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Protocol
+
+import structlog
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - exercised when the extra is absent
+    trace = None
+
+logger = structlog.get_logger(__name__)
+
+AttributeValue = str | bool | int | float
+
+
+class Span(Protocol):
+    """Subset of the OpenTelemetry span API used by this package."""
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None: ...
+
+    def add_event(self, name: str, attributes: dict[str, AttributeValue] | None = None) -> None: ...
+
+
+class _LogSpan:
+    """Span stand-in that collects attributes and logs them when closed."""
+
+    def __init__(self, name: str, attributes: dict[str, AttributeValue]) -> None:
+        self.name = name
+        self.attributes = dict(attributes)
+        self.events: list[str] = []
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: dict[str, AttributeValue] | None = None) -> None:
+        self.events.append(name)
+
+
+_current_log_span: ContextVar[_LogSpan | None] = ContextVar("_current_log_span", default=None)
+
+
+def _otel_enabled() -> bool:
+    """Check whether a real OpenTelemetry tracer provider is configured."""
+    return trace is not None and not isinstance(
+        trace.get_tracer_provider(), trace.ProxyTracerProvider
+    )
+
+
+@contextmanager
+def start_span(name: str, **attributes: AttributeValue) -> Iterator[Span]:
+    """Open a span around a unit of work.
+
+    Exceptions propagate unchanged; the span records them before closing.
+
+    Args:
+        name: Span name, e.g. "ocr.anthropic.page"
+        **attributes: Initial span attributes
+
+    Yields:
+        Span to attach further attributes and events to
+    """
+    if _otel_enabled():
+        tracer = trace.get_tracer("financial_agent")
+        with tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+        return
+
+    span = _LogSpan(name, attributes)
+    token = _current_log_span.set(span)
+    started = time.perf_counter()
+    error: str | None = None
+    try:
+        yield span
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        _current_log_span.reset(token)
+        logger.debug(
+            name,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            events=span.events or None,
+            error=error,
+            **span.attributes,
+        )
+
+
+def add_span_event(name: str, **attributes: AttributeValue) -> None:
+    """Record an event on the current span.
+
+    Outside any span, the structlog fallback logs the event on its own.
+
+    Args:
+        name: Event name
+        **attributes: Event attributes
+    """
+    if _otel_enabled():
+        trace.get_current_span().add_event(name, attributes)
+        return
+
+    span = _current_log_span.get()
+    if span is not None:
+        span.add_event(name, attributes)
+    else:
+        logger.debug(name, **attributes)
@@ -20,9 +20,21 @@ from financial_agent.models.financial_data import (
 from financial_agent.models.evaluation import AccountConsistency, EvaluationResult
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def _pil_plugins_loaded() -> None:
+    """Register PIL's format plugins once, so no single test pays for it."""
+    from PIL import Image
+
+    Image.init()
+
+
+@pytest.fixture(scope="session")
 def mock_settings() -> Settings:
-    """Create mock settings for testing."""
+    """Create mock settings for testing.
+
+    Session-scoped so the environment is parsed and validated once; tests
+    must not mutate the returned instance.
+    """
     with patch.dict(os.environ, {
         "FA_ANTHROPIC_API_KEY": "test-api-key",
         "FA_LLM_MODEL": "claude-sonnet-4-20250514",
@@ -1,5 +1,6 @@
 """Integration tests for the pipeline."""
 
+import threading
 from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -8,13 +9,17 @@ import pytest
 from PIL import Image
 
 from financial_agent.config.constants import DocumentType, CurrencyConfidence
+from financial_agent.config.constants import FileType
 from financial_agent.config.settings import Settings
+from financial_agent.models.document import DocumentInput, DocumentPage
 from financial_agent.models.financial_data import Balance, Balances, FinancialData, StatementPeriod
 from financial_agent.pipeline.base import PipelineContext
+from financial_agent.pipeline.orchestrator import PipelineOrchestrator
 from financial_agent.pipeline.stages.classifier import ClassifierStage
 from financial_agent.pipeline.stages.currency_converter import CurrencyConverterStage
 from financial_agent.pipeline.stages.evaluator import EvaluatorStage
 from financial_agent.pipeline.stages.extractor import ExtractorStage
+from financial_agent.pipeline.stages.ocr_processor import OCRProcessorStage
 
 
 class TestClassifierStage:
@@ -36,6 +41,66 @@ class TestClassifierStage:
         assert result.financial_data.document_type == DocumentType.BANK_STATEMENT
 
 
+class TestOCRProcessorStage:
+    """Tests for OCRProcessorStage."""
+
+    @staticmethod
+    def _document_with_text_layer(native_text: str) -> DocumentInput:
+        """Build a two-page document whose first page has a text layer."""
+        pages = [
+            DocumentPage(
+                page_number=1, image_data=b"page1", width=10, height=10,
+                mime_type="image/png", native_text=native_text,
+            ),
+            DocumentPage(
+                page_number=2, image_data=b"page2", width=10, height=10,
+                mime_type="image/png", native_text="",
+            ),
+        ]
+        return DocumentInput(
+            file_path="/test/document.pdf",
+            file_type=FileType.PDF,
+            file_size_bytes=100,
+            pages=pages,
+            original_filename="document.pdf",
+        )
+
+    def test_text_layer_pages_skip_ocr(self, mock_settings: Settings, mock_llm_service: MagicMock):
+        """Test that pages with a rich PDF text layer are not sent to OCR when opted in."""
+        settings = mock_settings.model_copy(update={"ocr_native_text_threshold": 200})
+        stage = OCRProcessorStage(settings, mock_llm_service)
+        stage.ocr_service = MagicMock()
+        stage.ocr_service.extract_pages.return_value = ["Scanned page text"]
+
+        native_text = "Closing Balance EUR 15000 " * 20
+        context = PipelineContext(file_path="/test/document.pdf", settings=settings)
+        context.document = self._document_with_text_layer(native_text)
+
+        result = stage.process(context)
+
+        stage.ocr_service.extract_pages.assert_called_once_with([(b"page2", "image/png")])
+        assert result.extracted_text == (
+            f"--- Page 1 ---\n{native_text}\n\n--- Page 2 ---\nScanned page text"
+        )
+        assert result.stage_results["ocr_processor"]["native_text_pages"] == 1
+
+    def test_text_layer_ignored_by_default(self, mock_settings: Settings, mock_llm_service: MagicMock):
+        """Test that every page is OCRed unless the text-layer bypass is enabled."""
+        stage = OCRProcessorStage(mock_settings, mock_llm_service)
+        stage.ocr_service = MagicMock()
+        stage.ocr_service.extract_pages.return_value = ["Scanned 1", "Scanned 2"]
+
+        context = PipelineContext(file_path="/test/document.pdf", settings=mock_settings)
+        context.document = self._document_with_text_layer("Closing Balance EUR 15000 " * 20)
+
+        result = stage.process(context)
+
+        stage.ocr_service.extract_pages.assert_called_once_with(
+            [(b"page1", "image/png"), (b"page2", "image/png")]
+        )
+        assert result.stage_results["ocr_processor"]["native_text_pages"] == 0
+
+
 class TestCurrencyConverterStage:
     """Tests for CurrencyConverterStage."""
 
@@ -218,3 +283,47 @@ class TestEvaluatorStage:
         assert result.analysis_result.account_consistency is not None
         # Should have few or no flags for complete data
         assert len(result.analysis_result.account_consistency.flags) <= 1
+
+
+class TestPipelineOrchestrator:
+    """Tests for PipelineOrchestrator."""
+
+    def test_concurrent_runs_share_exchange_client(
+        self, mock_settings: Settings, sample_analysis_result
+    ):
+        """Test that overlapping runs on one orchestrator keep the shared client open."""
+        orchestrator = PipelineOrchestrator(mock_settings)
+        barrier = threading.Barrier(2, timeout=5)
+        clients = []
+
+        def execute(context):
+            barrier.wait()
+            clients.append(orchestrator.exchange_service.client)
+            # Both runs hold the client before either finishes
+            barrier.wait()
+            context.analysis_result = sample_analysis_result
+            return context
+
+        stage = MagicMock()
+        stage.name = "FakeStage"
+        stage.execute.side_effect = execute
+        orchestrator.stages = [stage]
+
+        threads = [
+            threading.Thread(target=orchestrator.process, args=(f"/test/doc{i}.pdf",))
+            for i in range(2)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        try:
+            assert len(clients) == 2
+            assert clients[0] is clients[1]
+            assert not clients[0].is_closed
+            assert orchestrator.exchange_service._client is clients[0]
+        finally:
+            orchestrator.close()
+
+        assert clients[0].is_closed
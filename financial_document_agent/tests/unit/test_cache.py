@@ -1,7 +1,6 @@
 """Unit tests for LLM cache."""
 
 import threading
-import time
 
 import pytest
 
@@ -22,10 +21,35 @@ class TestLLMCache:
 
         # Same inputs should produce same key
         assert key1 == key2
-        # Key should be a hex string (64 chars for SHA-256)
+        # Key should be a hex string (64 chars for a 256-bit digest)
         assert len(key1) == 64
         assert all(c in "0123456789abcdef" for c in key1)
 
+    def test_make_keyer_matches_generate_key(self):
+        """Test that a prebuilt keyer reproduces generate_key and can be reused."""
+        keyer = LLMCache.make_keyer("model", "prompt")
+
+        assert keyer(b"page one") == LLMCache.generate_key(b"page one", "model", "prompt")
+        assert keyer(b"page two") == LLMCache.generate_key(b"page two", "model", "prompt")
+        assert LLMCache.generate_key(b"", "ab", "c") != LLMCache.generate_key(b"", "a", "bc")
+
+    def test_generate_key_short(self):
+        """Test that short keys are 32 hex characters and distinct from full keys."""
+        key = LLMCache.generate_key_short(b"page", "model", "prompt")
+
+        assert len(key) == 32
+        assert key == LLMCache.make_keyer("model", "prompt", short=True)(b"page")
+        assert key != LLMCache.generate_key(b"page", "model", "prompt")[:32]
+        assert key != LLMCache.generate_key_short(b"page2", "model", "prompt")
+
+    def test_generate_keys_batch_matches_single(self):
+        """Test that batched key generation equals per-item keys, in order."""
+        items = [(bytes([i]) * 10_000, "model", "prompt") for i in range(6)]
+
+        assert LLMCache.generate_keys_batch(items) == [
+            LLMCache.generate_key(*item) for item in items
+        ]
+
     def test_generate_key_different_inputs(self):
         """Test that different inputs produce different keys."""
         image_bytes = b"test image data"
@@ -62,15 +86,16 @@ class TestLLMCache:
 
     def test_cache_expiration(self):
         """Test that cache entries expire after TTL."""
-        cache = LLMCache(max_size=100, ttl_seconds=1)
+        now = [0]
+        cache = LLMCache(max_size=100, ttl_seconds=1, clock=lambda: now[0])
         key = "test_key"
         value = "extracted text"
 
         cache.set(key, value)
         assert cache.get(key) == value
 
-        # Wait for expiration
-        time.sleep(1.1)
+        # Advance past expiration
+        now[0] += 1_100_000_000
 
         result = cache.get(key)
         assert result is None
@@ -113,6 +138,48 @@ class TestLLMCache:
         assert cache.get("key3") == "value3"
         assert cache.get("key4") == "value4"
 
+    def test_eviction_skips_recently_read(self):
+        """Test that a read moves an old entry out of the eviction position."""
+        cache = LLMCache(max_size=10, ttl_seconds=3600)
+
+        for i in range(10):
+            cache.set(f"key{i}", f"value{i}")
+
+        cache.get("key0")
+        cache.set("key10", "value10")
+
+        assert cache.get("key0") == "value0"
+        assert cache.get("key1") is None  # Least recently used
+        assert cache.size == 10
+
+    def test_admission_rejects_low_value_entry(self):
+        """Test that a small one-off entry cannot displace a frequently hit one."""
+        cache = LLMCache(max_size=2, ttl_seconds=3600)
+
+        cache.set("hot", "x" * 100)
+        cache.set("other", "y" * 100)
+        for _ in range(3):
+            cache.get("hot")
+            cache.get("other")
+
+        cache.set("cold", "z" * 10)
+
+        assert cache.get("cold") is None
+        assert cache.get("hot") == "x" * 100
+        assert cache.stats.rejections == 1
+        assert cache.stats.evictions == 0
+
+    def test_sharded_capacity_sums_to_max_size(self):
+        """Test that a striped cache never holds more than max_size entries."""
+        cache = LLMCache(max_size=100, ttl_seconds=3600)
+
+        for i in range(500):
+            cache.set(f"key{i}", f"value{i}")
+
+        assert len(cache._shards) > 1
+        assert sum(shard.max_size for shard in cache._shards) == 100
+        assert cache.size == 100
+
     def test_update_existing_key(self):
         """Test updating an existing cache entry."""
         cache = LLMCache(max_size=100, ttl_seconds=3600)
@@ -140,14 +207,15 @@ class TestLLMCache:
 
     def test_cleanup_expired(self):
         """Test cleanup of expired entries."""
-        cache = LLMCache(max_size=100, ttl_seconds=1)
+        now = [0]
+        cache = LLMCache(max_size=100, ttl_seconds=1, clock=lambda: now[0])
 
         cache.set("key1", "value1")
-        time.sleep(0.5)
+        now[0] += 500_000_000
         cache.set("key2", "value2")
 
         # key1 should be expired, key2 should still be valid
-        time.sleep(0.6)
+        now[0] += 600_000_000
 
         removed = cache.cleanup_expired()
 
@@ -155,6 +223,15 @@ class TestLLMCache:
         assert cache.get("key1") is None
         assert cache.get("key2") == "value2"
 
+    def test_expiry_heap_stays_bounded(self):
+        """Test that replaced keys do not grow the expiry heap without bound."""
+        cache = LLMCache(max_size=10, ttl_seconds=3600)
+
+        for i in range(1000):
+            cache.set(f"key{i % 3}", f"value{i}")
+
+        assert len(cache._shards[0].expiry_heap) <= 2 * 10 + 1
+
     def test_stats_hits_and_misses(self):
         """Test cache statistics for hits and misses."""
         cache = LLMCache(max_size=100, ttl_seconds=3600)
@@ -180,6 +257,26 @@ class TestLLMCache:
 
         assert cache.stats.evictions == 1
 
+    def test_stats_exact_under_concurrent_gets(self):
+        """Test that concurrent gets never lose hit or miss counts."""
+        cache = LLMCache(max_size=100, ttl_seconds=3600)
+        cache.set("shared", "value")
+
+        def reader():
+            for _ in range(2000):
+                cache.get("shared")
+                cache.get("missing")
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = cache.stats
+        assert stats.hits == stats.misses == 8000
+        assert stats.hit_rate == 0.5
+
     def test_thread_safety_concurrent_writes(self):
         """Test thread safety with concurrent writes."""
         cache = LLMCache(max_size=100, ttl_seconds=3600)
@@ -1,6 +1,7 @@
 """Unit tests for parallel OCR processing."""
 
 import os
+from functools import cache
 from unittest.mock import MagicMock, patch, call
 from io import BytesIO
 
@@ -8,19 +9,41 @@ import pytest
 from PIL import Image
 
 from financial_agent.config.settings import Settings
-from financial_agent.services.ocr_service import AnthropicVisionOCR, create_ocr_service
+from financial_agent.services.ocr_service import (
+    OCR_FAILED_MARKER,
+    AnthropicVisionOCR,
+    AutoOCR,
+    TesseractOCR,
+    create_ocr_service,
+    join_pages,
+)
+from financial_agent.utils.circuit_breaker import CircuitBreaker
 from financial_agent.utils.exceptions import OCRError
+from financial_agent.utils.ocr_cache import OCRDiskCache
 
 
-def create_test_image() -> tuple[bytes, str]:
-    """Create a test image for OCR testing."""
-    img = Image.new("RGB", (100, 100), color="white")
+@cache
+def create_test_image(shade: int = 255) -> tuple[bytes, str]:
+    """Create a test image for OCR testing; distinct shades give distinct pages.
+
+    Cached because the PNG encode dominates setup; the returned bytes are immutable.
+    """
+    img = Image.new("RGB", (100, 100), color=(shade, shade, shade))
     buffer = BytesIO()
     img.save(buffer, format="PNG")
     buffer.seek(0)
     return buffer.read(), "image/png"
 
 
+class TestJoinPages:
+    """Tests for combining per-page OCR text."""
+
+    def test_separators_between_pages_only(self):
+        """Test page headers and blank-line separators without a trailing one."""
+        assert join_pages(["a", "b"]) == "--- Page 1 ---\na\n\n--- Page 2 ---\nb"
+        assert join_pages([]) == ""
+
+
 class TestAnthropicVisionOCRParallel:
     """Tests for parallel OCR processing in AnthropicVisionOCR."""
 
@@ -45,7 +68,7 @@ class TestAnthropicVisionOCRParallel:
     def test_multiple_pages_parallel(self, mock_llm_service):
         """Test that multiple pages are processed in parallel."""
         ocr = AnthropicVisionOCR(mock_llm_service, max_workers=4)
-        images = [create_test_image() for _ in range(5)]
+        images = [create_test_image(i) for i in range(5)]
 
         result = ocr.extract_text_from_multiple(images)
 
@@ -68,7 +91,7 @@ class TestAnthropicVisionOCRParallel:
         mock_llm_service.extract_text_from_image.side_effect = side_effect
 
         ocr = AnthropicVisionOCR(mock_llm_service, max_workers=4)
-        images = [create_test_image() for _ in range(10)]
+        images = [create_test_image(i) for i in range(10)]
 
         result = ocr.extract_text_from_multiple(images)
 
@@ -95,7 +118,7 @@ class TestAnthropicVisionOCRParallel:
         mock_llm_service.extract_text_from_image.side_effect = side_effect
 
         ocr = AnthropicVisionOCR(mock_llm_service, max_workers=4)
-        images = [create_test_image() for _ in range(5)]
+        images = [create_test_image(i) for i in range(5)]
 
         result = ocr.extract_text_from_multiple(images)
 
@@ -105,6 +128,25 @@ class TestAnthropicVisionOCRParallel:
         successful_count = result.count("Text from call")
         assert successful_count == 4  # 5 - 1 failed
 
+    def test_auth_error_cancels_remaining_pages(self, mock_llm_service):
+        """Test that an invalid API key fails the document once instead of per page."""
+        import httpx
+        from anthropic import AuthenticationError
+
+        response = httpx.Response(
+            401, request=httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        )
+        mock_llm_service.extract_text_from_image.side_effect = AuthenticationError(
+            "invalid x-api-key", response=response, body=None
+        )
+        ocr = AnthropicVisionOCR(mock_llm_service, max_workers=1, max_workers_ceiling=1)
+        images = [create_test_image(i) for i in range(20)]
+
+        with pytest.raises(OCRError):
+            ocr.extract_pages(images)
+
+        assert mock_llm_service.extract_text_from_image.call_count < len(images)
+
     def test_empty_images_list(self, mock_llm_service):
         """Test handling of empty images list."""
         ocr = AnthropicVisionOCR(mock_llm_service, max_workers=4)
@@ -116,42 +158,240 @@ class TestAnthropicVisionOCRParallel:
 
     def test_max_workers_respected(self, mock_llm_service):
         """Test that max_workers parameter is stored correctly."""
-        ocr_2 = OpenAIVisionOCR(mock_llm_service, max_workers=2)
-        ocr_8 = OpenAIVisionOCR(mock_llm_service, max_workers=8)
+        ocr_2 = AnthropicVisionOCR(mock_llm_service, max_workers=2)
+        ocr_8 = AnthropicVisionOCR(mock_llm_service, max_workers=8)
 
         assert ocr_2.max_workers == 2
         assert ocr_8.max_workers == 8
 
+    def test_limits_shared_per_api_key(self):
+        """Test that instances on the same API key share one concurrency budget."""
+        first_llm, second_llm, other_llm = MagicMock(), MagicMock(), MagicMock()
+        first_llm.client.api_key = second_llm.client.api_key = "shared-key"
+        other_llm.client.api_key = "other-key"
+
+        first = AnthropicVisionOCR(first_llm, max_workers=2)
+        second = AnthropicVisionOCR(second_llm, max_workers=8)
+        other = AnthropicVisionOCR(other_llm, max_workers=2)
+
+        assert first._concurrency is second._concurrency
+        assert first._rate_limiter is second._rate_limiter
+        assert first._concurrency is not other._concurrency
+
+    def test_later_instances_may_only_tighten_shared_limits(self):
+        """Test that a stricter later instance tightens the shared limits, a looser one cannot."""
+        first_llm, second_llm, third_llm = MagicMock(), MagicMock(), MagicMock()
+        for llm in (first_llm, second_llm, third_llm):
+            llm.client.api_key = "tighten-key"
+
+        first = AnthropicVisionOCR(first_llm, max_workers=6, max_rps=10.0)
+        AnthropicVisionOCR(second_llm, max_workers=3, max_rps=2.0)
+        AnthropicVisionOCR(third_llm, max_workers=8, max_rps=None)
+
+        assert first._concurrency.max_limit == 3
+        assert first._concurrency.current_limit == 3
+        assert first._rate_limiter.min_interval == pytest.approx(0.5)
+
     def test_extract_single_page_success(self):
         """Test _extract_single_page helper method on success."""
         mock_llm = MagicMock()
         mock_llm.extract_text_from_image.return_value = "Success text"
-        ocr = OpenAIVisionOCR(mock_llm, max_workers=4)
+        ocr = AnthropicVisionOCR(mock_llm, max_workers=4)
         image_bytes, mime_type = create_test_image()
+        results = ["", ""]
 
-        page_index, text = ocr._extract_single_page(1, image_bytes, mime_type)
+        ocr._extract_single_page(results, 2, image_bytes, mime_type)
 
-        assert page_index == 1
-        assert text == "Success text"
+        assert results == ["", "Success text"]
 
     def test_extract_single_page_failure(self, mock_llm_service):
         """Test _extract_single_page helper method on failure."""
         mock_llm_service.extract_text_from_image.side_effect = OCRError("Test error")
         ocr = AnthropicVisionOCR(mock_llm_service, max_workers=4)
         image_bytes, mime_type = create_test_image()
+        results = [""]
+
+        ocr._extract_single_page(results, 1, image_bytes, mime_type)
+
+        assert results == ["[OCR FAILED]"]
+
+
+class TestAnthropicVisionOCRDeduplication:
+    """Tests for skipping repeated pages."""
+
+    def test_duplicate_pages_sent_once(self):
+        """Test that identical pages are OCR'd once and fanned back out in order."""
+        blank, cover = create_test_image(255), create_test_image(0)
+        labels = {blank[0]: "blank", cover[0]: "cover"}
+        mock_llm = MagicMock()
+        mock_llm.extract_text_from_image.side_effect = (
+            lambda b64, mime, image_bytes=None: labels[image_bytes]
+        )
+        ocr = AnthropicVisionOCR(mock_llm, max_workers=2)
+
+        texts = ocr.extract_pages([cover, blank, blank, cover, blank])
+
+        assert mock_llm.extract_text_from_image.call_count == 2
+        assert texts == ["cover", "blank", "blank", "cover", "blank"]
+
+
+class TestAnthropicVisionOCRBatch:
+    """Tests for Message Batches API OCR."""
+
+    def test_batched_pages_in_order(self):
+        """Test that pages are chunked into batches and kept in order."""
+        mock_llm = MagicMock()
+        mock_llm.extract_text_from_images_batch.side_effect = lambda prepared: [
+            f"Batch text {i}" for i in range(len(prepared))
+        ]
+        ocr = AnthropicVisionOCR(mock_llm, max_workers=2, batch_size=2)
+        images = [create_test_image(i) for i in range(3)]
+
+        result = ocr.extract_text_from_multiple(images)
+
+        assert mock_llm.extract_text_from_images_batch.call_count == 2
+        assert mock_llm.extract_text_from_image.call_count == 0
+        assert result.index("--- Page 1 ---") < result.index("--- Page 3 ---")
+        assert result.count("Batch text 0") == 2
+
+    def test_failed_batch_entries_retried_per_page(self):
+        """Test that pages failing inside a batch fall back to single requests."""
+        mock_llm = MagicMock()
+        mock_llm.extract_text_from_images_batch.return_value = ["Batch text", None]
+        mock_llm.extract_text_from_image.return_value = "Single text"
+        ocr = AnthropicVisionOCR(mock_llm, max_workers=2, batch_size=2)
+        images = [create_test_image(i) for i in range(2)]
+
+        result = ocr.extract_text_from_multiple(images)
+
+        assert "--- Page 1 ---\nBatch text" in result
+        assert "--- Page 2 ---\nSingle text" in result
+        assert mock_llm.extract_text_from_image.call_count == 1
+
+
+class TestAnthropicVisionOCRPreprocessing:
+    """Tests for memoized image preprocessing."""
+
+    def test_repeated_page_encoded_once(self):
+        """Test that identical page bytes are only resized and encoded once."""
+        mock_llm = MagicMock()
+        mock_llm.extract_text_from_image.return_value = "text"
+        ocr = AnthropicVisionOCR(mock_llm, max_workers=2)
+        image_bytes, mime_type = create_test_image()
+
+        with patch(
+            "financial_agent.utils.image_utils.encode_image_base64",
+            return_value=("b64", "image/jpeg"),
+        ) as encode:
+            ocr.extract_text(image_bytes, mime_type)
+            ocr.extract_text(image_bytes, mime_type)
+
+        assert encode.call_count == 1
+        assert mock_llm.extract_text_from_image.call_count == 2
+
+
+class TestAnthropicVisionOCRDiskCache:
+    """Tests for the persistent OCR result cache."""
+
+    def test_second_run_served_from_disk(self, tmp_path):
+        """Test that a new OCR instance reuses results cached by an earlier run."""
+        image_bytes, mime_type = create_test_image()
+        mock_llm = MagicMock()
+        mock_llm.model = "claude-test"
+        mock_llm.extract_text_from_image.return_value = "cached text"
+
+        first = AnthropicVisionOCR(mock_llm, disk_cache=OCRDiskCache(tmp_path))
+        second = AnthropicVisionOCR(mock_llm, disk_cache=OCRDiskCache(tmp_path))
+
+        assert first.extract_text(image_bytes, mime_type) == "cached text"
+        assert second.extract_text(image_bytes, mime_type) == "cached text"
+        assert mock_llm.extract_text_from_image.call_count == 1
+
+    def test_only_uncached_pages_submitted(self, tmp_path):
+        """Test that a multi-page run probes the cache first and OCRs only misses."""
+        images = [create_test_image(i) for i in range(4)]
+        mock_llm = MagicMock()
+        mock_llm.model = "claude-test"
+        mock_llm.extract_text_from_image.return_value = "page text"
+        cache = OCRDiskCache(tmp_path)
+
+        AnthropicVisionOCR(mock_llm, disk_cache=cache).extract_pages(images[:2])
+        texts = AnthropicVisionOCR(mock_llm, disk_cache=cache).extract_pages(images)
+
+        assert texts == ["page text"] * 4
+        assert mock_llm.extract_text_from_image.call_count == 4
+
+
+class TestTesseractOCRParallel:
+    """Tests for parallel Tesseract fallback."""
+
+    def test_pages_in_order_with_failure_marker(self):
+        """Test that pages run concurrently but keep page order and markers."""
+        with patch.dict("sys.modules", {"pytesseract": MagicMock()}):
+            ocr = TesseractOCR(max_workers=3)
+
+        def fake_extract(image_bytes, mime_type):
+            if image_bytes == b"bad":
+                raise OCRError("unreadable")
+            return image_bytes.decode()
 
-        page_index, text = ocr._extract_single_page(1, image_bytes, mime_type)
+        images = [(b"one", "image/png"), (b"bad", "image/png"), (b"three", "image/png")]
+        with patch.object(ocr, "extract_text", side_effect=fake_extract):
+            texts = ocr.extract_pages(images)
 
-        assert page_index == 1
-        assert text == "[OCR FAILED]"
+        assert texts == ["one", OCR_FAILED_MARKER, "three"]
+
+    def test_workers_capped_at_cpu_count(self):
+        """Test that the worker count never exceeds available CPUs."""
+        with patch.dict("sys.modules", {"pytesseract": MagicMock()}), patch(
+            "financial_agent.services.ocr_service.os.cpu_count", return_value=2
+        ):
+            ocr = TesseractOCR(max_workers=8)
+
+        assert ocr.max_workers == 2
+
+
+class TestAutoOCRCircuitBreaker:
+    """Tests for skipping Claude Vision during outages."""
+
+    def test_open_breaker_goes_straight_to_tesseract(self):
+        """Test that repeated Claude Vision failures stop further attempts."""
+        mock_llm = MagicMock()
+        mock_llm.extract_text_from_image.side_effect = OCRError("service unavailable")
+        ocr = AutoOCR(mock_llm, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        ocr._tesseract_ocr = MagicMock()
+        ocr._tesseract_ocr.extract_text.return_value = "tesseract text"
+        image_bytes, mime_type = create_test_image()
+
+        for _ in range(5):
+            assert ocr.extract_text(image_bytes, mime_type) == "tesseract text"
+
+        assert mock_llm.extract_text_from_image.call_count == 2
+        assert ocr._tesseract_ocr.extract_text.call_count == 5
+
+    def test_all_pages_failing_opens_breaker(self):
+        """Test that documents whose pages all come back failed count as failures."""
+        mock_llm = MagicMock()
+        mock_llm.extract_text_from_image.side_effect = OCRError("service unavailable")
+        ocr = AutoOCR(mock_llm, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        ocr._tesseract_ocr = MagicMock()
+        ocr._tesseract_ocr.extract_pages.return_value = ["tesseract text"] * 3
+        images = [create_test_image(shade) for shade in (10, 20, 30)]
+
+        for _ in range(2):
+            assert ocr.extract_pages(images) == [OCR_FAILED_MARKER] * 3
+
+        assert ocr.breaker.is_open
+        assert ocr.extract_pages(images) == ["tesseract text"] * 3
 
 
 class TestCreateOCRService:
     """Tests for OCR service factory function."""
 
-    @pytest.fixture
-    def mock_settings(self):
-        """Create mock settings for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_settings(cls):
+        """Create mock settings for testing (shared across the class)."""
         with patch.dict(os.environ, {
             "FA_ANTHROPIC_API_KEY": "test-api-key",
             "FA_LLM_MODEL": "claude-3-sonnet-20240229",
@@ -167,6 +407,13 @@ class TestCreateOCRService:
         assert hasattr(service, "max_workers")
         assert service.max_workers == 6
 
+    def test_factory_does_not_grow_concurrency_by_default(self, mock_settings):
+        """Test that adaptive concurrency stays at max_workers unless a ceiling is set."""
+        with patch("financial_agent.services.ocr_service.LLMService"):
+            service = create_ocr_service(mock_settings)
+
+        assert service._concurrency.max_limit == 6
+
     def test_factory_default_max_workers(self):
         """Test that factory uses default max_workers from settings."""
         with patch.dict(os.environ, {
@@ -31,16 +31,15 @@ class TestExchangeRateCache:
 
     def test_expiration(self):
         """Test cache expiration."""
-        import time
-
-        cache = ExchangeRateCache(ttl_seconds=1)
+        now = [0.0]
+        cache = ExchangeRateCache(ttl_seconds=1, clock=lambda: now[0])
         cache.set("USD", {"EUR": 1.0})
 
         # Should exist initially
         assert cache.get("USD") is not None
 
-        # Wait for expiration
-        time.sleep(1.1)
+        # Advance past expiration
+        now[0] += 1.1
 
         # Should be expired
         assert cache.get("USD") is None
@@ -87,6 +86,47 @@ class TestExchangeService:
             assert rate == 0.92
             assert amount == 92.0
 
+    def test_sources_share_target_fetch(self, exchange_service: ExchangeService):
+        """Test that different source currencies reuse one fetch for the target."""
+        eur_rates = {"USD": 1.08, "GBP": 0.86, "EUR": 1.0}
+        with patch.object(exchange_service, "_fetch_rates", return_value=eur_rates) as fetch:
+            usd_rate = exchange_service.get_rate("USD", "EUR")
+            gbp_rate = exchange_service.get_rate("GBP", "EUR")
+
+        fetch.assert_called_once_with("EUR")
+        assert abs(usd_rate - 1.0 / 1.08) < 1e-9
+        assert abs(gbp_rate - 1.0 / 0.86) < 1e-9
+
+    def test_rates_always_come_from_target_base(self, exchange_service: ExchangeService):
+        """Test that a cached source-base table never bypasses the target-base lookup."""
+        exchange_service.cache.set("USD", {"EUR": 0.5, "USD": 1.0})
+
+        with patch.object(exchange_service, "_fetch_rates", return_value={"EUR": 1.0, "USD": 1.25}):
+            assert exchange_service.get_rate("USD", "EUR") == pytest.approx(0.8)
+
+    def test_concurrent_fetches_coalesced(self, exchange_service: ExchangeService):
+        """Test that concurrent cache misses for one base share a single request."""
+        import threading
+
+        release = threading.Event()
+
+        def slow_fetch(base_currency: str) -> dict[str, float]:
+            release.wait(timeout=5)
+            return {"USD": 1.08, "EUR": 1.0}
+
+        with patch.object(exchange_service, "_fetch_rates", side_effect=slow_fetch) as fetch:
+            threads = [
+                threading.Thread(target=exchange_service.get_rate, args=("USD", "EUR"))
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            release.set()
+            for t in threads:
+                t.join()
+
+        assert fetch.call_count == 1
+
     def test_fallback_unknown_currency(self, exchange_service: ExchangeService):
         """Test fallback with unknown currency."""
         with pytest.raises(CurrencyConversionError):
@@ -107,6 +147,38 @@ class TestLLMService:
         result = service._extract_json(text)
         assert result == '{"key": "value"}'
 
+    def test_warmup_is_best_effort_and_runs_once(self, mock_settings: Settings):
+        """Test that warmup swallows errors and only sends one request."""
+        from financial_agent.services.llm_service import LLMService
+
+        service = LLMService(mock_settings)
+        service.client = MagicMock()
+        count_tokens = service.client.with_options.return_value.messages.count_tokens
+        count_tokens.side_effect = RuntimeError("offline")
+
+        service.warmup()
+        service.warmup()
+
+        assert count_tokens.call_count == 1
+
+    def test_batch_calls_keep_sdk_retries(self, mock_settings: Settings):
+        """Test that batch job calls, which no retry policy wraps, keep SDK retries."""
+        from financial_agent.services.llm_service import SDK_MAX_RETRIES, LLMService
+
+        service = LLMService(mock_settings)
+        service.client = MagicMock()
+        batches = service.client.with_options.return_value.messages.batches
+        batches.create.return_value = MagicMock(id="batch-1", processing_status="ended")
+        entry = MagicMock(custom_id="0")
+        entry.result.type = "succeeded"
+        entry.result.message.content = [MagicMock(text="page text")]
+        batches.results.return_value = [entry]
+
+        assert service.extract_text_from_images_batch([("aGVsbG8=", "image/png")]) == ["page text"]
+
+        service.client.with_options.assert_called_once_with(max_retries=SDK_MAX_RETRIES)
+        service.client.messages.batches.create.assert_not_called()
+
     def test_extract_json_plain(self, mock_settings: Settings):
         """Test extracting plain JSON."""
         from financial_agent.services.llm_service import LLMService
@@ -129,3 +201,33 @@ class TestLLMService:
         result = service._extract_json(text)
         assert '"outer"' in result
         assert '"inner"' in result
+
+    def test_extract_json_balanced_with_trailing_text(self, mock_settings: Settings):
+        """Test that extraction stops at the matching bracket."""
+        from financial_agent.services.llm_service import LLMService
+
+        with patch("anthropic.Anthropic"):
+            service = LLMService(mock_settings)
+
+        assert service._extract_json('Result: {"a": {"b": 1}} done {"c": 2}') == '{"a": {"b": 1}}'
+        assert service._extract_json("Pages: [1, [2, 3]] end") == "[1, [2, 3]]"
+
+    def test_structured_output_validates_json_directly(self, mock_settings: Settings):
+        """Test that structured output is parsed into the response model."""
+        from pydantic import BaseModel
+
+        from financial_agent.services.llm_service import LLMService
+
+        class Answer(BaseModel):
+            total: float
+            currency: str
+
+        service = LLMService(mock_settings)
+        service.client = MagicMock()
+        service.client.messages.create.return_value = MagicMock(
+            content=[MagicMock(text='```json\n{"total": 12.5, "currency": "EUR"}\n```')]
+        )
+
+        result = service.analyze_with_structured_output("text", "system", Answer)
+
+        assert result == Answer(total=12.5, currency="EUR")
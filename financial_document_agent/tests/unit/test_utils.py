@@ -1,10 +1,15 @@
 """Unit tests for utility functions."""
 
 import io
+import time
 
+import httpx
 import pytest
+from anthropic import AuthenticationError, RateLimitError
 from PIL import Image
 
+from financial_agent.utils.circuit_breaker import CircuitBreaker
+from financial_agent.utils.concurrency import AdaptiveConcurrencyController, RateLimiter
 from financial_agent.utils.exceptions import (
     ClassificationError,
     CurrencyConversionError,
@@ -19,6 +24,9 @@ from financial_agent.utils.image_utils import (
     image_to_bytes,
     resize_image_if_needed,
 )
+from financial_agent.utils.ocr_cache import OCRDiskCache
+from financial_agent.utils.retry import is_fatal_error, is_transient_error, retry_on_rate_limit
+from financial_agent.utils.tracing import add_span_event, start_span
 
 
 class TestExceptions:
@@ -61,15 +69,17 @@ class TestExceptions:
 class TestImageUtils:
     """Tests for image utilities."""
 
-    @pytest.fixture
-    def sample_image(self) -> Image.Image:
-        """Create a sample test image."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_image(cls) -> Image.Image:
+        """Create a sample test image (shared; tests must not mutate it)."""
         return Image.new("RGB", (100, 100), color="white")
 
-    @pytest.fixture
-    def large_image(self) -> Image.Image:
-        """Create a large test image."""
-        return Image.new("RGB", (4000, 3000), color="white")
+    @pytest.fixture(scope="class")
+    @classmethod
+    def large_image(cls) -> Image.Image:
+        """Create a test image just above the 2048px resize threshold (shared)."""
+        return Image.new("RGB", (2100, 2050), color="white")
 
     def test_resize_image_small(self, sample_image: Image.Image):
         """Test resizing small image (no change needed)."""
@@ -81,6 +91,23 @@ class TestImageUtils:
         result = resize_image_if_needed(large_image, max_dimension=2048)
         assert result.width <= 2048
         assert result.height <= 2048
+        assert large_image.size == (2100, 2050)
+
+    def test_resize_image_default_long_edge(self, large_image: Image.Image):
+        """Test that the default cap is the vision API's 1568px long edge."""
+        result = resize_image_if_needed(large_image)
+        assert max(result.size) == 1568
+
+    def test_encode_image_base64_downscales_palette_image(self):
+        """Test that JPEG encoding caps the long edge and handles palette images."""
+        import base64
+
+        image = Image.new("P", (3000, 2000))
+        base64_data, mime_type = encode_image_base64(image, max_dimension=1000)
+
+        decoded = Image.open(io.BytesIO(base64.b64decode(base64_data)))
+        assert mime_type == "image/jpeg"
+        assert decoded.size == (1000, 667)
 
     def test_encode_image_base64_png(self, sample_image: Image.Image):
         """Test encoding image to base64 PNG."""
@@ -107,9 +134,242 @@ class TestImageUtils:
         assert width == 100
         assert height == 100
 
+    def test_get_image_dimensions_jpeg_and_fallback(self):
+        """Test header-sniffed JPEG dimensions and the PIL fallback for other formats."""
+        image = Image.new("RGB", (123, 45), color="white")
+
+        assert get_image_dimensions(image_to_bytes(image, format="JPEG")) == (123, 45)
+        assert get_image_dimensions(image_to_bytes(image, format="GIF")) == (123, 45)
+
     def test_rgba_to_jpeg_conversion(self):
         """Test RGBA image conversion to JPEG."""
         rgba_image = Image.new("RGBA", (100, 100), color=(255, 0, 0, 128))
         base64_data, mime_type = encode_image_base64(rgba_image, format="JPEG")
         assert mime_type == "image/jpeg"
         assert len(base64_data) > 0
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_unlimited_does_not_wait(self):
+        """Test that a limiter without a rate never blocks."""
+        limiter = RateLimiter(None)
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.1
+
+    def test_enforces_min_interval(self):
+        """Test that calls are spaced by the minimum interval."""
+        limiter = RateLimiter(max_per_second=20)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        # First call is immediate, the remaining four wait 50ms each
+        assert time.monotonic() - start >= 0.19
+
+    def test_tighten_only_lowers_rate(self):
+        """Test that tightening keeps the stricter of the two rates."""
+        limiter = RateLimiter(max_per_second=10)
+        limiter.tighten(20)
+        assert limiter.min_interval == pytest.approx(0.1)
+        limiter.tighten(2)
+        assert limiter.min_interval == pytest.approx(0.5)
+
+
+class TestAdaptiveConcurrencyController:
+    """Tests for AdaptiveConcurrencyController."""
+
+    def test_halves_on_rate_limit(self):
+        """Test multiplicative decrease when throttled."""
+        controller = AdaptiveConcurrencyController(8)
+        controller.on_rate_limit()
+        assert controller.current_limit == 4
+        controller.on_rate_limit()
+        controller.on_rate_limit()
+        controller.on_rate_limit()
+        assert controller.current_limit == 1
+
+    def test_grows_after_successes_up_to_ceiling(self):
+        """Test additive increase bounded by max_limit."""
+        controller = AdaptiveConcurrencyController(2, max_limit=3, increase_every=2)
+        for _ in range(10):
+            controller.on_success(0.1)
+        assert controller.current_limit == 3
+        assert controller.rtt_ewma == pytest.approx(0.1)
+
+    def test_tighten_lowers_ceiling_and_current_limit(self):
+        """Test that tightening caps both the ceiling and the current limit."""
+        controller = AdaptiveConcurrencyController(6, max_limit=10)
+        controller.tighten(12)
+        assert controller.max_limit == 10
+        controller.tighten(4)
+        assert controller.max_limit == 4
+        assert controller.current_limit == 4
+
+    def test_limits_in_flight_calls(self):
+        """Test that acquire blocks beyond the current limit."""
+        import threading
+
+        controller = AdaptiveConcurrencyController(1)
+        controller.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            with controller:
+                acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(timeout=0.1)
+        controller.release()
+        assert acquired.wait(timeout=1)
+        thread.join()
+
+
+def _api_error(error_cls: type, status_code: int, headers: dict | None = None) -> Exception:
+    """Build an Anthropic API error with a fake HTTP response."""
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return error_cls("API error", response=response, body=None)
+
+
+class TestRetry:
+    """Tests for transient-error retry policy."""
+
+    def test_rate_limit_is_transient(self):
+        """Test that wrapped rate limit errors are classified as transient."""
+        try:
+            raise OCRError("OCR failed") from _api_error(RateLimitError, 429)
+        except OCRError as e:
+            assert is_transient_error(e)
+
+    def test_auth_error_is_not_transient(self):
+        """Test that authentication errors are not retried."""
+        assert not is_transient_error(_api_error(AuthenticationError, 401))
+
+    def test_wrapped_auth_error_is_fatal(self):
+        """Test that wrapped auth errors are fatal and rate limits are not."""
+        try:
+            raise OCRError("OCR failed") from _api_error(AuthenticationError, 401)
+        except OCRError as e:
+            assert is_fatal_error(e)
+        assert not is_fatal_error(_api_error(RateLimitError, 429))
+
+    def test_message_pattern_is_transient(self):
+        """Test that quota/throttle messages are classified as transient."""
+        assert is_transient_error(OCRError("Request throttled, quota exceeded"))
+
+    def test_retries_transient_then_succeeds(self):
+        """Test that transient errors are retried honoring Retry-After."""
+        calls = []
+
+        @retry_on_rate_limit(max_attempts=3, min_wait=0.01, max_wait=0.05)
+        def flaky() -> str:
+            calls.append(1)
+            if len(calls) < 3:
+                raise _api_error(RateLimitError, 429, headers={"retry-after": "0"})
+            return "ok"
+
+        assert flaky() == "ok"
+        assert len(calls) == 3
+
+    def test_non_transient_raises_immediately(self):
+        """Test that non-transient errors are not retried."""
+        calls = []
+
+        @retry_on_rate_limit(max_attempts=3, min_wait=0.01, max_wait=0.05)
+        def broken() -> str:
+            calls.append(1)
+            raise _api_error(AuthenticationError, 401)
+
+        with pytest.raises(AuthenticationError):
+            broken()
+        assert len(calls) == 1
+
+
+class TestOCRDiskCache:
+    """Tests for OCRDiskCache."""
+
+    def test_round_trip_persists_across_instances(self, tmp_path):
+        """Test that a stored value is readable by a fresh cache instance."""
+        OCRDiskCache(tmp_path).put("ab12", "page text")
+
+        assert OCRDiskCache(tmp_path).get("ab12") == "page text"
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_missing_key(self, tmp_path):
+        """Test that unknown keys are misses."""
+        assert OCRDiskCache(tmp_path).get("cd34") is None
+
+
+class TestTracing:
+    """Tests for the structlog tracing fallback."""
+
+    def test_span_logs_attributes_events_and_duration(self):
+        """Test that a fallback span is logged once with everything recorded on it."""
+        from structlog.testing import capture_logs
+
+        with capture_logs() as logs, start_span("ocr.page", **{"image.bytes": 10}) as span:
+            span.set_attribute("text.length", 4)
+            add_span_event("retry", attempt=1)
+
+        assert len(logs) == 1
+        assert logs[0]["event"] == "ocr.page"
+        assert logs[0]["image.bytes"] == 10
+        assert logs[0]["text.length"] == 4
+        assert logs[0]["events"] == ["retry"]
+        assert "duration_ms" in logs[0]
+
+    def test_span_records_error_type(self):
+        """Test that exceptions propagate and are recorded on the span."""
+        from structlog.testing import capture_logs
+
+        with capture_logs() as logs, pytest.raises(OCRError), start_span("ocr.page"):
+            raise OCRError("boom")
+
+        assert logs[0]["error"] == "OCRError"
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the breaker rejects calls once the threshold is reached."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+        assert breaker.is_open
+        assert not breaker.allow_request()
+
+    def test_half_open_admits_one_trial(self):
+        """Test that after the timeout a single trial decides the state."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_failure()
+        assert breaker.is_open
+
+        time.sleep(0.02)
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.allow_request()
+        assert breaker.allow_request()
+
+    def test_success_resets_failure_count(self):
+        """Test that failures must be consecutive to open the breaker."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert not breaker.is_open
@@ -4,8 +4,31 @@ Routes documents to specialized sub-agents (passport, financial, education)
 and generates unified analysis with cross-validation.
 """
 
-from master_orchestrator.pipeline.orchestrator import MasterOrchestrator
-from master_orchestrator.models.unified_result import MasterAnalysisResult
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from master_orchestrator.models.unified_result import MasterAnalysisResult
+    from master_orchestrator.pipeline.orchestrator import MasterOrchestrator
+
+# The orchestrator pulls in the whole pipeline, so the public names are
+# imported on first access rather than whenever a submodule is imported
+_LAZY_ATTRS = {
+    "MasterOrchestrator": "master_orchestrator.pipeline.orchestrator",
+    "MasterAnalysisResult": "master_orchestrator.models.unified_result",
+}
 
 __version__ = "0.1.0"
 __all__ = ["MasterOrchestrator", "MasterAnalysisResult"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public classes lazily."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,11 +1,35 @@
 """Adapters for sub-agents."""
 
-from master_orchestrator.adapters.passport_adapter import PassportAgentAdapter
-from master_orchestrator.adapters.financial_adapter import FinancialAgentAdapter
-from master_orchestrator.adapters.education_adapter import EducationAgentAdapter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from master_orchestrator.adapters.education_adapter import EducationAgentAdapter
+    from master_orchestrator.adapters.financial_adapter import FinancialAgentAdapter
+    from master_orchestrator.adapters.passport_adapter import PassportAgentAdapter
+
+# Each adapter is imported on first access, so importing one does not load
+# the other two
+_LAZY_ATTRS = {
+    "PassportAgentAdapter": "master_orchestrator.adapters.passport_adapter",
+    "FinancialAgentAdapter": "master_orchestrator.adapters.financial_adapter",
+    "EducationAgentAdapter": "master_orchestrator.adapters.education_adapter",
+}
 
 __all__ = [
     "PassportAgentAdapter",
     "FinancialAgentAdapter",
     "EducationAgentAdapter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import adapter classes lazily."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
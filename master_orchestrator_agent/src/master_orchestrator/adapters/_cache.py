@@ -0,0 +1,94 @@
+"""Bounded cache of sub-agent orchestrators shared across adapters."""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class OrchestratorCache:
+    """Least-recently-used cache of one sub-agent's orchestrators.
+
+    Adapters are created per dispatch, so sharing orchestrators keeps the
+    sub-agent's services (HTTP pools, caches, OCR engines) warm across batches.
+    Orchestrators that own network resources expose ``close()``; it is called
+    on eviction rather than after each run, because runs from concurrent
+    sessions overlap on one instance.
+    """
+
+    def __init__(
+        self,
+        api_key_env: str,
+        load_settings: Callable[[], Any],
+        maxsize: int = 4,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            api_key_env: Environment variable the sub-agent reads its API key from
+            load_settings: Builds the sub-agent's settings from the environment
+            maxsize: Number of orchestrators to keep before evicting the oldest
+        """
+        self.api_key_env = api_key_env
+        self.maxsize = maxsize
+        self._load_settings = load_settings
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        # Serializes lookups, which write the sub-agent's environment, so
+        # concurrent dispatches never construct the same orchestrator twice
+        self._lock = threading.Lock()
+
+    def get(self, api_key: str, key: Hashable, build: Callable[[Any], Any]) -> Any:
+        """Get the orchestrator for a configuration, building it on a miss.
+
+        The sub-agent settings are re-read on every lookup and form part of
+        the key, so an environment change builds a fresh orchestrator.
+
+        Args:
+            api_key: API key exported to the sub-agent's environment
+            key: Adapter arguments the orchestrator is built from
+            build: Factory called with the sub-agent settings on a miss
+
+        Returns:
+            Cached or newly built orchestrator
+        """
+        with self._lock:
+            # The sub-agent reads its key from the environment; only write on change
+            if os.environ.get(self.api_key_env) != api_key:
+                os.environ[self.api_key_env] = api_key
+            settings = self._load_settings()
+            full_key = (api_key, key, settings.model_dump_json())
+
+            orchestrator = self._entries.get(full_key)
+            if orchestrator is not None:
+                self._entries.move_to_end(full_key)
+                return orchestrator
+
+            orchestrator = build(settings)
+            self._entries[full_key] = orchestrator
+            if len(self._entries) > self.maxsize:
+                _, evicted = self._entries.popitem(last=False)
+                _close(evicted)
+            return orchestrator
+
+    def clear(self) -> None:
+        """Close and drop every cached orchestrator."""
+        with self._lock:
+            while self._entries:
+                _, orchestrator = self._entries.popitem(last=False)
+                _close(orchestrator)
+
+
+def _close(orchestrator: Any) -> None:
+    """Close an orchestrator if it owns resources, logging any failure."""
+    close = getattr(orchestrator, "close", None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception as e:
+        logger.warning("orchestrator_close_failed", error=str(e))
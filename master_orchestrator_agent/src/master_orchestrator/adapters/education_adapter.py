@@ -6,11 +6,61 @@ from typing import Any, Callable
 
 import structlog
 
+from master_orchestrator.adapters._cache import OrchestratorCache
 from master_orchestrator.config.settings import Settings
 from master_orchestrator.utils.exceptions import AgentDispatchError
+from master_orchestrator.utils.lazy import lazy_import
 
 logger = structlog.get_logger(__name__)
 
+# Sub-agent SDK modules, imported the first time this adapter initializes
+_education_settings = lazy_import("education_agent.config.settings")
+_education_pipeline = lazy_import("education_agent.pipeline.orchestrator")
+
+_orchestrators = OrchestratorCache("EA_ANTHROPIC_API_KEY", lambda: _education_settings.Settings())
+
+
+# Directory the process started in, so the working-directory candidate stays
+# stable even if the process later changes directory
+_LAUNCH_DIR = Path.cwd()
+# Application root inside the Docker image
+_DOCKER_ROOT = Path("/app")
+# Checkout root when running from source (src/master_orchestrator/adapters/);
+# None when installed somewhere shallower
+_SOURCE_PARENTS = Path(__file__).resolve().parents
+_PROJECT_ROOT = _SOURCE_PARENTS[4] if len(_SOURCE_PARENTS) > 4 else None
+_DEFAULT_GRADE_TABLE = Path(
+    "education_credential_agent", "data", "grade_tables", "default_conversion_table.json"
+)
+
+# Resolved default grade table; only set once the table has been found
+_default_grade_table: str | None = None
+
+
+def _default_grade_table_path() -> str | None:
+    """Locate the default grade conversion table.
+
+    A found path is remembered for the process. A miss is not, so a table
+    that appears later (e.g. a volume mounted after startup) is still picked up.
+
+    Returns:
+        Absolute path to the table, or None if it cannot be found
+    """
+    global _default_grade_table
+    if _default_grade_table is not None:
+        return _default_grade_table
+
+    # Try to locate default table relative to the launch directory, in /app
+    # (Docker), or relative to the project root (local development)
+    roots = [_LAUNCH_DIR, _DOCKER_ROOT, _PROJECT_ROOT]
+    possible_paths = [root / _DEFAULT_GRADE_TABLE for root in roots if root is not None]
+    for p in possible_paths:
+        if p.exists():
+            _default_grade_table = str(p)
+            logger.info("resolved_default_grade_table", path=_default_grade_table)
+            return _default_grade_table
+    return None
+
 
 class EducationAgentAdapter:
     """Adapter to wrap the education credential agent."""
@@ -33,18 +83,22 @@ class EducationAgentAdapter:
         if self._orchestrator is not None:
             return
 
-        try:
-            # Set environment variable for education agent
-            api_key = self._settings.get_education_api_key()
-            os.environ["EA_ANTHROPIC_API_KEY"] = api_key or ""
-
-            from education_agent.config.settings import Settings as EducationSettings
-            from education_agent.pipeline.orchestrator import PipelineOrchestrator
+        api_key = self._settings.get_education_api_key()
+        if not api_key:
+            raise AgentDispatchError(
+                "Missing education agent API key. "
+                "Set MO_EA_ANTHROPIC_API_KEY or ANTHROPIC_API_KEY.",
+                {"agent": "education"},
+            )
 
-            education_settings = EducationSettings()
-            self._orchestrator = PipelineOrchestrator(
-                settings=education_settings,
-                grade_table_path=grade_table_path,
+        try:
+            self._orchestrator = _orchestrators.get(
+                api_key,
+                grade_table_path,
+                lambda settings: _education_pipeline.PipelineOrchestrator(
+                    settings=settings,
+                    grade_table_path=grade_table_path,
+                ),
             )
 
             logger.info("education_agent_initialized")
@@ -80,18 +134,7 @@ class EducationAgentAdapter:
             AnalysisResult from the education agent
         """
         if grade_table_path is None:
-            # Try to locate default table relative to project root or in /app (Docker)
-            possible_paths = [
-                Path("education_credential_agent/data/grade_tables/default_conversion_table.json"),
-                Path("/app/education_credential_agent/data/grade_tables/default_conversion_table.json"),
-                # Local development path
-                Path(__file__).parent.parent.parent.parent.parent / "education_credential_agent" / "data" / "grade_tables" / "default_conversion_table.json"
-            ]
-            for p in possible_paths:
-                if p.exists():
-                    grade_table_path = str(p.absolute())
-                    logger.info("resolved_default_grade_table", path=grade_table_path)
-                    break
+            grade_table_path = _default_grade_table_path()
 
         self._ensure_initialized(grade_table_path)
 
@@ -99,21 +142,18 @@ class EducationAgentAdapter:
 
         try:
             # Convert paths to strings for the education agent
-            str_paths = [str(p) for p in file_paths]
+            str_paths = list(map(os.fspath, file_paths))
             result = self._orchestrator.process_files(
                 str_paths, 
                 evaluation_level=evaluation_level,
                 progress_callback=progress_callback
             )
 
+            highest = getattr(result, "highest_qualification", None)
             logger.info(
                 "education_processed",
                 file_count=len(file_paths),
-                highest_qual=getattr(
-                    getattr(result, "highest_qualification", None),
-                    "qualification_name",
-                    None,
-                ),
+                highest_qual=highest.qualification_name if highest is not None else None,
             )
             return result
 
@@ -147,43 +187,33 @@ class EducationAgentAdapter:
             AnalysisResult from the education agent
         """
         if grade_table_path is None:
-            # Try to locate default table relative to project root or in /app (Docker)
-            possible_paths = [
-                Path("education_credential_agent/data/grade_tables/default_conversion_table.json"),
-                Path("/app/education_credential_agent/data/grade_tables/default_conversion_table.json"),
-                # Local development path
-                Path(__file__).parent.parent.parent.parent.parent / "education_credential_agent" / "data" / "grade_tables" / "default_conversion_table.json"
-            ]
-            for p in possible_paths:
-                if p.exists():
-                    grade_table_path = str(p.absolute())
-                    logger.info("resolved_folder_default_grade_table", path=grade_table_path)
-                    break
+            grade_table_path = _default_grade_table_path()
 
         self._ensure_initialized(grade_table_path)
 
-        logger.info("processing_education_folder", folder=str(folder_path))
+        folder = os.fspath(folder_path)
+        logger.info("processing_education_folder", folder=folder)
 
         try:
             result = self._orchestrator.process_folder(
-                str(folder_path),
+                folder,
                 evaluation_level=evaluation_level,
                 progress_callback=progress_callback
             )
 
             logger.info(
                 "education_folder_processed",
-                folder=str(folder_path),
+                folder=folder,
             )
             return result
 
         except Exception as e:
             logger.error(
                 "education_folder_processing_error",
-                folder=str(folder_path),
+                folder=folder,
                 error=str(e),
             )
             raise AgentDispatchError(
                 f"Education agent folder processing failed: {str(e)}",
-                {"folder": str(folder_path), "error": str(e)},
+                {"folder": folder, "error": str(e)},
             )
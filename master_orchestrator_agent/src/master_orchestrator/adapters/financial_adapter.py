@@ -6,11 +6,19 @@ from typing import Any, Callable
 
 import structlog
 
+from master_orchestrator.adapters._cache import OrchestratorCache
 from master_orchestrator.config.settings import Settings
 from master_orchestrator.utils.exceptions import AgentDispatchError
+from master_orchestrator.utils.lazy import lazy_import
 
 logger = structlog.get_logger(__name__)
 
+# Sub-agent SDK modules, imported the first time this adapter initializes
+_financial_settings = lazy_import("financial_agent.config.settings")
+_financial_pipeline = lazy_import("financial_agent.pipeline.orchestrator")
+
+_orchestrators = OrchestratorCache("FA_ANTHROPIC_API_KEY", lambda: _financial_settings.Settings())
+
 
 class FinancialAgentAdapter:
     """Adapter to wrap the financial document agent."""
@@ -34,19 +42,24 @@ class FinancialAgentAdapter:
         if self._orchestrator is not None:
             return
 
+        api_key = self._settings.get_financial_api_key()
+        if not api_key:
+            raise AgentDispatchError(
+                "Missing financial agent API key. "
+                "Set MO_FA_ANTHROPIC_API_KEY or ANTHROPIC_API_KEY.",
+                {"agent": "financial"},
+            )
+
         try:
-            # Set environment variable for financial agent
-            api_key = self._settings.get_financial_api_key()
-            os.environ["FA_ANTHROPIC_API_KEY"] = api_key or ""
-
-            from financial_agent.config.settings import Settings as FinancialSettings
-            from financial_agent.pipeline.orchestrator import PipelineOrchestrator
-
-            financial_settings = FinancialSettings()
-            self._orchestrator = PipelineOrchestrator(
-                settings=financial_settings,
-                threshold_eur=threshold_eur or self._settings.financial_threshold_eur,
-                required_period_months=required_period_months,
+            threshold = threshold_eur or self._settings.financial_threshold_eur
+            self._orchestrator = _orchestrators.get(
+                api_key,
+                (threshold, required_period_months),
+                lambda settings: _financial_pipeline.PipelineOrchestrator(
+                    settings=settings,
+                    threshold_eur=threshold,
+                    required_period_months=required_period_months,
+                ),
             )
 
             logger.info("financial_agent_initialized")
@@ -83,20 +96,21 @@ class FinancialAgentAdapter:
         """
         self._ensure_initialized(threshold_eur, required_period_months)
 
-        logger.info("processing_financial", file=str(file_path))
+        file = os.fspath(file_path)
+        logger.info("processing_financial", file=file)
 
         try:
-            result = self._orchestrator.process(str(file_path), progress_callback=progress_callback)
+            result = self._orchestrator.process(file, progress_callback=progress_callback)
             logger.info(
                 "financial_processed",
-                file=str(file_path),
+                file=file,
                 document_type=getattr(result, "document_type", None),
             )
             return result
 
         except Exception as e:
-            logger.error("financial_processing_error", file=str(file_path), error=str(e))
+            logger.error("financial_processing_error", file=file, error=str(e))
             raise AgentDispatchError(
                 f"Financial agent processing failed: {str(e)}",
-                {"file": str(file_path), "error": str(e)},
+                {"file": file, "error": str(e)},
             )
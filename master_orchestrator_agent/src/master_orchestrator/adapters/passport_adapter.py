@@ -6,11 +6,19 @@ from typing import Any, Callable
 
 import structlog
 
+from master_orchestrator.adapters._cache import OrchestratorCache
 from master_orchestrator.config.settings import Settings
 from master_orchestrator.utils.exceptions import AgentDispatchError
+from master_orchestrator.utils.lazy import lazy_import
 
 logger = structlog.get_logger(__name__)
 
+# Sub-agent SDK modules, imported the first time this adapter initializes
+_passport_settings = lazy_import("passport_agent.config.settings")
+_passport_pipeline = lazy_import("passport_agent.pipeline.orchestrator")
+
+_orchestrators = OrchestratorCache("PA_ANTHROPIC_API_KEY", lambda: _passport_settings.Settings())
+
 
 class PassportAgentAdapter:
     """Adapter to wrap the passport analysis agent."""
@@ -29,22 +37,20 @@ class PassportAgentAdapter:
         if self._orchestrator is not None:
             return
 
+        api_key = self._settings.get_passport_api_key()
+        if not api_key:
+            raise AgentDispatchError(
+                "Missing passport agent API key. "
+                "Set MO_PA_ANTHROPIC_API_KEY or ANTHROPIC_API_KEY.",
+                {"agent": "passport"},
+            )
+
         try:
-            # Set environment variable for passport agent
-            api_key = self._settings.get_passport_api_key()
-            os.environ["PA_ANTHROPIC_API_KEY"] = api_key or ""
-            
-            # Diagnostic
-            key_preview = f"{api_key[:12]}...{api_key[-5:]}" if api_key else "EMPTY"
-            logger.error("ADAPTER_KEY_DIAGNOSTIC", key_preview=key_preview, key_len=len(api_key) if api_key else 0)
-
-            from passport_agent.config.settings import Settings as PassportSettings
-            from passport_agent.pipeline.orchestrator import PassportPipelineOrchestrator
-
-            passport_settings = PassportSettings()
-            logger.error("PASSPORT_SETTINGS_KEY", key_preview=f"{passport_settings.anthropic_api_key.get_secret_value()[:12]}..." if passport_settings.anthropic_api_key else "EMPTY")
-            
-            self._orchestrator = PassportPipelineOrchestrator(settings=passport_settings)
+            self._orchestrator = _orchestrators.get(
+                api_key,
+                (),
+                lambda settings: _passport_pipeline.PassportPipelineOrchestrator(settings=settings),
+            )
 
             logger.info("passport_agent_initialized")
 
@@ -72,20 +78,21 @@ class PassportAgentAdapter:
         """
         self._ensure_initialized()
 
-        logger.info("processing_passport", file=str(file_path))
+        file = os.fspath(file_path)
+        logger.info("processing_passport", file=file)
 
         try:
-            result = self._orchestrator.process(str(file_path), progress_callback=progress_callback)
+            result = self._orchestrator.process(file, progress_callback=progress_callback)
             logger.info(
                 "passport_processed",
-                file=str(file_path),
+                file=file,
                 accuracy_score=getattr(result, "accuracy_score", None),
             )
             return result
 
         except Exception as e:
-            logger.error("passport_processing_error", file=str(file_path), error=str(e))
+            logger.error("passport_processing_error", file=file, error=str(e))
             raise AgentDispatchError(
                 f"Passport agent processing failed: {str(e)}",
-                {"file": str(file_path), "error": str(e)},
+                {"file": file, "error": str(e)},
             )
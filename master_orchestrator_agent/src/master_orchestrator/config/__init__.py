@@ -1,6 +1,7 @@
 """Configuration module for Master Orchestrator Agent."""
 
-from master_orchestrator.config.settings import Settings
+from typing import TYPE_CHECKING, Any
+
 from master_orchestrator.config.constants import (
     DocumentCategory,
     ClassificationStrategy,
@@ -9,6 +10,15 @@ from master_orchestrator.config.constants import (
     FILENAME_PATTERNS,
 )
 
+if TYPE_CHECKING:
+    from master_orchestrator.config.settings import Settings
+
+# Settings pulls in pydantic-settings, so it is imported on first access
+# rather than whenever a constant is needed
+_LAZY_ATTRS = {
+    "Settings": "master_orchestrator.config.settings",
+}
+
 __all__ = [
     "Settings",
     "DocumentCategory",
@@ -17,3 +27,16 @@ __all__ = [
     "SUPPORTED_FILE_EXTENSIONS",
     "FILENAME_PATTERNS",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import settings lazily."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
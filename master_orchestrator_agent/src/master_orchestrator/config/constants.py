@@ -1,6 +1,7 @@
 """Constants and enums for Master Orchestrator Agent."""
 
 from enum import Enum
+from pathlib import Path
 
 
 class DocumentCategory(str, Enum):
@@ -45,17 +46,31 @@ class WorthinessStatus(str, Enum):
 
 
 # Supported file extensions
-SUPPORTED_FILE_EXTENSIONS = {".pdf", ".png", ".jpg", ".jpeg"}
+SUPPORTED_FILE_EXTENSIONS: frozenset[str] = frozenset({".pdf", ".png", ".jpg", ".jpeg"})
+
+
+def is_supported_file(path: Path) -> bool:
+    """Check whether a path has a supported extension (case-insensitive).
+
+    Args:
+        path: File path to check
+
+    Returns:
+        True if the extension is in SUPPORTED_FILE_EXTENSIONS
+    """
+    suffix = path.suffix
+    # Most names already use lowercase extensions, so try without lower() first
+    return suffix in SUPPORTED_FILE_EXTENSIONS or suffix.lower() in SUPPORTED_FILE_EXTENSIONS
 
 # Filename patterns for classification (case-insensitive)
-FILENAME_PATTERNS: dict[DocumentCategory, list[str]] = {
-    DocumentCategory.PASSPORT: [
+FILENAME_PATTERNS: dict[DocumentCategory, tuple[str, ...]] = {
+    DocumentCategory.PASSPORT: (
         "passport",
         "pp_",
         "id_card",
         "travel_document",
-    ],
-    DocumentCategory.FINANCIAL: [
+    ),
+    DocumentCategory.FINANCIAL: (
         "bank",
         "statement",
         "balance",
@@ -63,8 +78,8 @@ FILENAME_PATTERNS: dict[DocumentCategory, list[str]] = {
         "account",
         "certificate_of_balance",
         "bank_letter",
-    ],
-    DocumentCategory.EDUCATION: [
+    ),
+    DocumentCategory.EDUCATION: (
         "transcript",
         "degree",
         "diploma",
@@ -79,5 +94,29 @@ FILENAME_PATTERNS: dict[DocumentCategory, list[str]] = {
         "bachelor",
         "master",
         "phd",
-    ],
+    ),
 }
+
+# FILENAME_PATTERNS flattened in priority order (category order, then pattern
+# order), so matching is a single loop over plain substring checks
+_FILENAME_PATTERN_ORDER: tuple[tuple[str, DocumentCategory], ...] = tuple(
+    (pattern, category)
+    for category, patterns in FILENAME_PATTERNS.items()
+    for pattern in patterns
+)
+
+
+def match_filename_pattern(file_name: str) -> tuple[DocumentCategory, str] | None:
+    """Find the highest-priority filename pattern contained in a file name.
+
+    Args:
+        file_name: File name to classify (matched case-insensitively)
+
+    Returns:
+        Tuple of (category, matched pattern), or None if no pattern matches
+    """
+    name = file_name.lower()
+    for pattern, category in _FILENAME_PATTERN_ORDER:
+        if pattern in name:
+            return category, pattern
+    return None
@@ -1,5 +1,7 @@
 """Settings configuration for Master Orchestrator Agent."""
 
+from functools import lru_cache
+
 from pydantic import Field, AliasChoices
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -44,6 +46,7 @@ class Settings(BaseSettings):
     # crashes, set MO_ENABLE_PARALLEL_DISPATCH=false to use sequential processing.
     enable_parallel_dispatch: bool = False
     parallel_dispatch_timeout_seconds: int = 300
+    classification_max_workers: int = 4  # Concurrent LLM classification calls
     ocr_max_workers: int = 4
     pdf_render_workers: int = 4
 
@@ -63,3 +66,9 @@ class Settings(BaseSettings):
     def get_passport_api_key(self) -> str:
         """Get API key for passport agent."""
         return self.pa_anthropic_api_key or self.anthropic_api_key
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Get cached settings instance."""
+    return Settings()
@@ -3,33 +3,35 @@
 import argparse
 import json
 import logging
+import os
 import signal
 import sys
+from functools import cache
 from pathlib import Path
 
 import structlog
 
+from master_orchestrator.config.constants import ClassificationStrategy, OutputFormat
+
 
 def _setup_signal_handlers() -> None:
     """Configure signal handlers for graceful operation.
 
     SIGPIPE can occur during parallel execution when multiple threads write
     to stdout/stderr and the receiving pipe closes. This is common when
-    piping CLI output. We ignore SIGPIPE to prevent exit code 133.
+    piping CLI output. We ignore SIGPIPE so a closed pipe surfaces as
+    BrokenPipeError, which main() handles, instead of killing the process.
     """
-    # Ignore SIGPIPE to prevent broken pipe errors during parallel execution
-    # This is safe because we handle write errors in the logging system
+    # Ignore SIGPIPE; writes to a closed pipe then raise BrokenPipeError
     try:
-        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+        signal.signal(signal.SIGPIPE, signal.SIG_IGN)
     except (AttributeError, ValueError):
         # SIGPIPE doesn't exist on Windows, and signal handlers may not be
         # settable in some contexts (e.g., non-main threads)
         pass
 
-from master_orchestrator.config.settings import Settings
-from master_orchestrator.config.constants import OutputFormat, ClassificationStrategy
-from master_orchestrator.pipeline.orchestrator import MasterOrchestrator
-from master_orchestrator.utils.exceptions import MasterOrchestratorError
+
+logger = structlog.get_logger(__name__)
 
 
 def setup_logging(log_level: str) -> None:
@@ -40,31 +42,23 @@ def setup_logging(log_level: str) -> None:
     """
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
             structlog.dev.ConsoleRenderer(),
         ],
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, log_level.upper())),
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=structlog.PrintLoggerFactory(sys.stderr),
         cache_logger_on_first_use=True,
     )
 
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stderr,
-        level=getattr(logging, log_level.upper()),
-    )
-
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+@cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (constructed once per process)."""
     parser = argparse.ArgumentParser(
         description="Master Document Orchestrator Agent - Process and analyze documents",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -92,7 +86,7 @@ Examples:
     parser.add_argument(
         "--format", "-f",
         type=str,
-        choices=["json", "excel", "both"],
+        choices=[f.value for f in OutputFormat],
         default="both",
         help="Output format (default: both)",
     )
@@ -114,7 +108,7 @@ Examples:
     parser.add_argument(
         "--classification-strategy", "-c",
         type=str,
-        choices=["hybrid", "llm_only", "filename_only"],
+        choices=[s.value for s in ClassificationStrategy],
         default=None,
         help="Document classification strategy (default: hybrid)",
     )
@@ -144,7 +138,16 @@ Examples:
         help="Output result as JSON to stdout (useful for piping)",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+    """
+    return _build_parser().parse_args(argv)
 
 
 def main() -> int:
@@ -163,11 +166,16 @@ def main() -> int:
         log_level = "INFO"
 
     setup_logging(log_level)
-    logger = structlog.get_logger(__name__)
+
+    # Imported here so --help and argument errors don't load the pipeline
+    from master_orchestrator.config.settings import get_settings
+    from master_orchestrator.pipeline.orchestrator import MasterOrchestrator
+    from master_orchestrator.utils.exceptions import MasterOrchestratorError
 
     try:
-        # Load settings from environment
-        settings = Settings()
+        # Load settings from environment (parsed once per process); copy so the
+        # command-line overrides below don't leak into the cached instance
+        settings = get_settings().model_copy()
 
         # Override settings from command line
         if args.threshold is not None:
@@ -203,7 +211,7 @@ def main() -> int:
         # Output result
         if args.json_output:
             # Output raw JSON to stdout for piping
-            print(json.dumps(result.to_output_dict(), indent=2))
+            _write_json_stdout(result.to_output_dict())
         else:
             # Print summary to console
             _print_summary(result)
@@ -228,6 +236,13 @@ def main() -> int:
         _flush_streams()
         return 1
 
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into `head`). Point stdout at devnull
+        # so the interpreter's final flush doesn't raise a second time.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+
     except Exception as e:
         logger.exception("unexpected_error", error=str(e))
         if not args.quiet:
@@ -245,71 +260,82 @@ def _flush_streams() -> None:
         pass
 
 
+def _write_json_stdout(data: dict) -> None:
+    """Serialize data to indented JSON and write it to stdout as UTF-8 bytes."""
+    from pydantic_core import to_json
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(to_json(data, indent=2) + b"\n")
+
+
 def _print_summary(result) -> None:
     """Print a human-readable summary of results."""
-    print("\n" + "=" * 60)
-    print("DOCUMENT ANALYSIS SUMMARY")
-    print("=" * 60)
+    lines: list[str] = []
+    lines.append("\n" + "=" * 60)
+    lines.append("DOCUMENT ANALYSIS SUMMARY")
+    lines.append("=" * 60)
 
     # Passport summary
-    print("\n📘 PASSPORT")
+    lines.append("\n📘 PASSPORT")
     if result.passport_details:
         pd = result.passport_details
-        print(f"   Name: {pd.full_name or 'N/A'}")
-        print(f"   DOB: {pd.date_of_birth or 'N/A'}")
-        print(f"   Passport: {pd.passport_number or 'N/A'}")
-        print(f"   Accuracy: {pd.accuracy_score}%")
+        lines.append(f"   Name: {pd.full_name or 'N/A'}")
+        lines.append(f"   DOB: {pd.date_of_birth or 'N/A'}")
+        lines.append(f"   Passport: {pd.passport_number or 'N/A'}")
+        lines.append(f"   Accuracy: {pd.accuracy_score}%")
     else:
-        print("   Not processed")
+        lines.append("   Not processed")
 
     # Education summary
-    print("\n📗 EDUCATION")
+    lines.append("\n📗 EDUCATION")
     if result.education_summary:
         ed = result.education_summary
-        print(f"   Qualification: {ed.highest_qualification or 'N/A'}")
-        print(f"   Institution: {ed.institution or 'N/A'}")
-        print(f"   French Grade: {ed.french_equivalent_grade_0_20 or 'N/A'}/20")
-        print(f"   Status: {ed.validation_status.value}")
+        lines.append(f"   Qualification: {ed.highest_qualification or 'N/A'}")
+        lines.append(f"   Institution: {ed.institution or 'N/A'}")
+        lines.append(f"   French Grade: {ed.french_equivalent_grade_0_20 or 'N/A'}/20")
+        lines.append(f"   Status: {ed.validation_status.value}")
     else:
-        print("   Not processed")
+        lines.append("   Not processed")
 
     # Financial summary
-    print("\n📙 FINANCIAL")
+    lines.append("\n📙 FINANCIAL")
     if result.financial_summary:
         fs = result.financial_summary
-        print(f"   Document Type: {fs.document_type or 'N/A'}")
-        print(f"   Amount: {fs.amount_original} {fs.base_currency or ''}")
-        print(f"   Amount EUR: {fs.amount_eur or 'N/A'}")
-        print(f"   Threshold: {fs.financial_threshold_eur} EUR")
-        print(f"   Status: {fs.worthiness_status.value}")
+        lines.append(f"   Document Type: {fs.document_type or 'N/A'}")
+        lines.append(f"   Amount: {fs.amount_original} {fs.base_currency or ''}")
+        lines.append(f"   Amount EUR: {fs.amount_eur or 'N/A'}")
+        lines.append(f"   Threshold: {fs.financial_threshold_eur} EUR")
+        lines.append(f"   Status: {fs.worthiness_status.value}")
     else:
-        print("   Not processed")
+        lines.append("   Not processed")
 
     # Cross-validation summary
-    print("\n🔍 CROSS-VALIDATION")
+    lines.append("\n🔍 CROSS-VALIDATION")
     if result.cross_validation:
         cv = result.cross_validation
         name_status = "✓" if cv.name_match else ("✗" if cv.name_match is False else "?")
         dob_status = "✓" if cv.dob_match else ("✗" if cv.dob_match is False else "?")
-        print(f"   Name Match: {name_status}")
-        print(f"   DOB Match: {dob_status}")
+        lines.append(f"   Name Match: {name_status}")
+        lines.append(f"   DOB Match: {dob_status}")
         if cv.remarks:
-            print(f"   Remarks: {cv.remarks}")
+            lines.append(f"   Remarks: {cv.remarks}")
     else:
-        print("   Not performed")
+        lines.append("   Not performed")
 
     # Metadata
     if result.metadata:
-        print("\n📊 PROCESSING INFO")
-        print(f"   Documents: {result.metadata.total_documents_scanned}")
+        lines.append("\n📊 PROCESSING INFO")
+        lines.append(f"   Documents: {result.metadata.total_documents_scanned}")
         if result.metadata.processing_time_seconds:
-            print(f"   Duration: {result.metadata.processing_time_seconds:.2f}s")
+            lines.append(f"   Duration: {result.metadata.processing_time_seconds:.2f}s")
         if result.metadata.processing_errors:
-            print(f"   Errors: {len(result.metadata.processing_errors)}")
+            lines.append(f"   Errors: {len(result.metadata.processing_errors)}")
         if result.metadata.processing_warnings:
-            print(f"   Warnings: {len(result.metadata.processing_warnings)}")
+            lines.append(f"   Warnings: {len(result.metadata.processing_warnings)}")
+
+    lines.append("\n" + "=" * 60)
 
-    print("\n" + "=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
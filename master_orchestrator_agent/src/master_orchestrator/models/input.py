@@ -1,7 +1,8 @@
 """Input models for Master Orchestrator Agent."""
 
+import os
 from pathlib import Path
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field
 
 from master_orchestrator.config.constants import DocumentCategory
 
@@ -17,7 +18,6 @@ class DocumentInfo(BaseModel):
     classification_confidence: float = 0.0
     classification_method: str = ""  # "filename" or "llm"
 
-    @computed_field
     @property
     def is_classified(self) -> bool:
         """Check if document has been classified."""
@@ -33,6 +33,17 @@ class DocumentInfo(BaseModel):
             file_size_bytes=path.stat().st_size,
         )
 
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry) -> "DocumentInfo":
+        """Create DocumentInfo from an os.scandir entry, reusing its cached stat."""
+        path = Path(entry.path)
+        return cls(
+            file_path=path,
+            file_name=entry.name,
+            file_extension=path.suffix.lower(),
+            file_size_bytes=entry.stat().st_size,
+        )
+
 
 class ClassificationResult(BaseModel):
     """Result of document classification."""
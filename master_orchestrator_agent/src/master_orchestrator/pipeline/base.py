@@ -17,7 +17,7 @@ from master_orchestrator.models.unified_result import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class MasterPipelineContext:
     """Context passed through all pipeline stages."""
 
@@ -74,11 +74,12 @@ class MasterPipelineContext:
                 "unknown": len(self.document_batch.unknown_documents),
             }
 
+        # Pydantic validation builds new lists, so no explicit copies are needed
         return ProcessingMetadata(
             total_documents_scanned=len(self.scanned_documents),
             documents_by_category=documents_by_category,
-            processing_errors=self.errors.copy(),
-            processing_warnings=self.warnings.copy(),
+            processing_errors=self.errors,
+            processing_warnings=self.warnings,
             processing_time_seconds=self.processing_time_seconds,
         )
 
@@ -1,11 +1,12 @@
 """Master Orchestrator - Main entry point for document processing."""
 
 import time
+from functools import partial
 from pathlib import Path
 
 import structlog
 
-from master_orchestrator.config.settings import Settings
+from master_orchestrator.config.settings import Settings, get_settings
 from master_orchestrator.config.constants import OutputFormat
 from master_orchestrator.models.unified_result import MasterAnalysisResult
 from master_orchestrator.pipeline.base import MasterPipelineContext, MasterPipelineStage
@@ -36,11 +37,12 @@ class MasterOrchestrator:
         """Initialize the master orchestrator.
 
         Args:
-            settings: Configuration settings. If None, loads from environment.
+            settings: Configuration settings. If None, uses the cached settings
+                loaded from the environment.
             llm_service: LLM service for classification. If None, created lazily.
             progress_callback: Optional callback for progress updates.
         """
-        self._settings = settings or Settings()
+        self._settings = settings or get_settings()
         self._llm_service = llm_service
         self._progress_callback = progress_callback
         self._stages: list[MasterPipelineStage] = []
@@ -129,15 +131,15 @@ class MasterOrchestrator:
         total_stages = len(self._stages)
         try:
             for i, stage in enumerate(self._stages):
-                # Create a bound progress callback for this stage
-                def stage_progress_callback(**kwargs):
-                    self._emit_progress(
-                        stage_name=stage.name,
-                        stage_index=i,
-                        total_stages=total_stages,
-                        **kwargs
-                    )
-                
+                # Bind this stage's position now; a closure would read the loop
+                # variables late if the stage called back after they advanced
+                stage_progress_callback = partial(
+                    self._emit_progress,
+                    stage_name=stage.name,
+                    stage_index=i,
+                    total_stages=total_stages,
+                )
+
                 # Inject callback into stage if it supports it
                 if hasattr(stage, "set_progress_callback"):
                     stage.set_progress_callback(stage_progress_callback)
@@ -1,5 +1,6 @@
 """Agent Dispatcher Stage - Routes documents to appropriate sub-agents."""
 
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from typing import Callable
 
@@ -83,10 +84,21 @@ class AgentDispatcherStage(MasterPipelineStage):
         context: MasterPipelineContext, 
         agent_name: str, 
         doc_name: str | None,
-        processed_count: int
+        processed_count: int,
+        cancel_event: threading.Event | None = None,
     ) -> Callable[[str, int, int], None]:
-        """Create a callback for sub-agents to report their internal progress."""
+        """Create a callback for sub-agents to report their internal progress.
+
+        Sub-agents invoke the callback before each of their stages, so it doubles
+        as a cancellation point: once ``cancel_event`` is set, the next call raises
+        and the sub-agent stops instead of running its remaining OCR/LLM stages.
+        """
         def sub_callback(sub_stage: str, current: int, total: int):
+            if cancel_event is not None and cancel_event.is_set():
+                raise AgentDispatchError(
+                    f"{agent_name.capitalize()} agent cancelled after dispatch timeout",
+                    {"agent": agent_name, "stage": sub_stage},
+                )
             self._emit_dispatch_progress(
                 context=context,
                 message=f"{agent_name.capitalize()} - {sub_stage} ({current}/{total})",
@@ -147,14 +159,17 @@ class AgentDispatcherStage(MasterPipelineStage):
         # Build list of tasks to execute
         tasks: list[tuple[str, Callable[[], object | None]]] = []
 
+        # Set on timeout so agents still running stop at their next stage boundary
+        cancel_event = threading.Event()
+
         if context.document_batch.passport_documents:
-            tasks.append(("passport", lambda: self._process_passport(context)))
+            tasks.append(("passport", lambda: self._process_passport(context, cancel_event)))
 
         if context.document_batch.financial_documents:
-            tasks.append(("financial", lambda: self._process_financial(context)))
+            tasks.append(("financial", lambda: self._process_financial(context, cancel_event)))
 
         if context.document_batch.education_documents:
-            tasks.append(("education", lambda: self._process_education(context)))
+            tasks.append(("education", lambda: self._process_education(context, cancel_event)))
 
         if not tasks:
             logger.warning("No documents to process")
@@ -169,59 +184,66 @@ class AgentDispatcherStage(MasterPipelineStage):
         # Execute tasks in parallel
         results: dict[str, object | None] = {}
 
-        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
-            futures = {
-                executor.submit(task_fn): agent_name
-                for agent_name, task_fn in tasks
-            }
-
-            try:
-                for future in as_completed(
-                    futures,
-                    timeout=context.settings.parallel_dispatch_timeout_seconds,
-                ):
-                    agent_name = futures[future]
-                    try:
-                        result = future.result()
-                        results[agent_name] = result
-                        
-                        # Emit progress on agent completion
-                        # total_docs = total agents being processed in parallel here
-                        # processed_count = number of completed agents
-                        processed_agents = len(results)
-                        self._emit_dispatch_progress(
-                            context,
-                            f"Agent {agent_name} completed processing",
-                            agent_name,
-                            None, # No specific doc name in parallel summary
-                            processed_agents
-                        )
-                        
-                        logger.info(
-                            "agent_completed",
-                            agent=agent_name,
-                            success=result is not None,
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "agent_failed",
-                            agent=agent_name,
-                            error=str(e),
-                        )
-                        context.add_error(f"{agent_name.capitalize()} agent failed: {str(e)}")
-                        results[agent_name] = None
-
-            except FuturesTimeoutError:
-                logger.error(
-                    "parallel_dispatch_timeout",
-                    timeout_seconds=context.settings.parallel_dispatch_timeout_seconds,
-                )
-                context.add_error(
-                    f"Agent dispatch timed out after {context.settings.parallel_dispatch_timeout_seconds}s"
-                )
-                # Cancel remaining futures
-                for future in futures:
-                    future.cancel()
+        # One worker per agent, so no agent queues behind another dispatch's
+        # work and eats into this dispatch's timeout
+        executor = ThreadPoolExecutor(
+            max_workers=len(tasks), thread_name_prefix="agent-dispatch"
+        )
+        futures = {
+            executor.submit(task_fn): agent_name
+            for agent_name, task_fn in tasks
+        }
+
+        try:
+            for future in as_completed(
+                futures,
+                timeout=context.settings.parallel_dispatch_timeout_seconds,
+            ):
+                agent_name = futures[future]
+                try:
+                    result = future.result()
+                    results[agent_name] = result
+                    
+                    # Emit progress on agent completion
+                    # total_docs = total agents being processed in parallel here
+                    # processed_count = number of completed agents
+                    processed_agents = len(results)
+                    self._emit_dispatch_progress(
+                        context,
+                        f"Agent {agent_name} completed processing",
+                        agent_name,
+                        None, # No specific doc name in parallel summary
+                        processed_agents
+                    )
+                    
+                    logger.info(
+                        "agent_completed",
+                        agent=agent_name,
+                        success=result is not None,
+                    )
+                except Exception as e:
+                    logger.error(
+                        "agent_failed",
+                        agent=agent_name,
+                        error=str(e),
+                    )
+                    context.add_error(f"{agent_name.capitalize()} agent failed: {str(e)}")
+                    results[agent_name] = None
+
+        except FuturesTimeoutError:
+            logger.error(
+                "parallel_dispatch_timeout",
+                timeout_seconds=context.settings.parallel_dispatch_timeout_seconds,
+            )
+            context.add_error(
+                f"Agent dispatch timed out after {context.settings.parallel_dispatch_timeout_seconds}s"
+            )
+            # Agents still running stop at their next stage boundary
+            cancel_event.set()
+
+        finally:
+            # Return without joining agents that are still running after a timeout
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # Assign results to context
         context.passport_raw_result = results.get("passport")
@@ -239,7 +261,11 @@ class AgentDispatcherStage(MasterPipelineStage):
         if self._education_adapter is None:
             self._education_adapter = EducationAgentAdapter(context.settings)
 
-    def _process_passport(self, context: MasterPipelineContext) -> object | None:
+    def _process_passport(
+        self,
+        context: MasterPipelineContext,
+        cancel_event: threading.Event | None = None,
+    ) -> object | None:
         """Process passport documents through passport agent."""
         assert context.document_batch is not None
         assert self._passport_adapter is not None
@@ -252,7 +278,9 @@ class AgentDispatcherStage(MasterPipelineStage):
             first_doc = docs[0]
             
             # Create sub-callback for granular progress
-            sub_cb = self._create_sub_callback(context, "passport", first_doc.file_name, 0)
+            sub_cb = self._create_sub_callback(
+                context, "passport", first_doc.file_name, 0, cancel_event
+            )
             
             result = self._passport_adapter.process(first_doc.file_path, progress_callback=sub_cb)
 
@@ -270,12 +298,20 @@ class AgentDispatcherStage(MasterPipelineStage):
             return result
 
         except Exception as e:
+            if cancel_event is not None and cancel_event.is_set():
+                # The dispatch already timed out and recorded the failure
+                logger.info("passport_agent_cancelled")
+                return None
             error_msg = f"Passport agent failed: {str(e)}"
             logger.error("passport_agent_error", error=str(e))
             context.add_error(error_msg)
             return None
 
-    def _process_financial(self, context: MasterPipelineContext) -> object | None:
+    def _process_financial(
+        self,
+        context: MasterPipelineContext,
+        cancel_event: threading.Event | None = None,
+    ) -> object | None:
         """Process financial documents through financial agent."""
         assert context.document_batch is not None
         assert self._financial_adapter is not None
@@ -289,7 +325,9 @@ class AgentDispatcherStage(MasterPipelineStage):
             
             # Count already processed (e.g. passport)
             processed_count = 1 if context.document_batch.passport_documents else 0
-            sub_cb = self._create_sub_callback(context, "financial", first_doc.file_name, processed_count)
+            sub_cb = self._create_sub_callback(
+                context, "financial", first_doc.file_name, processed_count, cancel_event
+            )
             
             result = self._financial_adapter.process(
                 first_doc.file_path,
@@ -311,12 +349,20 @@ class AgentDispatcherStage(MasterPipelineStage):
             return result
 
         except Exception as e:
+            if cancel_event is not None and cancel_event.is_set():
+                # The dispatch already timed out and recorded the failure
+                logger.info("financial_agent_cancelled")
+                return None
             error_msg = f"Financial agent failed: {str(e)}"
             logger.error("financial_agent_error", error=str(e))
             context.add_error(error_msg)
             return None
 
-    def _process_education(self, context: MasterPipelineContext) -> object | None:
+    def _process_education(
+        self,
+        context: MasterPipelineContext,
+        cancel_event: threading.Event | None = None,
+    ) -> object | None:
         """Process education documents through education agent."""
         assert context.document_batch is not None
         assert self._education_adapter is not None
@@ -333,7 +379,9 @@ class AgentDispatcherStage(MasterPipelineStage):
             if context.document_batch.passport_documents: processed_count += 1
             if context.document_batch.financial_documents: processed_count += 1
             
-            sub_cb = self._create_sub_callback(context, "education", docs[0].file_name, processed_count)
+            sub_cb = self._create_sub_callback(
+                context, "education", docs[0].file_name, processed_count, cancel_event
+            )
             
             result = self._education_adapter.process(
                 file_paths=file_paths,
@@ -349,6 +397,10 @@ class AgentDispatcherStage(MasterPipelineStage):
             return result
 
         except Exception as e:
+            if cancel_event is not None and cancel_event.is_set():
+                # The dispatch already timed out and recorded the failure
+                logger.info("education_agent_cancelled")
+                return None
             error_msg = f"Education agent failed: {str(e)}"
             logger.error("education_agent_error", error=str(e))
             context.add_error(error_msg)
@@ -1,11 +1,14 @@
 """Document Classifier Stage - Classifies documents by type using hybrid strategy."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import structlog
 
 from master_orchestrator.config.constants import (
     DocumentCategory,
     ClassificationStrategy,
-    FILENAME_PATTERNS,
+    match_filename_pattern,
 )
 from master_orchestrator.models.input import DocumentInfo, DocumentBatch, ClassificationResult
 from master_orchestrator.pipeline.base import MasterPipelineContext, MasterPipelineStage
@@ -20,6 +23,7 @@ class DocumentClassifierStage(MasterPipelineStage):
 
     def __init__(self, llm_service: LLMService | None = None):
         self._llm_service = llm_service
+        self._llm_service_lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -36,28 +40,40 @@ class DocumentClassifierStage(MasterPipelineStage):
         strategy = context.settings.classification_strategy
         batch = DocumentBatch()
 
-        for doc in context.scanned_documents:
-            try:
-                result = self._classify_document(doc, strategy, context)
-                doc.category = result.category
-                doc.classification_confidence = result.confidence
-                doc.classification_method = result.method
-
-                # Add to appropriate batch
-                self._add_to_batch(doc, batch)
-
-                logger.debug(
-                    "document_classified",
-                    file=doc.file_name,
-                    category=result.category.value,
-                    confidence=result.confidence,
-                    method=result.method,
-                )
-
-            except Exception as e:
-                context.add_error(f"Failed to classify {doc.file_name}: {str(e)}")
-                doc.category = DocumentCategory.UNKNOWN
-                batch.unknown_documents.append(doc)
+        docs = context.scanned_documents
+        if strategy == ClassificationStrategy.FILENAME_ONLY:
+            max_workers = 1
+        else:
+            # LLM fallbacks are independent network round-trips; overlap them
+            max_workers = max(1, min(context.settings.classification_max_workers, len(docs)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._classify_document, doc, strategy, context) for doc in docs
+            ]
+
+            for doc, future in zip(docs, futures):
+                try:
+                    result = future.result()
+                    doc.category = result.category
+                    doc.classification_confidence = result.confidence
+                    doc.classification_method = result.method
+
+                    # Add to appropriate batch
+                    self._add_to_batch(doc, batch)
+
+                    logger.debug(
+                        "document_classified",
+                        file=doc.file_name,
+                        category=result.category.value,
+                        confidence=result.confidence,
+                        method=result.method,
+                    )
+
+                except Exception as e:
+                    context.add_error(f"Failed to classify {doc.file_name}: {str(e)}")
+                    doc.category = DocumentCategory.UNKNOWN
+                    batch.unknown_documents.append(doc)
 
         context.document_batch = batch
 
@@ -107,8 +123,9 @@ class DocumentClassifierStage(MasterPipelineStage):
 
         # Use LLM fallback if needed (unless filename-only)
         if strategy != ClassificationStrategy.FILENAME_ONLY:
-            if self._llm_service is None:
-                self._llm_service = LLMService(context.settings)
+            with self._llm_service_lock:
+                if self._llm_service is None:
+                    self._llm_service = LLMService(context.settings)
 
             llm_result = self._classify_by_llm(doc, context)
             if llm_result:
@@ -124,17 +141,15 @@ class DocumentClassifierStage(MasterPipelineStage):
 
     def _classify_by_filename(self, doc: DocumentInfo) -> ClassificationResult:
         """Classify document based on filename patterns."""
-        filename_lower = doc.file_name.lower()
-
-        for category, patterns in FILENAME_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in filename_lower:
-                    return ClassificationResult(
-                        category=category,
-                        confidence=0.9,  # High confidence for filename match
-                        method="filename",
-                        reasoning=f"Filename contains pattern: {pattern}",
-                    )
+        match = match_filename_pattern(doc.file_name)
+        if match is not None:
+            category, pattern = match
+            return ClassificationResult(
+                category=category,
+                confidence=0.9,  # High confidence for filename match
+                method="filename",
+                reasoning=f"Filename contains pattern: {pattern}",
+            )
 
         return ClassificationResult(
             category=DocumentCategory.UNKNOWN,
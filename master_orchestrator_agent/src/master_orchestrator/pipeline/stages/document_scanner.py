@@ -1,8 +1,11 @@
 """Document Scanner Stage - Scans input folder for supported documents."""
 
+import os
+from pathlib import Path
+
 import structlog
 
-from master_orchestrator.config.constants import SUPPORTED_FILE_EXTENSIONS
+from master_orchestrator.config.constants import SUPPORTED_FILE_EXTENSIONS, is_supported_file
 from master_orchestrator.models.input import DocumentInfo
 from master_orchestrator.pipeline.base import MasterPipelineContext, MasterPipelineStage
 from master_orchestrator.utils.exceptions import DocumentScanError
@@ -36,37 +39,39 @@ class DocumentScannerStage(MasterPipelineStage):
         documents: list[DocumentInfo] = []
         max_size = context.settings.max_file_size_bytes
 
-        # Scan for supported files
-        for file_path in context.input_folder.iterdir():
-            if not file_path.is_file():
-                continue
-
-            extension = file_path.suffix.lower()
-            if extension not in SUPPORTED_FILE_EXTENSIONS:
-                logger.debug("skipping_unsupported_file", file=file_path.name)
-                continue
-
-            # Check file size
-            file_size = file_path.stat().st_size
-            if file_size > max_size:
-                context.add_warning(
-                    f"File {file_path.name} exceeds size limit "
-                    f"({file_size} > {max_size} bytes), skipping"
+        # Scan for supported files; scandir entries answer is_file() from the
+        # directory listing and cache stat(), so each file costs one stat call
+        with os.scandir(context.input_folder) as entries:
+            for entry in entries:
+                # Check the name before touching the filesystem
+                if not is_supported_file(Path(entry.name)):
+                    logger.debug("skipping_unsupported_file", file=entry.name)
+                    continue
+
+                if not entry.is_file():
+                    continue
+
+                # Check file size
+                file_size = entry.stat().st_size
+                if file_size > max_size:
+                    context.add_warning(
+                        f"File {entry.name} exceeds size limit "
+                        f"({file_size} > {max_size} bytes), skipping"
+                    )
+                    continue
+
+                if file_size == 0:
+                    context.add_warning(f"File {entry.name} is empty, skipping")
+                    continue
+
+                doc_info = DocumentInfo.from_dir_entry(entry)
+                documents.append(doc_info)
+                logger.debug(
+                    "found_document",
+                    file=entry.name,
+                    size=file_size,
+                    extension=doc_info.file_extension,
                 )
-                continue
-
-            if file_size == 0:
-                context.add_warning(f"File {file_path.name} is empty, skipping")
-                continue
-
-            doc_info = DocumentInfo.from_path(file_path)
-            documents.append(doc_info)
-            logger.debug(
-                "found_document",
-                file=file_path.name,
-                size=file_size,
-                extension=extension,
-            )
 
         if not documents:
             raise DocumentScanError(
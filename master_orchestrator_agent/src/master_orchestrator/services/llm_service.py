@@ -2,6 +2,7 @@
 
 import base64
 import json
+import threading
 from pathlib import Path
 from typing import Any
 import io
@@ -17,6 +18,8 @@ from master_orchestrator.models.input import ClassificationResult
 
 logger = structlog.get_logger(__name__)
 
+_PDFIUM_LOCK = threading.Lock()
+
 CLASSIFICATION_PROMPT = """Analyze this document image and classify it into one of the following categories:
 
 1. PASSPORT - Identity documents such as passports, ID cards, or travel documents. CRITICAL: Do NOT classify academic certificates or diplomas as passports.
@@ -140,8 +143,9 @@ class LLMService:
         """
         import pypdfium2 as pdfium
 
-        # Open PDF and render first page
-        with pdfium.PdfDocument(str(file_path)) as pdf:
+        # Open PDF and render first page; pdfium is not thread-safe, so renders
+        # from concurrent classifications are serialized
+        with _PDFIUM_LOCK, pdfium.PdfDocument(str(file_path)) as pdf:
             page = pdf[0]
             # Render at 150 DPI for good quality
             bitmap = page.render(scale=150 / 72)
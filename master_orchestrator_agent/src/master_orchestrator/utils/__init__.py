@@ -9,6 +9,7 @@ from master_orchestrator.utils.exceptions import (
     OutputGenerationError,
     MissingDocumentCategoryError,
 )
+from master_orchestrator.utils.lazy import LazyModule, lazy_import
 from master_orchestrator.utils.fuzzy_match import (
     normalize_name,
     fuzzy_match_names,
@@ -26,4 +27,6 @@ __all__ = [
     "normalize_name",
     "fuzzy_match_names",
     "compare_dates",
+    "LazyModule",
+    "lazy_import",
 ]
@@ -0,0 +1,52 @@
+"""Deferred module imports for optional sub-agent SDKs."""
+
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """Proxy that imports a module on first attribute access.
+
+    Lets adapter modules name their sub-agent dependencies at the top of the
+    file while only paying for the import when an adapter actually runs.
+    Import errors surface at that first access, not at module import.
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str) -> None:
+        """Initialize the proxy.
+
+        Args:
+            name: Absolute module name to import on demand
+        """
+        self._name = name
+        self._module: ModuleType | None = None
+
+    def _load(self) -> ModuleType:
+        """Import the module once and cache it."""
+        if self._module is None:
+            # import_module holds the import lock, so concurrent first accesses
+            # from parallel dispatch still run the module body only once
+            self._module = import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Name a module without importing it yet.
+
+    Args:
+        name: Absolute module name
+
+    Returns:
+        Proxy that imports the module on first attribute access
+    """
+    return LazyModule(name)
@@ -166,3 +166,34 @@ class TestMasterOrchestratorIntegration:
                 orchestrator.process(input_folder=Path(tmpdir))
 
             assert "Missing required document categories" in str(exc_info.value)
+
+    def test_stage_progress_callback_keeps_its_stage(self, mock_settings):
+        """Test a stage's progress callback reports that stage even after the loop moves on."""
+        from master_orchestrator.pipeline.base import MasterPipelineStage
+
+        class FirstStage(MasterPipelineStage):
+            name = "First"
+
+            def process(self, context):
+                return context
+
+        class LastStage(MasterPipelineStage):
+            name = "Last"
+
+            def process(self, context):
+                # Report through the first stage's callback after it has finished
+                first._progress_callback(message="late")
+                context.final_result = MasterAnalysisResult()
+                return context
+
+        first, last = FirstStage(), LastStage()
+        updates = []
+        orchestrator = MasterOrchestrator(settings=mock_settings, progress_callback=updates.append)
+
+        with patch.object(orchestrator, "_initialize_stages"):
+            orchestrator._stages = [first, last]
+            orchestrator.process(input_folder="/unused")
+
+        late = next(u for u in updates if u.message == "late")
+        assert late.stage_name == "First"
+        assert late.stage_index == 0
@@ -0,0 +1,137 @@
+"""Unit tests for sub-agent adapters."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from master_orchestrator.adapters import education_adapter, financial_adapter
+from master_orchestrator.adapters.financial_adapter import FinancialAgentAdapter
+from master_orchestrator.utils.exceptions import AgentDispatchError
+
+
+class TestFinancialAgentAdapter:
+    """Tests for FinancialAgentAdapter orchestrator sharing."""
+
+    @pytest.fixture(autouse=True)
+    def fake_financial_agent(self):
+        """Replace the financial agent SDK and reset the shared orchestrators."""
+        financial_adapter._orchestrators.clear()
+        pipeline = MagicMock()
+        pipeline.PipelineOrchestrator.side_effect = lambda **kwargs: MagicMock(**kwargs)
+        with patch.object(financial_adapter, "_financial_pipeline", pipeline), \
+             patch.object(financial_adapter, "_financial_settings", MagicMock()), \
+             patch.dict(os.environ):
+            yield pipeline
+        financial_adapter._orchestrators.clear()
+
+    def test_adapters_share_orchestrator_per_config(self, mock_settings, fake_financial_agent):
+        """Test that a new adapter reuses the orchestrator built for the same config."""
+        first = FinancialAgentAdapter(mock_settings)
+        second = FinancialAgentAdapter(mock_settings)
+
+        first._ensure_initialized()
+        second._ensure_initialized()
+
+        assert first._orchestrator is second._orchestrator
+        assert fake_financial_agent.PipelineOrchestrator.call_count == 1
+
+    def test_different_threshold_builds_new_orchestrator(self, mock_settings, fake_financial_agent):
+        """Test that a different threshold gets its own orchestrator."""
+        first = FinancialAgentAdapter(mock_settings)
+        second = FinancialAgentAdapter(mock_settings)
+
+        first._ensure_initialized()
+        second._ensure_initialized(threshold_eur=5000.0)
+
+        assert first._orchestrator is not second._orchestrator
+        assert fake_financial_agent.PipelineOrchestrator.call_count == 2
+
+    def test_missing_api_key_fails_fast(self, mock_settings, fake_financial_agent):
+        """Test that a missing key raises before any orchestrator is built."""
+        mock_settings.get_financial_api_key.return_value = None
+        adapter = FinancialAgentAdapter(mock_settings)
+
+        with pytest.raises(AgentDispatchError, match="Missing financial agent API key"):
+            adapter._ensure_initialized()
+
+        fake_financial_agent.PipelineOrchestrator.assert_not_called()
+
+    def test_environment_change_builds_new_orchestrator(self, mock_settings, fake_financial_agent):
+        """Test that sub-agent settings are re-read instead of pinned by the first build."""
+        settings_module = financial_adapter._financial_settings
+        settings_module.Settings.return_value.model_dump_json.side_effect = ["env-a", "env-b"]
+
+        first = FinancialAgentAdapter(mock_settings)
+        second = FinancialAgentAdapter(mock_settings)
+        first._ensure_initialized()
+        second._ensure_initialized()
+
+        assert first._orchestrator is not second._orchestrator
+
+    def test_evicted_orchestrator_is_closed(self, mock_settings, fake_financial_agent):
+        """Test that orchestrators are closed on eviction, not after each run."""
+        first = FinancialAgentAdapter(mock_settings)
+        first._ensure_initialized()
+        first._orchestrator.close.assert_not_called()
+
+        for threshold in range(1, financial_adapter._orchestrators.maxsize + 1):
+            FinancialAgentAdapter(mock_settings)._ensure_initialized(threshold_eur=float(threshold))
+
+        first._orchestrator.close.assert_called_once()
+
+
+    def test_concurrent_lookups_build_once(self, mock_settings, fake_financial_agent):
+        """Test that adapters initializing at the same time share one build."""
+        adapters = [FinancialAgentAdapter(mock_settings) for _ in range(8)]
+
+        with ThreadPoolExecutor(max_workers=len(adapters)) as executor:
+            list(executor.map(lambda adapter: adapter._ensure_initialized(), adapters))
+
+        assert len({id(adapter._orchestrator) for adapter in adapters}) == 1
+        assert fake_financial_agent.PipelineOrchestrator.call_count == 1
+        assert os.environ["FA_ANTHROPIC_API_KEY"] == mock_settings.get_financial_api_key()
+
+class TestDefaultGradeTablePath:
+    """Tests for locating the default education grade table."""
+
+    @pytest.fixture(autouse=True)
+    def reset_default(self):
+        """Forget any grade table resolved by an earlier test."""
+        with patch.object(education_adapter, "_default_grade_table", None):
+            yield
+
+    def test_missing_table_is_not_remembered(self, tmp_path):
+        """Test that a miss is retried and a later hit is remembered."""
+        table = tmp_path / education_adapter._DEFAULT_GRADE_TABLE
+        with patch.object(education_adapter, "_LAUNCH_DIR", tmp_path), \
+             patch.object(education_adapter, "_PROJECT_ROOT", tmp_path), \
+             patch.object(education_adapter, "_DOCKER_ROOT", tmp_path / "app"):
+            assert education_adapter._default_grade_table_path() is None
+
+            table.parent.mkdir(parents=True)
+            table.write_text("{}")
+            assert education_adapter._default_grade_table_path() == str(table)
+
+            table.unlink()
+            assert education_adapter._default_grade_table_path() == str(table)
+
+    def test_shallow_install_skips_project_root(self, tmp_path):
+        """Test that a missing project root is skipped rather than probed."""
+        table = tmp_path / education_adapter._DEFAULT_GRADE_TABLE
+        table.parent.mkdir(parents=True)
+        table.write_text("{}")
+        with patch.object(education_adapter, "_LAUNCH_DIR", tmp_path / "launch"), \
+             patch.object(education_adapter, "_DOCKER_ROOT", tmp_path), \
+             patch.object(education_adapter, "_PROJECT_ROOT", None):
+            assert education_adapter._default_grade_table_path() == str(table)
+
+    def test_candidates_do_not_depend_on_current_directory(self, tmp_path, monkeypatch):
+        """Test that changing directory after import does not change the lookup."""
+        expected = education_adapter._default_grade_table_path()
+        education_adapter._default_grade_table = None
+
+        monkeypatch.chdir(tmp_path)
+
+        assert education_adapter._default_grade_table_path() == expected
@@ -0,0 +1,27 @@
+"""Unit tests for lazy module imports."""
+
+import sys
+
+import pytest
+
+from master_orchestrator.utils.lazy import lazy_import
+
+
+class TestLazyImport:
+    """Tests for lazy_import."""
+
+    def test_import_deferred_until_attribute_access(self):
+        """Test that the module is only imported when an attribute is read."""
+        sys.modules.pop("colorsys", None)
+        module = lazy_import("colorsys")
+
+        assert "colorsys" not in sys.modules
+        assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+        assert "colorsys" in sys.modules
+
+    def test_missing_module_raises_on_access(self):
+        """Test that a missing module fails at first use, not at declaration."""
+        module = lazy_import("no_such_sub_agent_sdk")
+
+        with pytest.raises(ImportError):
+            module.Settings
@@ -1,5 +1,7 @@
 """Unit tests for data models."""
 
+import os
+
 import pytest
 from pathlib import Path
 
@@ -48,6 +50,17 @@ class TestDocumentInfo:
         )
         assert doc.is_classified
 
+    def test_from_dir_entry(self, tmp_path):
+        """Test from_dir_entry reads name, extension and size from the entry."""
+        (tmp_path / "Passport.PDF").write_bytes(b"x" * 42)
+        with os.scandir(tmp_path) as entries:
+            doc = DocumentInfo.from_dir_entry(next(entries))
+
+        assert doc.file_path == tmp_path / "Passport.PDF"
+        assert doc.file_name == "Passport.PDF"
+        assert doc.file_extension == ".pdf"
+        assert doc.file_size_bytes == 42
+
 
 class TestDocumentBatch:
     """Tests for DocumentBatch model."""
@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
+import threading
 import os
 
 from master_orchestrator.config.settings import Settings
@@ -11,7 +12,7 @@ from master_orchestrator.config.constants import (
     DocumentCategory,
     ClassificationStrategy,
 )
-from master_orchestrator.models.input import DocumentInfo, DocumentBatch
+from master_orchestrator.models.input import ClassificationResult, DocumentInfo, DocumentBatch
 from master_orchestrator.models.unified_result import (
     PassportDetails,
     EducationSummary,
@@ -38,6 +39,23 @@ def mock_settings():
     return settings
 
 
+class TestMasterPipelineContext:
+    """Tests for MasterPipelineContext."""
+
+    def test_get_metadata_does_not_alias_messages(self, mock_settings):
+        """Test metadata keeps its own error/warning lists."""
+        context = MasterPipelineContext(input_folder=Path("/in"), settings=mock_settings)
+        context.add_error("boom")
+        context.add_warning("careful")
+
+        metadata = context.get_metadata()
+        context.add_error("later")
+
+        assert metadata.processing_errors == ["boom"]
+        assert metadata.processing_warnings == ["careful"]
+        assert metadata.processing_errors is not context.errors
+
+
 class TestDocumentScannerStage:
     """Tests for DocumentScannerStage."""
 
@@ -129,6 +147,58 @@ class TestDocumentClassifierStage:
         assert len(result.document_batch.financial_documents) == 1
         assert len(result.document_batch.education_documents) == 1
 
+    def test_filename_pattern_priority(self):
+        """Test that category order decides between overlapping patterns."""
+        stage = DocumentClassifierStage()
+        doc = DocumentInfo(
+            file_path=Path("/test/Master_Bank_Statement.pdf"),
+            file_name="Master_Bank_Statement.pdf",
+            file_extension=".pdf",
+            file_size_bytes=1000,
+        )
+
+        result = stage._classify_by_filename(doc)
+
+        assert result.category == DocumentCategory.FINANCIAL
+        assert result.reasoning == "Filename contains pattern: bank"
+
+    def test_llm_fallback_runs_concurrently(self, mock_settings):
+        """Test documents without a filename match are classified by the LLM concurrently."""
+        mock_settings.classification_strategy = ClassificationStrategy.HYBRID
+        mock_settings.classification_max_workers = 2
+        both_started = threading.Barrier(2, timeout=5)
+        categories = {
+            "scan_001.pdf": DocumentCategory.FINANCIAL,
+            "scan_002.pdf": DocumentCategory.EDUCATION,
+        }
+
+        def classify_document(file_path):
+            # Both calls must be in flight at once to pass the barrier
+            both_started.wait()
+            return ClassificationResult(
+                category=categories[file_path.name], confidence=0.8, method="llm"
+            )
+
+        llm_service = Mock()
+        llm_service.classify_document.side_effect = classify_document
+        context = MasterPipelineContext(input_folder=Path("/test"), settings=mock_settings)
+        context.scanned_documents = [
+            DocumentInfo(
+                file_path=Path(f"/test/{name}"),
+                file_name=name,
+                file_extension=".pdf",
+                file_size_bytes=1000,
+            )
+            for name in ("passport.pdf", *categories)
+        ]
+
+        result = DocumentClassifierStage(llm_service=llm_service).process(context)
+
+        assert llm_service.classify_document.call_count == 2
+        assert [d.file_name for d in result.document_batch.passport_documents] == ["passport.pdf"]
+        assert [d.file_name for d in result.document_batch.financial_documents] == ["scan_001.pdf"]
+        assert [d.file_name for d in result.document_batch.education_documents] == ["scan_002.pdf"]
+
     def test_classify_missing_category_raises_error(self, mock_settings):
         """Test that missing categories raise error."""
         context = MasterPipelineContext(